@@ -0,0 +1,3 @@
+"""
+Benchmarks for rmakers; run with ``make benchmark``.
+"""
@@ -0,0 +1,58 @@
+"""
+Bulk-construction benchmarks.
+"""
+
+import contextlib
+
+import rmakers
+
+from . import common
+
+
+def _context(bulk):
+    if bulk is True:
+        return rmakers.bulk()
+    return contextlib.nullcontext()
+
+
+class BulkRewriteMeter:
+    """
+    Times ``rmakers.rewrite_meter()`` on talea voices of about 10,000 and
+    100,000 leaves, with and without ``rmakers.bulk()``.
+    """
+
+    params = ([10_000, 100_000], [False, True])
+    param_names = ["leaves", "bulk"]
+    number = 1
+    repeat = (1, 3, 60.0)
+    timeout = 3600
+    warmup_time = 0
+
+    def setup(self, leaves, bulk):
+        # talea voices average 3.5 leaves per measure
+        self.voice = common.make_voice(leaves * 2 // 7)
+
+    def time_rewrite_meter(self, leaves, bulk):
+        with _context(bulk):
+            rmakers.rewrite_meter(self.voice)
+
+
+class BulkTalea:
+    """
+    Times ``rmakers.talea()`` on about 10,000 and 100,000 leaves, with and
+    without ``rmakers.bulk()``.
+    """
+
+    params = ([10_000, 100_000], [False, True])
+    param_names = ["leaves", "bulk"]
+    number = 1
+    repeat = (1, 3, 60.0)
+    timeout = 3600
+    warmup_time = 0
+
+    def setup(self, leaves, bulk):
+        self.durations = common.make_durations(leaves * 2 // 7)
+
+    def time_talea(self, leaves, bulk):
+        with _context(bulk):
+            rmakers.talea(self.durations, [1, 2, 3, 4], 16, extra_counts=[0, 1])
@@ -0,0 +1,77 @@
+"""
+Command benchmarks.
+"""
+
+import abjad
+
+import rmakers
+
+from . import common
+
+
+class Commands:
+    """
+    Times heavy commands on talea voices of 10 to 10,000 measures.
+
+    Commands change the voice they time; setup makes a fresh voice for each
+    sample.
+    """
+
+    params = common.SCALES
+    param_names = ["durations"]
+    number = 1
+    repeat = (1, 3, 60.0)
+    timeout = 3600
+    warmup_time = 0
+
+    def setup(self, count):
+        self.voice = common.make_voice(count)
+
+    def time_beam(self, count):
+        rmakers.beam(abjad.select.tuplets(self.voice))
+
+    def time_duration_bracket(self, count):
+        rmakers.duration_bracket(self.voice)
+
+    def time_extract_trivial(self, count):
+        rmakers.extract_trivial(self.voice)
+
+    def time_force_rest(self, count):
+        leaves = abjad.select.leaves(self.voice)
+        rmakers.force_rest(leaves[::4])
+
+    def time_rewrite_meter(self, count):
+        rmakers.rewrite_meter(self.voice)
+
+
+class AttachTimeSignatures:
+    """
+    Times ``rmakers.attach_time_signatures()`` on staves of 10 to 10,000
+    measures, first on bare leaves and then again on the same leaves.
+    """
+
+    params = common.SCALES
+    param_names = ["durations"]
+    number = 1
+    repeat = (1, 3, 60.0)
+    timeout = 600
+    warmup_time = 0
+
+    def setup(self, count):
+        self.time_signatures = common.make_time_signatures(count)
+        self.voice = self.make_voice()
+        self.attached_voice = self.make_voice()
+        rmakers.attach_time_signatures(self.attached_voice, self.time_signatures)
+
+    def make_voice(self):
+        durations = [abjad.Duration(_) for _ in self.time_signatures]
+        tuplets = rmakers.talea(durations, [1, 2, 3, 4], 16, extra_counts=[0, 1])
+        voice = abjad.Voice(tuplets)
+        abjad.Staff([voice])
+        return voice
+
+    def time_attach_time_signatures(self, count):
+        rmakers.attach_time_signatures(self.voice, self.time_signatures)
+
+    def time_attach_time_signatures_again(self, count):
+        rmakers.attach_time_signatures(self.attached_voice, self.time_signatures)
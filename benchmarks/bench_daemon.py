@@ -0,0 +1,58 @@
+"""
+Daemon benchmarks.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+
+import rmakers.daemon
+
+RECIPE = {
+    "maker": "talea",
+    "time_signatures": [[3, 8], [4, 8], [5, 16], [2, 4]] * 4,
+    "arguments": [[1, 2, 3, 4], 16],
+    "keywords": {"extra_counts": [0, 1]},
+    "commands": [
+        {"command": "beam"},
+        {"command": "extract_trivial"},
+        {"command": "rewrite_meter"},
+    ],
+}
+
+
+class Daemon:
+    """
+    Times one 16-measure recipe sent to a warm daemon against the same recipe
+    run in a new Python process.
+    """
+
+    number = 1
+    repeat = (3, 10, 60.0)
+    timeout = 600
+
+    def setup(self):
+        self.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(self.directory.name, "rmakers.sock")
+        self.server = rmakers.daemon.Server(path)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.client = rmakers.daemon.Client(path)
+
+    def teardown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.directory.cleanup()
+
+    def time_cold_start(self):
+        string = "import json, sys, rmakers.recipes;"
+        string += " rmakers.recipes.run(json.loads(sys.argv[1]))"
+        subprocess.run([sys.executable, "-c", string, json.dumps(RECIPE)], check=True)
+
+    def time_daemon(self):
+        self.client.run(RECIPE)
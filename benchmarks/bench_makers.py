@@ -0,0 +1,49 @@
+"""
+Maker benchmarks.
+"""
+
+import rmakers
+
+from . import common
+
+
+class Makers:
+    """
+    Times each maker on 10 to 10,000 durations.
+    """
+
+    params = common.SCALES
+    param_names = ["durations"]
+    timeout = 600
+
+    def setup(self, count):
+        self.durations = common.make_durations(count)
+
+    def time_accelerando(self, count):
+        rmakers.accelerando(self.durations, [(1, 8), (1, 20), (1, 16)])
+
+    def time_even_division(self, count):
+        rmakers.even_division(self.durations, [8, 16], extra_counts=[0, 1])
+
+    def time_incised(self, count):
+        rmakers.incised(
+            self.durations,
+            extra_counts=[0, 1],
+            prefix_counts=[1],
+            prefix_talea=[-1],
+            suffix_counts=[1],
+            suffix_talea=[-1],
+            talea_denominator=16,
+        )
+
+    def time_multiplied_duration(self, count):
+        rmakers.multiplied_duration(self.durations)
+
+    def time_note(self, count):
+        rmakers.note(self.durations)
+
+    def time_talea(self, count):
+        rmakers.talea(self.durations, [1, 2, 3, 4], 16, extra_counts=[0, 1])
+
+    def time_tuplet(self, count):
+        rmakers.tuplet(self.durations, [(1, 2), (3, 1), (1, 1, 1)])
@@ -0,0 +1,38 @@
+"""
+Inputs shared by benchmarks.
+"""
+
+import abjad
+
+import rmakers
+
+PAIRS = [(3, 8), (4, 8), (5, 16), (2, 4)]
+
+SCALES = [10, 100, 1_000, 10_000]
+
+
+def make_durations(count: int) -> list[abjad.Duration]:
+    """
+    Makes ``count`` durations.
+    """
+    time_signatures = make_time_signatures(count)
+    return [abjad.Duration(_) for _ in time_signatures]
+
+
+def make_time_signatures(count: int) -> list[abjad.TimeSignature]:
+    """
+    Makes ``count`` time signatures.
+    """
+    pairs = [PAIRS[i % len(PAIRS)] for i in range(count)]
+    return rmakers.time_signatures(pairs)
+
+
+def make_voice(count: int) -> abjad.Voice:
+    """
+    Makes talea voice of ``count`` measures in time signature staff.
+    """
+    time_signatures = make_time_signatures(count)
+    durations = [abjad.Duration(_) for _ in time_signatures]
+    tuplets = rmakers.talea(durations, [1, 2, 3, 4], 16, extra_counts=[0, 1])
+    voice = rmakers.wrap_in_time_signature_staff(tuplets, time_signatures)
+    return voice
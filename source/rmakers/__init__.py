@@ -3,7 +3,15 @@ Rhythm-makers.
 """
 
 from ._version import __version__, __version_info__
-from .classes import Incise, Interpolation, Spelling, Talea
+from .classes import (
+    Cancellation,
+    Cancelled,
+    Incise,
+    Interpolation,
+    Spelling,
+    State,
+    Talea,
+)
 from .functions import (
     after_grace_container,
     attach_time_signatures,
@@ -16,6 +24,7 @@ from .functions import (
     extract_rest_filled,
     extract_trivial,
     feather_beam,
+    fingerprint,
     force_augmentation,
     force_diminution,
     force_fraction,
@@ -40,43 +49,62 @@ from .functions import (
     swap_trivial,
     tie,
     time_signatures,
+    to_lilypond,
     tremolo_container,
     trivialize,
     unbeam,
     untie,
     wrap_in_time_signature_staff,
+    write_lilypond,
     written_duration,
 )
+from .instrumentation import Report, Trace, bulk, instrument, trace
 from .makers import (
     accelerando,
+    accelerando_state_at,
     even_division,
+    even_division_state_at,
     incised,
     multiplied_duration,
     note,
     talea,
+    talea_batch,
+    talea_state_at,
     tuplet,
 )
+from .recipes import Command, Recipe
 
 __all__ = [
     "__version__",
     "__version_info__",
+    "Cancellation",
+    "Cancelled",
+    "Command",
     "Incise",
     "Interpolation",
+    "Recipe",
+    "Report",
     "Spelling",
+    "State",
     "Talea",
+    "Trace",
     "accelerando",
+    "accelerando_state_at",
     "after_grace_container",
     "attach_time_signatures",
     "beam",
     "beam_groups",
     "before_grace_container",
+    "bulk",
     "denominator",
     "duration_bracket",
     "even_division",
+    "even_division_state_at",
     "example",
     "extract_rest_filled",
     "extract_trivial",
     "feather_beam",
+    "fingerprint",
     "force_augmentation",
     "force_diminution",
     "force_fraction",
@@ -86,6 +114,7 @@ __all__ = [
     "hide_skip_filled",
     "hide_trivial",
     "incised",
+    "instrument",
     "interpolate",
     "invisible_music",
     "multiplied_duration",
@@ -103,13 +132,18 @@ __all__ = [
     "swap_skip_filled",
     "swap_trivial",
     "talea",
+    "talea_batch",
+    "talea_state_at",
     "tie",
     "time_signatures",
+    "to_lilypond",
+    "trace",
     "tremolo_container",
     "trivialize",
     "tuplet",
     "unbeam",
     "untie",
     "wrap_in_time_signature_staff",
+    "write_lilypond",
     "written_duration",
 ]
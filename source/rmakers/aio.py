@@ -0,0 +1,265 @@
+"""
+The rmakers asyncio interface.
+
+Runs makers and recipes without blocking the event loop:
+
+..  container:: example
+
+    >>> import asyncio
+    >>> import rmakers.aio
+
+    >>> async def main():
+    ...     async with rmakers.aio.Runner(workers=1) as runner:
+    ...         recipe = {
+    ...             "maker": "even_division",
+    ...             "time_signatures": [[2, 8]],
+    ...             "arguments": [[8]],
+    ...         }
+    ...         result = await runner.run(recipe)
+    ...         durations = [abjad.Duration(2, 8)]
+    ...         tuplets = await rmakers.aio.note(durations, runner=runner)
+    ...     return result, tuplets
+    ...
+
+    >>> result, tuplets = asyncio.run(main())
+    >>> result["data"]
+    [{'type': 'Tuplet', 'multiplier': [1, 1], 'components': [{'type': 'Note', 'duration': [1, 8]}, {'type': 'Note', 'duration': [1, 8]}]}]
+
+    >>> tuplets
+    [Note("c'4")]
+
+Cancelling a call to a process runner terminates the worker process that
+runs it, so superseded work stops using CPU at once; the runner starts a new
+worker for the next call. Cancelling a call to a thread runner, or to no
+runner, stops work that has not yet started.
+
+Exceptions raised in worker processes are raised again in the caller with
+their type and arguments; exceptions that cannot be pickled are raised as
+``Exception`` with the same message.
+"""
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import pickle
+import typing
+
+from . import makers as _makers
+from . import recipes as _recipes
+
+
+def _make(name, arguments, keywords):
+    function = _recipes._get_function(name, _recipes._maker_names, "maker")
+    state = keywords.get("state")
+    components = function(*arguments, **keywords)
+    return components, state
+
+
+def _run(recipe, output, previous_state):
+    if isinstance(recipe, dict):
+        recipe = _recipes.Recipe.from_dict(recipe)
+    voice, state = recipe.make_voice(previous_state=previous_state)
+    return _recipes._get_result(voice, state, output)
+
+
+def _work(connection):
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        function, arguments = message
+        try:
+            message = ("ok", function(*arguments))
+        except Exception as exception:
+            message = ("error", exception)
+            try:
+                pickle.loads(pickle.dumps(exception))
+            except Exception:
+                string = f"{type(exception).__name__}: {exception}"
+                message = ("error", Exception(string))
+        connection.send(message)
+
+
+class Runner:
+    """
+    Runs makers and recipes in worker processes, or in threads when
+    ``threads=True``.
+
+    Runs at most ``workers`` calls at once; defaults to one worker per CPU.
+    Keeps worker processes warm between calls.
+    """
+
+    def __init__(self, *, threads: bool = False, workers: int | None = None) -> None:
+        assert isinstance(threads, bool), repr(threads)
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        assert isinstance(workers, int) and 0 < workers, repr(workers)
+        self.threads = threads
+        self.workers = workers
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        if threads is True:
+            self._executor = concurrent.futures.ThreadPoolExecutor(workers)
+        self._idle: list[tuple[typing.Any, typing.Any]] = []
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def __aenter__(self) -> "Runner":
+        return self
+
+    async def __aexit__(self, *exception) -> None:
+        self.close()
+
+    def __enter__(self) -> "Runner":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+    async def _call(self, function, *arguments):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.workers)
+        async with self._semaphore:
+            if self._executor is not None:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, function, *arguments)
+            if self._idle:
+                process, connection = self._idle.pop()
+            else:
+                connection, connection_ = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_work, args=(connection_,), daemon=True
+                )
+                process.start()
+                connection_.close()
+            try:
+                connection.send((function, arguments))
+                status, message = await asyncio.to_thread(connection.recv)
+            except BaseException:
+                process.terminate()
+                process.join()
+                connection.close()
+                raise
+            self._idle.append((process, connection))
+        if status == "error":
+            raise message
+        return message
+
+    def close(self) -> None:
+        """
+        Stops worker processes and threads.
+        """
+        for process, connection in self._idle:
+            connection.send(None)
+            connection.close()
+            process.join()
+        self._idle.clear()
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    async def make(self, name: str, *arguments, **keywords) -> list:
+        """
+        Calls maker ``name`` with ``arguments`` and ``keywords``.
+
+        Updates ``state`` dictionary, when given, as the maker does.
+        """
+        state = keywords.get("state")
+        components, state_ = await self._call(_make, name, arguments, keywords)
+        if state is not None and state is not state_:
+            state.clear()
+            state.update(state_)
+        return components
+
+    async def run(
+        self,
+        recipe: _recipes.Recipe | dict,
+        *,
+        output: str = "data",
+        previous_state: dict | None = None,
+    ) -> dict:
+        """
+        Runs ``recipe``; returns JSON-compatible result with ``state`` and
+        rhythm ``data``, or ``lilypond`` text when ``output="lilypond"``.
+        """
+        assert isinstance(recipe, _recipes.Recipe | dict), repr(recipe)
+        if output not in _recipes._outputs:
+            raise Exception(f"unknown output: {output!r}.")
+        return await self._call(_run, recipe, output, previous_state)
+
+
+async def _make_here(name, arguments, keywords, runner):
+    if runner is not None:
+        return await runner.make(name, *arguments, **keywords)
+    function = getattr(_makers, name)
+    return await asyncio.to_thread(function, *arguments, **keywords)
+
+
+async def accelerando(*arguments, runner: Runner | None = None, **keywords) -> list:
+    """
+    Awaits ``rmakers.accelerando()`` in ``runner``, or in a thread.
+    """
+    return await _make_here("accelerando", arguments, keywords, runner)
+
+
+async def even_division(*arguments, runner: Runner | None = None, **keywords) -> list:
+    """
+    Awaits ``rmakers.even_division()`` in ``runner``, or in a thread.
+    """
+    return await _make_here("even_division", arguments, keywords, runner)
+
+
+async def incised(*arguments, runner: Runner | None = None, **keywords) -> list:
+    """
+    Awaits ``rmakers.incised()`` in ``runner``, or in a thread.
+    """
+    return await _make_here("incised", arguments, keywords, runner)
+
+
+async def multiplied_duration(
+    *arguments, runner: Runner | None = None, **keywords
+) -> list:
+    """
+    Awaits ``rmakers.multiplied_duration()`` in ``runner``, or in a thread.
+    """
+    return await _make_here("multiplied_duration", arguments, keywords, runner)
+
+
+async def note(*arguments, runner: Runner | None = None, **keywords) -> list:
+    """
+    Awaits ``rmakers.note()`` in ``runner``, or in a thread.
+    """
+    return await _make_here("note", arguments, keywords, runner)
+
+
+async def run(
+    recipe: _recipes.Recipe | dict,
+    *,
+    output: str = "data",
+    previous_state: dict | None = None,
+    runner: Runner | None = None,
+) -> dict:
+    """
+    Awaits result of ``recipe`` in ``runner``, or in a thread.
+
+    See ``Runner.run()``.
+    """
+    if runner is not None:
+        return await runner.run(recipe, output=output, previous_state=previous_state)
+    if output not in _recipes._outputs:
+        raise Exception(f"unknown output: {output!r}.")
+    return await asyncio.to_thread(_run, recipe, output, previous_state)
+
+
+async def talea(*arguments, runner: Runner | None = None, **keywords) -> list:
+    """
+    Awaits ``rmakers.talea()`` in ``runner``, or in a thread.
+    """
+    return await _make_here("talea", arguments, keywords, runner)
+
+
+async def tuplet(*arguments, runner: Runner | None = None, **keywords) -> list:
+    """
+    Awaits ``rmakers.tuplet()`` in ``runner``, or in a thread.
+    """
+    return await _make_here("tuplet", arguments, keywords, runner)
@@ -0,0 +1,246 @@
+r"""
+The rmakers batch renderer.
+
+Renders a directory of recipe files in parallel. Each ``NAME.json`` file holds
+one recipe in the format of ``rmakers.recipes``; a recipe's
+``previous_state`` is either a state dictionary or the name of another recipe
+in the directory, whose resulting state the recipe then continues:
+
+..  container:: example
+
+    >>> import json, os, tempfile
+    >>> import rmakers.batch
+    >>> directory = tempfile.mkdtemp()
+    >>> recipe = {
+    ...     "maker": "talea",
+    ...     "time_signatures": [[3, 8], [4, 8]],
+    ...     "arguments": [[1, 2, 3], 16],
+    ...     "commands": [{"command": "beam"}],
+    ... }
+    >>> with open(os.path.join(directory, "a.json"), "w") as file:
+    ...     json.dump(recipe, file)
+    ...
+    >>> recipe["previous_state"] = "a"
+    >>> with open(os.path.join(directory, "b.json"), "w") as file:
+    ...     json.dump(recipe, file)
+    ...
+
+    >>> version = r'\version "2.25.0"'
+    >>> states = rmakers.batch.run(directory, lilypond_version_token=version)
+    >>> states["b"]
+    {'durations_consumed': 4, 'incomplete_last_note': True, 'logical_ties_produced': 15, 'talea_weight_consumed': 28}
+
+    >>> sorted(_ for _ in os.listdir(directory) if not _.endswith(".json"))
+    ['a.ly', 'b.ly']
+
+Writes ``NAME.ly`` and ``NAME.state.json`` for each recipe. Runs recipes as
+soon as the recipes they continue are done, in a pool of worker processes.
+Skips recipes whose recipe, previous state and rmakers version match those
+of the files already written.
+
+Run from the shell with ``rmakers-batch DIRECTORY [--output DIRECTORY]
+[--workers N] [--force] [--lilypond-version VERSION]``.
+"""
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+
+import abjad
+
+from . import _version
+from . import functions as _functions
+from . import recipes as _recipes
+
+_cache_name = ".rmakers-batch.json"
+
+
+def _get_key(recipe, previous_state, lilypond_version_token):
+    dictionary = {
+        "lilypond_version_token": lilypond_version_token,
+        "previous_state": previous_state,
+        "recipe": recipe,
+        "version": _version.__version__,
+    }
+    string = json.dumps(dictionary, sort_keys=True)
+    return hashlib.sha256(string.encode()).hexdigest()
+
+
+def _get_previous_names(recipes):
+    names_to_previous_names = {}
+    for name, recipe in recipes.items():
+        previous_state = recipe.get("previous_state")
+        if isinstance(previous_state, str):
+            if previous_state not in recipes:
+                raise Exception(f"{name}: unknown previous state {previous_state!r}.")
+            names_to_previous_names[name] = previous_state
+    return names_to_previous_names
+
+
+def _read_recipes(directory):
+    recipes = {}
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".json") or file_name.endswith(".state.json"):
+            continue
+        if file_name == _cache_name:
+            continue
+        with open(os.path.join(directory, file_name)) as file:
+            recipe = json.load(file)
+        if not isinstance(recipe, dict):
+            raise Exception(f"{file_name}: recipe must be object.")
+        recipes[file_name.removesuffix(".json")] = recipe
+    return recipes
+
+
+def _render(recipe, previous_state, path, lilypond_version_token):
+    recipe = dict(recipe)
+    recipe.pop("previous_state", None)
+    if previous_state is not None:
+        keywords = dict(recipe.get("keywords", {}))
+        keywords["previous_state"] = previous_state
+        recipe["keywords"] = keywords
+    voice, state = _recipes.make_voice(recipe)
+    score = abjad.get.parentage(voice).root
+    lilypond_file = abjad.LilyPondFile([score])
+    lilypond_file.lilypond_version_token = lilypond_version_token
+    with open(path, "w") as file:
+        _functions.write_lilypond(lilypond_file, file)
+    return dict(state)
+
+
+def run(
+    directory: str,
+    output_directory: str | None = None,
+    *,
+    force: bool = False,
+    lilypond_version_token: bool | str = True,
+    workers: int | None = None,
+) -> dict[str, dict]:
+    """
+    Renders recipes in ``directory``; returns resulting state of each recipe.
+
+    Writes to ``directory`` unless ``output_directory`` is set. Renders every
+    recipe when ``force=True``. Gets version token from installed LilyPond
+    when ``lilypond_version_token=True``. Runs one worker process per CPU
+    unless ``workers`` is set; runs in this process when ``workers=1``.
+    """
+    assert isinstance(directory, str), repr(directory)
+    output_directory = output_directory or directory
+    assert isinstance(output_directory, str), repr(output_directory)
+    assert isinstance(force, bool), repr(force)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    assert isinstance(workers, int) and 0 < workers, repr(workers)
+    recipes = _read_recipes(directory)
+    names_to_previous_names = _get_previous_names(recipes)
+    os.makedirs(output_directory, exist_ok=True)
+    cache_path = os.path.join(output_directory, _cache_name)
+    cache = {}
+    if not force and os.path.exists(cache_path):
+        with open(cache_path) as file:
+            cache = json.load(file)
+    states: dict[str, dict] = {}
+    waiting = dict(recipes)
+
+    def get_previous_state(name):
+        previous_state = recipes[name].get("previous_state")
+        if name in names_to_previous_names:
+            previous_state = states[names_to_previous_names[name]]
+        return previous_state
+
+    def is_ready(name):
+        previous_name = names_to_previous_names.get(name)
+        return previous_name is None or previous_name in states
+
+    def finish(name, key, state):
+        states[name] = state
+        cache[name] = key
+        path = os.path.join(output_directory, f"{name}.state.json")
+        with open(path, "w") as file:
+            json.dump(state, file, indent=4, sort_keys=True)
+            file.write("\n")
+
+    executor: concurrent.futures.Executor | None = None
+    if 1 < workers:
+        executor = concurrent.futures.ProcessPoolExecutor(workers)
+    futures: dict[concurrent.futures.Future, tuple[str, str]] = {}
+    try:
+        while waiting or futures:
+            for name in [_ for _ in waiting if is_ready(_)]:
+                recipe = waiting.pop(name)
+                previous_state = get_previous_state(name)
+                key = _get_key(recipe, previous_state, lilypond_version_token)
+                ly_path = os.path.join(output_directory, f"{name}.ly")
+                state_path = os.path.join(output_directory, f"{name}.state.json")
+                if (
+                    cache.get(name) == key
+                    and os.path.exists(ly_path)
+                    and os.path.exists(state_path)
+                ):
+                    with open(state_path) as file:
+                        states[name] = json.load(file)
+                    continue
+                arguments = (recipe, previous_state, ly_path, lilypond_version_token)
+                if executor is None:
+                    try:
+                        state = _render(*arguments)
+                    except Exception as exception:
+                        raise Exception(f"{name}: {exception}") from exception
+                    finish(name, key, state)
+                    continue
+                future = executor.submit(_render, *arguments)
+                futures[future] = (name, key)
+            if not futures:
+                if waiting and not any(is_ready(_) for _ in waiting):
+                    names = ", ".join(sorted(waiting))
+                    raise Exception(f"previous states form cycle: {names}.")
+                continue
+            done, _ = concurrent.futures.wait(
+                futures, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                name, key = futures.pop(future)
+                try:
+                    state = future.result()
+                except Exception as exception:
+                    raise Exception(f"{name}: {exception}") from exception
+                finish(name, key, state)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        with open(cache_path, "w") as file:
+            json.dump(cache, file, indent=4, sort_keys=True)
+            file.write("\n")
+    return {_: states[_] for _ in recipes}
+
+
+def main(arguments: list[str] | None = None) -> None:
+    """
+    Renders recipe directory given on command line.
+    """
+    parser = argparse.ArgumentParser(
+        prog="rmakers-batch",
+        description="Renders a directory of rmakers recipes in parallel.",
+    )
+    parser.add_argument("directory", help="directory of recipe files")
+    parser.add_argument("--output", help="output directory")
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    parser.add_argument("--force", action="store_true", help="ignore cache")
+    parser.add_argument("--lilypond-version", help="LilyPond version, like 2.25.0")
+    namespace = parser.parse_args(arguments)
+    lilypond_version_token: bool | str = True
+    if namespace.lilypond_version is not None:
+        lilypond_version_token = rf'\version "{namespace.lilypond_version}"'
+    run(
+        namespace.directory,
+        namespace.output,
+        force=namespace.force,
+        lilypond_version_token=lilypond_version_token,
+        workers=namespace.workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
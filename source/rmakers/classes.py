@@ -2,12 +2,96 @@
 The rmakers classes.
 """
 
+import collections.abc
 import dataclasses
+import threading
+import time
 import typing
 
 import abjad
 
 
+class Cancellation:
+    """
+    Cancellation token.
+
+    ..  container:: example
+
+        >>> cancellation = rmakers.Cancellation()
+        >>> cancellation.cancelled
+        False
+
+        >>> cancellation.cancel()
+        >>> cancellation.cancelled
+        True
+
+        >>> durations = [abjad.Duration(3, 8), abjad.Duration(4, 8)]
+        >>> rmakers.talea(durations, [1, 2], 16, cancellation=cancellation)
+        Traceback (most recent call last):
+            ...
+        rmakers.classes.Cancelled: cancelled.
+
+    ..  container:: example
+
+        Cancels itself ``timeout`` seconds after it is made:
+
+        >>> cancellation = rmakers.Cancellation(timeout=0)
+        >>> cancellation.cancelled
+        True
+
+    Makers and commands that accept a cancellation check it between durations
+    or measures and raise ``rmakers.Cancelled`` without changing their
+    arguments. Call ``cancel()`` from any thread.
+    """
+
+    __slots__ = ("_event", "deadline")
+
+    __documentation_section__ = "Specifiers"
+
+    def __init__(self, *, timeout: float | None = None) -> None:
+        self._event = threading.Event()
+        self.deadline = None
+        if timeout is not None:
+            assert isinstance(timeout, int | float) and 0 <= timeout, repr(timeout)
+            self.deadline = time.monotonic() + timeout
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(cancelled={self.cancelled!r})"
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Is true when cancelled or past deadline.
+        """
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and self.deadline <= time.monotonic():
+            self._event.set()
+            return True
+        return False
+
+    def cancel(self) -> None:
+        """
+        Cancels token.
+        """
+        self._event.set()
+
+    def check(self) -> None:
+        """
+        Raises ``rmakers.Cancelled`` when cancelled or past deadline.
+        """
+        if self.cancelled:
+            if self.deadline is not None and self.deadline <= time.monotonic():
+                raise Cancelled("deadline passed.")
+            raise Cancelled("cancelled.")
+
+
+class Cancelled(Exception):
+    """
+    Raised when cancellation token is cancelled or past its deadline.
+    """
+
+
 @dataclasses.dataclass(frozen=True, order=True, slots=True, unsafe_hash=True)
 class Incise:
     """
@@ -589,6 +673,270 @@ class Spelling:
         assert isinstance(self.increase_monotonic, bool), repr(self.increase_monotonic)
 
 
+@dataclasses.dataclass(eq=False, frozen=True, slots=True)
+class State(collections.abc.Mapping):
+    """
+    State of a rhythm-maker after one or more calls.
+
+    ..  container:: example
+
+        >>> state = rmakers.State(durations_consumed=4, logical_ties_produced=8)
+        >>> state
+        State(durations_consumed=4, incomplete_last_note=False, logical_ties_produced=8, talea_weight_consumed=None)
+
+    ..  container:: example
+
+        Reads like the state dictionaries makers write; keys with default
+        values are omitted:
+
+        >>> state["durations_consumed"]
+        4
+
+        >>> state.get("talea_weight_consumed", 0)
+        0
+
+        >>> dict(state)
+        {'durations_consumed': 4, 'logical_ties_produced': 8}
+
+        >>> state == {"durations_consumed": 4, "logical_ties_produced": 8}
+        True
+
+        >>> state = rmakers.State.from_dict(
+        ...     {
+        ...         "durations_consumed": 4,
+        ...         "incomplete_last_note": True,
+        ...         "logical_ties_produced": 8,
+        ...         "talea_weight_consumed": 31,
+        ...     }
+        ... )
+        >>> for item in state.items():
+        ...     item
+        ('durations_consumed', 4)
+        ('incomplete_last_note', True)
+        ('logical_ties_produced', 8)
+        ('talea_weight_consumed', 31)
+
+    Makers accept states wherever they accept ``previous_state`` dictionaries.
+    """
+
+    durations_consumed: int = 0
+    incomplete_last_note: bool = False
+    logical_ties_produced: int = 0
+    talea_weight_consumed: int | None = None
+
+    __documentation_section__ = "Specifiers"
+
+    def __post_init__(self):
+        assert isinstance(self.durations_consumed, int), repr(self.durations_consumed)
+        assert 0 <= self.durations_consumed, repr(self.durations_consumed)
+        assert isinstance(self.incomplete_last_note, bool), repr(
+            self.incomplete_last_note
+        )
+        assert isinstance(self.logical_ties_produced, int), repr(
+            self.logical_ties_produced
+        )
+        if self.talea_weight_consumed is not None:
+            assert isinstance(self.talea_weight_consumed, int), repr(
+                self.talea_weight_consumed
+            )
+
+    def __eq__(self, argument) -> bool:
+        """
+        Is true when ``argument`` is mapping with same items.
+        """
+        if isinstance(argument, collections.abc.Mapping):
+            return dict(self.items()) == dict(argument.items())
+        return NotImplemented
+
+    def __getitem__(self, key: str) -> bool | int:
+        """
+        Gets value of ``key``; raises key error when value is omitted.
+        """
+        if key == "durations_consumed":
+            return self.durations_consumed
+        if key == "incomplete_last_note" and self.incomplete_last_note:
+            return True
+        if key == "logical_ties_produced":
+            return self.logical_ties_produced
+        if key == "talea_weight_consumed" and self.talea_weight_consumed is not None:
+            return self.talea_weight_consumed
+        raise KeyError(key)
+
+    def __hash__(self) -> int:
+        """
+        Hashes items.
+        """
+        return hash(tuple(self.items()))
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """
+        Iterates keys in sorted order.
+        """
+        yield "durations_consumed"
+        if self.incomplete_last_note:
+            yield "incomplete_last_note"
+        yield "logical_ties_produced"
+        if self.talea_weight_consumed is not None:
+            yield "talea_weight_consumed"
+
+    def __len__(self) -> int:
+        """
+        Gets number of keys.
+        """
+        count = 2
+        if self.incomplete_last_note:
+            count += 1
+        if self.talea_weight_consumed is not None:
+            count += 1
+        return count
+
+    def advance(
+        self,
+        durations_consumed: int,
+        logical_ties_produced: int,
+        *,
+        incomplete_last_note: bool = False,
+        talea_weight_consumed: int | None = None,
+    ) -> "State":
+        """
+        Advances state by one maker call.
+
+        ..  container:: example
+
+            Counts the logical tie split between calls only once:
+
+            >>> state = rmakers.State(
+            ...     durations_consumed=4,
+            ...     incomplete_last_note=True,
+            ...     logical_ties_produced=8,
+            ...     talea_weight_consumed=31,
+            ... )
+            >>> state.advance(4, 9, talea_weight_consumed=33)
+            State(durations_consumed=8, incomplete_last_note=False, logical_ties_produced=16, talea_weight_consumed=64)
+
+        Durations, logical ties and talea weight accumulate;
+        ``incomplete_last_note`` describes only the last call. Talea weight is
+        dropped when the last call does not read a talea.
+        """
+        logical_ties_produced += self.logical_ties_produced
+        if self.incomplete_last_note:
+            logical_ties_produced -= 1
+        if talea_weight_consumed is not None:
+            talea_weight_consumed += self.talea_weight_consumed or 0
+        return State(
+            durations_consumed=self.durations_consumed + durations_consumed,
+            incomplete_last_note=incomplete_last_note,
+            logical_ties_produced=logical_ties_produced,
+            talea_weight_consumed=talea_weight_consumed,
+        )
+
+    @staticmethod
+    def decode(string: str) -> "State":
+        """
+        Decodes state from ``string``.
+
+        ..  container:: example
+
+            >>> rmakers.State.decode("4:1:8:31")
+            State(durations_consumed=4, incomplete_last_note=True, logical_ties_produced=8, talea_weight_consumed=31)
+
+        """
+        assert isinstance(string, str), repr(string)
+        parts = string.split(":")
+        if len(parts) != 4:
+            raise ValueError(f"can not decode state: {string!r}.")
+        talea_weight_consumed = None
+        if parts[3]:
+            talea_weight_consumed = int(parts[3])
+        return State(
+            durations_consumed=int(parts[0]),
+            incomplete_last_note=parts[1] == "1",
+            logical_ties_produced=int(parts[2]),
+            talea_weight_consumed=talea_weight_consumed,
+        )
+
+    def encode(self) -> str:
+        """
+        Encodes state as compact string.
+
+        ..  container:: example
+
+            >>> rmakers.State(durations_consumed=5, logical_ties_produced=15).encode()
+            '5:0:15:'
+
+            >>> state = rmakers.State(4, True, 8, 31)
+            >>> state.encode()
+            '4:1:8:31'
+
+            >>> rmakers.State.decode(state.encode()) == state
+            True
+
+        """
+        talea_weight_consumed = self.talea_weight_consumed
+        if talea_weight_consumed is None:
+            talea_weight_consumed_string = ""
+        else:
+            talea_weight_consumed_string = str(talea_weight_consumed)
+        incomplete_last_note = int(self.incomplete_last_note)
+        return (
+            f"{self.durations_consumed}:{incomplete_last_note}"
+            f":{self.logical_ties_produced}:{talea_weight_consumed_string}"
+        )
+
+    @staticmethod
+    def from_dict(argument: typing.Mapping | None) -> "State":
+        """
+        Makes state from ``argument``; ignores unknown keys.
+
+        ..  container:: example
+
+            >>> rmakers.State.from_dict({"durations_consumed": 5})
+            State(durations_consumed=5, incomplete_last_note=False, logical_ties_produced=0, talea_weight_consumed=None)
+
+        """
+        if isinstance(argument, State):
+            return argument
+        argument = argument or {}
+        return State(
+            durations_consumed=argument.get("durations_consumed", 0),
+            incomplete_last_note=argument.get("incomplete_last_note", False),
+            logical_ties_produced=argument.get("logical_ties_produced", 0),
+            talea_weight_consumed=argument.get("talea_weight_consumed", None),
+        )
+
+    def merge(self, state: "State") -> "State":
+        """
+        Merges ``state`` made from zero after this state.
+
+        ..  container:: example
+
+            >>> first = rmakers.State(5, False, 15)
+            >>> second = rmakers.State(5, False, 14)
+            >>> first.merge(second)
+            State(durations_consumed=10, incomplete_last_note=False, logical_ties_produced=29, talea_weight_consumed=None)
+
+        """
+        assert isinstance(state, State), repr(state)
+        return self.advance(
+            state.durations_consumed,
+            state.logical_ties_produced,
+            incomplete_last_note=state.incomplete_last_note,
+            talea_weight_consumed=state.talea_weight_consumed,
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Changes state to dictionary.
+
+        ..  container:: example
+
+            >>> rmakers.State(5, False, 15).to_dict()
+            {'durations_consumed': 5, 'logical_ties_produced': 15}
+
+        """
+        return dict(self)
+
+
 @dataclasses.dataclass(frozen=True, order=True, slots=True, unsafe_hash=True)
 class Talea:
     """
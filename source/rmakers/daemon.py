@@ -0,0 +1,194 @@
+"""
+The rmakers daemon.
+
+Runs recipes in a warm process over a Unix domain socket. Clients send one
+JSON recipe per line and receive one JSON response per line; see
+``rmakers.recipes`` for the recipe format.
+
+Responses carry ``"ok": true`` and the result of ``rmakers.recipes.run()``,
+or ``"ok": false`` and an ``error`` message; responses echo the ``id`` of
+requests that have one.
+
+Start the daemon with ``rmakers-daemon --socket PATH [--workers N]``.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import socket
+import socketserver
+import threading
+
+from . import recipes as _recipes
+
+_warmup_recipe = {
+    "maker": "talea",
+    "time_signatures": [[3, 8], [4, 8]],
+    "arguments": [[1, 2, 3], 16],
+    "keywords": {"extra_counts": [0, 1]},
+    "commands": [{"command": "beam"}, {"command": "rewrite_meter"}],
+}
+
+
+def _warm_up():
+    _recipes.run(_warmup_recipe)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            self.wfile.write(self.server._respond(line))
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Recipe server.
+
+    Listens on ``path``; serves each connection in a thread. Runs recipes one
+    at a time in this process, or in a pool of ``workers`` warm processes
+    when ``workers`` is set.
+
+    Removes ``path`` on close.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str, *, workers: int | None = None) -> None:
+        assert isinstance(path, str), repr(path)
+        if workers is not None:
+            assert isinstance(workers, int) and 0 < workers, repr(workers)
+        self.path = path
+        self.workers = workers
+        self._executor: concurrent.futures.ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        if workers is None:
+            _warm_up()
+        else:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                workers, initializer=_warm_up
+            )
+        super().__init__(path, _Handler)
+
+    def _respond(self, line: bytes) -> bytes:
+        request = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise Exception(f"recipe must be object, not {request!r}.")
+            if self._executor is None:
+                with self._lock:
+                    result = _recipes.run(request)
+            else:
+                result = self._executor.submit(_recipes.run, request).result()
+            response = {"ok": True, **result}
+        except Exception as exception:
+            message = f"{type(exception).__name__}: {exception}"
+            response = {"ok": False, "error": message}
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        return (json.dumps(response) + "\n").encode()
+
+    def server_close(self) -> None:
+        """
+        Closes socket, removes ``path`` and shuts down worker processes.
+        """
+        super().server_close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
+class Client:
+    r"""
+    Recipe client.
+
+    ..  container:: example
+
+        >>> import os, tempfile, threading
+        >>> import rmakers.daemon
+        >>> path = os.path.join(tempfile.mkdtemp(), "rmakers.sock")
+        >>> server = rmakers.daemon.Server(path)
+        >>> thread = threading.Thread(target=server.serve_forever)
+        >>> thread.start()
+
+        >>> recipe = {
+        ...     "maker": "note",
+        ...     "time_signatures": [[3, 8]],
+        ...     "commands": [{"command": "beam"}],
+        ... }
+        >>> with rmakers.daemon.Client(path) as client:
+        ...     print(client.run(recipe)["lilypond"])
+        ...
+        \context Voice = "RhythmMaker.Music"
+        {
+            c'4.
+        }
+
+        >>> server.shutdown()
+        >>> server.server_close()
+        >>> thread.join()
+
+    Raises exception when daemon can not run recipe.
+    """
+
+    def __init__(self, path: str) -> None:
+        assert isinstance(path, str), repr(path)
+        self.path = path
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(path)
+        self._file = self._socket.makefile("rwb")
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes connection.
+        """
+        self._file.close()
+        self._socket.close()
+
+    def run(self, recipe: dict) -> dict:
+        """
+        Runs ``recipe`` in daemon.
+        """
+        assert isinstance(recipe, dict), repr(recipe)
+        self._file.write((json.dumps(recipe) + "\n").encode())
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise Exception(f"daemon closed connection: {self.path!r}.")
+        response = json.loads(line)
+        if response.pop("ok") is not True:
+            raise Exception(response["error"])
+        return response
+
+
+def main(arguments: list[str] | None = None) -> None:
+    """
+    Runs daemon until interrupted.
+    """
+    parser = argparse.ArgumentParser(
+        prog="rmakers-daemon",
+        description="Runs rmakers recipes sent as JSON over a Unix socket.",
+    )
+    parser.add_argument("--socket", required=True, help="socket path")
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    namespace = parser.parse_args(arguments)
+    with Server(namespace.socket, workers=namespace.workers) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,134 @@
 The rmakers functions.
 """
 
+import collections
+import concurrent.futures
+import copy
+import dataclasses
+import fractions
+import functools
+import hashlib
 import inspect
+import itertools
 import math
 import typing
 
 import abjad
 
 from . import classes as _classes
+from . import instrumentation as _instrumentation
+from . import makers as _makers
+
+
+def _decode_component(data):
+    """
+    Makes component from rhythm data made by ``_encode_component()``.
+    """
+    if data[0] in ("Container", "Tuplet"):
+        components = [_decode_component(_) for _ in data[-1]]
+        if data[0] == "Container":
+            return abjad.Container(components, tag=data[1])
+        name, multiplier, denominator, force_fraction, hide, tag, _ = data
+        tuplet = abjad.Tuplet(multiplier, components, tag=tag)
+        tuplet.denominator = denominator
+        tuplet.force_fraction = force_fraction
+        tuplet.hide = hide
+        return tuplet
+    name, duration, multiplier, pitches, tag, wrappers = data
+    if name == "Note":
+        leaf = abjad.Note(pitches, duration, multiplier=multiplier, tag=tag)
+    elif name == "Chord":
+        leaf = abjad.Chord(pitches, duration, multiplier=multiplier, tag=tag)
+    else:
+        class_ = getattr(abjad, name)
+        leaf = class_(duration, multiplier=multiplier, tag=tag)
+    for indicator, tag, deactivate, direction in wrappers:
+        abjad.attach(
+            indicator, leaf, deactivate=deactivate, direction=direction, tag=tag
+        )
+    return leaf
+
+
+def _encode_component(component):
+    """
+    Encodes ``component`` as nested tuples of rhythm data: leaf durations,
+    pitches, tags, ties and beams, and tuplet settings.
+
+    Returns none when ``component`` carries anything else, like grace
+    containers, overrides or other indicators.
+    """
+    if vars(abjad.override(component)) or vars(abjad.setting(component)):
+        return None
+    wrappers = []
+    for wrapper in abjad.get.wrappers(component):
+        if not isinstance(
+            wrapper.indicator,
+            abjad.RepeatTie | abjad.StartBeam | abjad.StopBeam | abjad.Tie,
+        ):
+            return None
+        if wrapper.annotation is not None or wrapper.context is not None:
+            return None
+        if wrapper.synthetic_offset is not None:
+            return None
+        wrappers.append(
+            (wrapper.indicator, wrapper.tag, wrapper.deactivate, wrapper.direction)
+        )
+    if type(component) in (abjad.Container, abjad.Tuplet):
+        if wrappers or component.identifier or component.name:
+            return None
+        if component.simultaneous:
+            return None
+        components = []
+        for component_ in component:
+            data = _encode_component(component_)
+            if data is None:
+                return None
+            components.append(data)
+        if type(component) is abjad.Container:
+            return ("Container", component.tag, tuple(components))
+        if component.tweaks:
+            return None
+        return (
+            "Tuplet",
+            component.multiplier,
+            component.denominator,
+            component.force_fraction,
+            component.hide,
+            component.tag,
+            tuple(components),
+        )
+    if type(component) not in (abjad.Chord, abjad.Note, abjad.Rest, abjad.Skip):
+        return None
+    if abjad.get.before_grace_container(component) is not None:
+        return None
+    if abjad.get.after_grace_container(component) is not None:
+        return None
+    pitches = None
+    if isinstance(component, abjad.Note):
+        note_heads = [component.note_head]
+    elif isinstance(component, abjad.Chord):
+        note_heads = list(component.note_heads)
+    else:
+        note_heads = []
+    for note_head in note_heads:
+        if note_head.tweaks or note_head.alternative:
+            return None
+        if note_head.is_cautionary or note_head.is_forced:
+            return None
+        if note_head.is_parenthesized:
+            return None
+    if isinstance(component, abjad.Note):
+        pitches = component.written_pitch
+    elif isinstance(component, abjad.Chord):
+        pitches = tuple(_.written_pitch for _ in note_heads)
+    return (
+        type(component).__name__,
+        component.written_duration.pair,
+        component.multiplier,
+        pitches,
+        component.tag,
+        tuple(wrappers),
+    )
 
 
 def _function_name(frame):
@@ -17,6 +138,318 @@ def _function_name(frame):
     return abjad.Tag(string)
 
 
+def _get_component_key(component):
+    """
+    Gets hashable key of everything about ``component`` that
+    ``abjad.mutate.copy()`` preserves, or none.
+    """
+    if isinstance(component, abjad.Leaf):
+        return _get_lilypond_leaf_key(component, tags=True)
+    if type(component) is not abjad.Tuplet:
+        return None
+    if component.tweaks or abjad.get.wrappers(component):
+        return None
+    if vars(abjad.override(component)) or vars(abjad.setting(component)):
+        return None
+    keys = [
+        abjad.Tuplet,
+        component.multiplier,
+        component.denominator,
+        component.force_fraction,
+        component.hide,
+        component.tag,
+    ]
+    for component_ in component:
+        key = _get_component_key(component_)
+        if key is None:
+            return None
+        keys.append(key)
+    return tuple(keys)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_duration_bracket_string(duration):
+    """
+    Gets duration bracket markup string for tuplets of ``duration``.
+    """
+    components = _makers._make_leaves(duration, 0)
+    if all(isinstance(_, abjad.Note) for _ in components):
+        durations = [abjad.get.duration(_) for _ in components]
+        strings = [_.lilypond_duration_string for _ in durations]
+        strings = [rf"\rhythm {{ {_} }}" for _ in strings]
+        string = " + ".join(strings)
+        if "+" in string:
+            string = f"{{ {string} }}"
+    else:
+        string = abjad.illustrators.components_to_score_markup_string(components)
+    string = rf"\markup \scale #'(0.75 . 0.75) {string}"
+    return string
+
+
+def _get_lilypond_shell(container, cache):
+    if abjad.get.wrappers(container):
+        return None
+    for component in container:
+        if type(component) in (abjad.Container, abjad.Tuplet):
+            continue
+        if isinstance(component, abjad.Leaf | abjad.Context):
+            continue
+        return None
+    if type(container) is abjad.Tuplet:
+        if container.tweaks:
+            return None
+        if vars(abjad.override(container)) or vars(abjad.setting(container)):
+            return None
+        duration = abjad.get.duration(container, preprolated=True)
+        key = (
+            abjad.Tuplet,
+            container.multiplier,
+            container.denominator,
+            container.force_fraction,
+            container.hide,
+            duration,
+        )
+        shell = cache.get(key)
+        if shell is not None:
+            return shell
+        contents_duration = duration / fractions.Fraction(*container.multiplier)
+        skip = abjad.Skip(1, multiplier=abjad.duration.pair(contents_duration))
+        representative = abjad.Tuplet(
+            container.multiplier,
+            [skip],
+            denominator=container.denominator,
+            force_fraction=container.force_fraction,
+            hide=container.hide,
+        )
+    elif type(container) is abjad.Container or isinstance(container, abjad.Context):
+        key, representative = None, copy.copy(container)
+        representative.append(abjad.Skip(1))
+    else:
+        return None
+    lines = abjad.lilypond(representative).split("\n")
+    indices = [i for i, _ in enumerate(lines) if _.strip().startswith("s1")]
+    assert len(indices) == 1, repr(lines)
+    shell = lines[: indices[0]], lines[indices[0] + 1 :]
+    if key is not None:
+        cache[key] = shell
+    return shell
+
+
+def _get_first_leaves_by_durations(leaves, time_signatures) -> list[abjad.Leaf]:
+    """
+    Gets first leaf of each part ``abjad.select.partition_by_durations()``
+    makes when partitioning ``leaves`` by durations of ``time_signatures``.
+
+    Sweeps leaves once with integer numerators and denominators; computes
+    prolation once per parent.
+    """
+    first_leaves: list[abjad.Leaf] = []
+    if not time_signatures:
+        return first_leaves
+    targets = [_.pair for _ in time_signatures]
+    target_numerator, target_denominator = targets[0]
+    numerator, denominator, first_leaf = 0, 1, None
+    prolations: dict[int, tuple[int, int]] = {}
+    for leaf in leaves:
+        parentage = abjad.get.parentage(leaf)
+        key = id(parentage.parent)
+        prolation = prolations.get(key)
+        if prolation is None:
+            prolation_ = parentage.prolation
+            prolation = prolation_.numerator, prolation_.denominator
+            prolations[key] = prolation
+        leaf_numerator = prolation[0] * leaf.written_duration.numerator
+        leaf_denominator = prolation[1] * leaf.written_duration.denominator
+        if leaf.multiplier is not None:
+            leaf_numerator *= leaf.multiplier[0]
+            leaf_denominator *= leaf.multiplier[1]
+        numerator = numerator * leaf_denominator + leaf_numerator * denominator
+        denominator *= leaf_denominator
+        gcd = math.gcd(numerator, denominator)
+        numerator, denominator = numerator // gcd, denominator // gcd
+        difference = numerator * target_denominator - target_numerator * denominator
+        if 0 < difference:
+            raise Exception("must partition exactly.")
+        if first_leaf is None:
+            first_leaf = leaf
+        if difference < 0:
+            continue
+        first_leaves.append(first_leaf)
+        if len(first_leaves) == len(targets):
+            break
+        target_numerator, target_denominator = targets[len(first_leaves)]
+        numerator, denominator, first_leaf = 0, 1, None
+    return first_leaves
+
+
+def _get_lilypond_leaf_key(leaf, *, tags=False):
+    if type(leaf) not in (abjad.MultimeasureRest, abjad.Note, abjad.Rest, abjad.Skip):
+        return None
+    if vars(abjad.override(leaf)) or vars(abjad.setting(leaf)):
+        return None
+    if abjad.get.before_grace_container(leaf) is not None:
+        return None
+    if abjad.get.after_grace_container(leaf) is not None:
+        return None
+    pitch = None
+    if isinstance(leaf, abjad.Note):
+        note_head = leaf.note_head
+        if (
+            note_head.alternative
+            or note_head.is_cautionary
+            or note_head.is_forced
+            or note_head.is_parenthesized
+            or note_head.tweaks
+        ):
+            return None
+        pitch = note_head.written_pitch
+    wrappers = []
+    for wrapper in abjad.get.wrappers(leaf):
+        item = (
+            type(wrapper.indicator),
+            wrapper.indicator,
+            wrapper.context,
+            wrapper.direction,
+            wrapper.deactivate,
+            wrapper.tag if wrapper.deactivate or tags else None,
+        )
+        if tags is True:
+            item += (wrapper.annotation, wrapper.synthetic_offset)
+        wrappers.append(item)
+    key = (type(leaf), pitch, leaf.written_duration, leaf.multiplier, tuple(wrappers))
+    if tags is True:
+        key += (leaf.tag,)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_lilypond_file_shell(argument, components):
+    items = []
+    for item in argument.items:
+        if isinstance(item, abjad.Component):
+            string = f"%%% rmakers.write_lilypond() {len(components)} %%%"
+            components[string] = item
+            items.append(string)
+        elif isinstance(item, abjad.Block):
+            block = _get_lilypond_file_shell(item, components)
+            items.append(block)
+        else:
+            items.append(item)
+    return dataclasses.replace(argument, items=items)
+
+
+def _get_measure_crossings(components, component_durations, durations):
+    """
+    Gets components that cross measure boundaries, each with the split
+    durations ``abjad.mutate.split()`` needs to cut it at those boundaries.
+    """
+    crossings = []
+    stop_offsets = abjad.math.cumulative_sums(durations, start=None)
+    i, start_offset = 0, abjad.Duration(0)
+    for component, duration in zip(components, component_durations):
+        stop_offset = start_offset + duration
+        while i < len(stop_offsets) and stop_offsets[i] <= start_offset:
+            i += 1
+        if i < len(stop_offsets) and stop_offsets[i] < stop_offset:
+            durations_ = [stop_offsets[i] - start_offset]
+            j = i + 1
+            while j < len(stop_offsets) and stop_offsets[j] < stop_offset:
+                durations_.append(durations[j])
+                j += 1
+            crossings.append((component, durations_))
+        start_offset = stop_offset
+    return crossings
+
+
+def _get_measure_lists(components, durations):
+    """
+    Groups ``components`` by measure; every measure boundary must fall between
+    components.
+
+    Components of zero duration go with the measure that follows.
+    """
+    stop_offsets = abjad.math.cumulative_sums(durations, start=None)
+    lists = [[] for _ in durations]
+    i, offset = 0, abjad.Duration(0)
+    for component in components:
+        while i < len(stop_offsets) - 1 and stop_offsets[i] <= offset:
+            i += 1
+        lists[i].append(component)
+        offset += abjad.get.duration(component)
+        assert offset <= stop_offsets[i], repr(component)
+    return lists
+
+
+def _get_measure_segments(components, durations):
+    """
+    Groups ``components`` into runs of whole measures; returns list of pairs
+    of components and duration of each run.
+
+    Runs end at each measure boundary no component crosses. Components of zero
+    duration go with the run that follows, or with the last run.
+    """
+    stop_offsets = set(abjad.math.cumulative_sums(durations, start=None))
+    segments = []
+    start, start_offset, offset = 0, abjad.Duration(0), abjad.Duration(0)
+    for i, component in enumerate(components):
+        duration = abjad.get.duration(component)
+        offset += duration
+        if duration and offset in stop_offsets:
+            segments.append((components[start : i + 1], offset - start_offset))
+            start, start_offset = i + 1, offset
+    if start < len(components):
+        if segments:
+            components_, duration = segments.pop()
+            segments.append((components_ + components[start:], duration))
+        else:
+            segments.append((components[start:], offset - start_offset))
+    return segments
+
+
+def _get_rhythm_key(argument):
+    """
+    Gets hashable key of written durations, multipliers and tuplet
+    multipliers of components in ``argument``, or none.
+    """
+    keys = []
+    for component in argument:
+        if isinstance(component, abjad.Leaf):
+            if abjad.get.after_grace_container(component) is not None:
+                return None
+            key = (component.written_duration, component.multiplier)
+        elif type(component) is abjad.Tuplet:
+            key = _get_rhythm_key(component)
+            if key is None:
+                return None
+            key = (component.multiplier,) + key
+        else:
+            return None
+        keys.append(key)
+    return tuple(keys)
+
+
+def _get_tuplet_shape(tuplet):
+    """
+    Gets hashable key of multiplier, denominator, force-fraction setting,
+    prolation of enclosing tuplets and leaf durations of ``tuplet``, or none
+    when ``tuplet`` contains anything other than leaves.
+    """
+    prolation = fractions.Fraction(1)
+    for component in abjad.get.parentage(tuplet)[1:]:
+        if isinstance(component, abjad.Tuplet):
+            prolation *= fractions.Fraction(*component.multiplier)
+    keys = [tuplet.multiplier, tuplet.denominator, tuplet.force_fraction, prolation]
+    for component in tuplet:
+        if not isinstance(component, abjad.Leaf):
+            return None
+        duration = component.written_duration
+        keys.append((duration.numerator, duration.denominator, component.multiplier))
+    return tuple(keys)
+
+
 def _interpolate_cosine(y1, y2, mu) -> float:
     mu2 = (1 - math.cos(mu * math.pi)) / 2
     return y1 * (1 - mu2) + y2 * mu2
@@ -178,6 +611,25 @@ def _interpolate_divide(
     return durations
 
 
+def _is_attached_time_signature(wrappers, time_signature):
+    """
+    Is true when ``wrappers`` is exactly what ``abjad.attach(time_signature,
+    leaf)`` makes.
+    """
+    if len(wrappers) != 1:
+        return False
+    wrapper = wrappers[0]
+    return (
+        wrapper.indicator == time_signature
+        and wrapper.context == time_signature.context
+        and wrapper.annotation is None
+        and wrapper.deactivate is False
+        and wrapper.direction is None
+        and wrapper.synthetic_offset is None
+        and not wrapper.tag.string
+    )
+
+
 def _is_accelerando(argument):
     first_leaf = abjad.select.leaf(argument, 0)
     last_leaf = abjad.select.leaf(argument, -1)
@@ -198,6 +650,104 @@ def _is_ritardando(argument):
     return False
 
 
+def _iterate_fingerprint_tokens(component, tags):
+    classes = (abjad.RepeatTie, abjad.StartBeam, abjad.StopBeam, abjad.Tie)
+    if isinstance(component, abjad.Leaf):
+        for grace in (
+            abjad.get.before_grace_container(component),
+            abjad.get.after_grace_container(component),
+        ):
+            if grace is not None:
+                yield from _iterate_fingerprint_tokens(grace, tags)
+        yield type(component).__name__
+        yield str(component.written_duration.pair)
+        yield str(component.multiplier)
+        for wrapper in abjad.get.wrappers(component):
+            if isinstance(wrapper.indicator, classes):
+                yield type(wrapper.indicator).__name__
+                if tags is True:
+                    yield repr(wrapper.tag.string)
+        if tags is True:
+            yield repr(component.tag and component.tag.string)
+        yield ";"
+        return
+    yield type(component).__name__
+    if isinstance(component, abjad.Tuplet):
+        yield str(component.multiplier)
+        yield str(component.denominator)
+        yield str(component.force_fraction)
+        yield str(component.hide)
+    if tags is True:
+        yield repr(component.tag and component.tag.string)
+    yield "{"
+    for component_ in component:
+        yield from _iterate_fingerprint_tokens(component_, tags)
+    yield "}"
+
+
+def _iterate_lilypond_lines(component, cache, contexts=(), isolated=False):
+    if isinstance(component, abjad.Leaf):
+        key = _get_lilypond_leaf_key(component)
+        if key is None:
+            yield from abjad.lilypond(component).split("\n")
+            return
+        key = (key, contexts)
+        lines = cache.get(key)
+        if lines is None:
+            lines = abjad.lilypond(component).split("\n")
+            cache[key] = lines
+        yield from lines
+        return
+    shell = None
+    if not isolated:
+        shell = _get_lilypond_shell(component, cache)
+    if shell is None:
+        shell = _make_lilypond_shell(component)
+        if shell is None:
+            yield from abjad.lilypond(component).split("\n")
+            return
+        if abjad.get.wrappers(component):
+            cache, isolated = {}, True
+    opening, closing = shell
+    yield from opening
+    if isinstance(component, abjad.Context):
+        contexts = contexts + ((component.lilypond_type, component.name),)
+    for component_ in component:
+        lines = _iterate_lilypond_lines(component_, cache, contexts, isolated)
+        for line in lines:
+            if line and not line.isspace():
+                yield "    " + line
+            else:
+                yield ""
+    yield from closing
+
+
+def _iterate_lilypond_file_lines(argument, cache):
+    if not isinstance(argument, abjad.LilyPondFile):
+        if isinstance(argument, abjad.Component):
+            argument = [argument]
+        for component in argument:
+            parentage = abjad.get.parentage(component)[1:]
+            if any(abjad.get.wrappers(_) for _ in parentage):
+                yield from _iterate_lilypond_lines(component, {}, isolated=True)
+            else:
+                yield from _iterate_lilypond_lines(component, cache)
+        return
+    components = {}
+    shell = _get_lilypond_file_shell(argument, components)
+    for line in abjad.lilypond(shell).split("\n"):
+        component = components.get(line.strip())
+        if component is None:
+            yield line
+            continue
+        indent = line[: len(line) - len(line.lstrip())]
+        for line_ in _iterate_lilypond_file_lines(component, cache):
+            if line_ and not line_.isspace():
+                yield indent + line_
+            else:
+                yield ""
+
+
 def _make_beamable_groups(components, durations):
     assert all(isinstance(_, abjad.Duration) for _ in durations)
     music_duration = abjad.get.duration(components)
@@ -239,27 +789,303 @@ def _make_beamable_groups(components, durations):
     return beamable_groups
 
 
+def _make_example_lilypond_file(components, time_signatures):
+    parts = _partition_leaves_by_time_signatures(components, time_signatures)
+    assert len(parts) == len(time_signatures)
+    previous_time_signature = None
+    for time_signature, part in zip(time_signatures, parts):
+        if time_signature != previous_time_signature:
+            abjad.attach(time_signature, part[0])
+        previous_time_signature = time_signature
+    voice = abjad.Voice(components, name="Voice")
+    staff = abjad.Staff([voice], name="Staff")
+    score = abjad.Score([staff], name="Score", simultaneous=False)
+    string = r"""\layout
+{
+    \context
+    {
+        \Score
+        proportionalNotationDuration = \musicLength 1*1/24
+    }
+}
+"""
+    items = [r'\include "abjad.ily"', string, score]
+    lilypond_file = abjad.LilyPondFile(items)
+    return lilypond_file
+
+
+def _make_lilypond_shell(container):
+    if not len(container):
+        return None
+    if type(container) not in (abjad.Container, abjad.Tuplet):
+        if not isinstance(container, abjad.Context):
+            return None
+    parent = None
+    for component in reversed(abjad.get.parentage(container)):
+        representative = copy.copy(component)
+        if isinstance(component, abjad.Tuplet):
+            representative.denominator = component.denominator
+            representative.force_fraction = component.force_fraction
+            representative.hide = component.hide
+            representative.tweaks = component.tweaks
+        if parent is not None:
+            parent.append(representative)
+        parent = representative
+    duration = abjad.get.duration(container, preprolated=True)
+    if isinstance(container, abjad.Tuplet):
+        duration /= fractions.Fraction(*container.multiplier)
+    skip = abjad.Skip(1, multiplier=abjad.duration.pair(duration))
+    representative.append(skip)
+    lines = abjad.lilypond(representative).split("\n")
+    strings = abjad.lilypond(skip).split("\n")
+    strings = ["    " + _ if _.strip() else "" for _ in strings]
+    for i in range(len(lines) - len(strings) + 1):
+        if lines[i : i + len(strings)] == strings:
+            return lines[:i], lines[i + len(strings) :]
+    raise Exception(f"can not find contents of {container!r}.")
+
+
 def _make_time_signature_staff(time_signatures):
     assert time_signatures, repr(time_signatures)
-    staff = abjad.Staff(simultaneous=True)
-    score = abjad.Score([staff], name="Score")
-    time_signature_voice = abjad.Voice(name="TimeSignatureVoice")
-    staff.append(time_signature_voice)
-    staff.append(abjad.Voice(name="RhythmMaker.Music"))
+    skips = []
     for time_signature in time_signatures:
         duration = time_signature.pair
         skip = abjad.Skip(1, multiplier=duration)
-        time_signature_voice.append(skip)
         abjad.attach(time_signature, skip, context="Staff")
+        skips.append(skip)
+    time_signature_voice = abjad.Voice(name="TimeSignatureVoice")
+    time_signature_voice.extend(skips)
+    music_voice = abjad.Voice(name="RhythmMaker.Music")
+    staff = abjad.Staff([time_signature_voice, music_voice], simultaneous=True)
+    score = abjad.Score([staff], name="Score")
     return score
 
 
+def _partition_leaves_by_time_signatures(components, time_signatures):
+    if len(components) == len(time_signatures):
+        for component, time_signature in zip(components, time_signatures):
+            if abjad.get.duration(component) != time_signature.duration:
+                break
+        else:
+            return [abjad.select.leaves(_, grace=False) for _ in components]
+    leaves = abjad.select.leaves(components, grace=False)
+    durations = [_.duration for _ in time_signatures]
+    parts = abjad.select.partition_by_durations(leaves, durations)
+    return parts
+
+
+def _replace_changed_segments(voice, segments, container):
+    """
+    Replaces each run of components in ``segments`` with the matching run of
+    rewritten components in ``container`` when the two differ.
+    """
+    durations = [_[1] for _ in segments]
+    lists = _get_measure_lists(container[:], durations)
+    del container[:]
+    index = 0
+    for (components, _), list_ in zip(segments, lists):
+        tokens = []
+        for component in components:
+            tokens.extend(_iterate_fingerprint_tokens(component, True))
+        tokens_ = []
+        for component in list_:
+            tokens_.extend(_iterate_fingerprint_tokens(component, True))
+        if tokens != tokens_:
+            voice[index : index + len(components)] = list_
+        index += len(list_)
+
+
+def _rewrite_measure(argument):
+    """
+    Rewrites contents of measure container in ``argument`` in place; returns
+    container.
+
+    Measure sits in a container outside the voice because abjad recomputes
+    offsets of the whole score after each split and fuse.
+    """
+    meter, container, boundary_depth = argument
+    meter.rewrite(
+        container[:],
+        boundary_depth=boundary_depth,
+        rewrite_tuplets=False,
+    )
+    return container
+
+
+def _rewrite_measure_data(argument):
+    """
+    Rewrites measures given as rhythm data; returns rhythm data of rewritten
+    measures.
+
+    Runs in worker processes for ``rmakers.rewrite_meter(..., workers=n)``.
+    """
+    meters, boundary_depth, items = argument
+    result = []
+    for i, data in items:
+        container = abjad.Container([_decode_component(_) for _ in data])
+        _rewrite_measure((meters[i], container, boundary_depth))
+        result.append(tuple(_encode_component(_) for _ in container))
+    return result
+
+
+def _rewrite_measures(voice, jobs, boundary_depth, workers, cancellation, progress):
+    """
+    Rewrites each distinct measure in ``jobs`` once; clones rewritten
+    contents for later measures with same meter and same contents.
+    """
+    meters_to_strings = {}
+    keys = []
+    for meter, components in jobs:
+        string = meters_to_strings.get(id(meter))
+        if string is None:
+            string = meter.rtm_format
+            meters_to_strings[id(meter)] = string
+        keys_ = [_get_component_key(_) for _ in components]
+        if any(_ is None for _ in keys_):
+            keys.append(None)
+        else:
+            keys.append((string, boundary_depth, tuple(keys_)))
+    counts = collections.Counter(_ for _ in keys if _ is not None)
+    indices, seen = [], set()
+    for i, key in enumerate(keys):
+        if key is None or key not in seen:
+            indices.append(i)
+            seen.add(key)
+    if workers is None or workers == 1 or len(indices) < 2:
+        _splice_measures(
+            voice, jobs, keys, counts, boundary_depth, None, cancellation, progress
+        )
+        return
+    datas = []
+    for i in indices:
+        meter, components = jobs[i]
+        data = [_encode_component(_) for _ in components]
+        if any(_ is None for _ in data):
+            datas.append(None)
+        else:
+            datas.append((meter, tuple(data)))
+    items = [_ for _ in datas if _ is not None]
+    size = max(1, len(items) // (4 * workers))
+    arguments = []
+    for start in range(0, len(items), size):
+        meters, ids_to_indices, items_ = [], {}, []
+        for meter, data in items[start : start + size]:
+            if id(meter) not in ids_to_indices:
+                ids_to_indices[id(meter)] = len(meters)
+                meters.append(meter)
+            items_.append((ids_to_indices[id(meter)], data))
+        arguments.append((meters, boundary_depth, items_))
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    try:
+        results = itertools.chain.from_iterable(
+            executor.map(_rewrite_measure_data, arguments)
+        )
+
+        def iterate_containers():
+            for data in datas:
+                if data is None:
+                    yield None
+                else:
+                    components = [_decode_component(_) for _ in next(results)]
+                    yield abjad.Container(components)
+
+        containers = iterate_containers()
+        _splice_measures(
+            voice,
+            jobs,
+            keys,
+            counts,
+            boundary_depth,
+            containers,
+            cancellation,
+            progress,
+        )
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _splice_measures(
+    voice, jobs, keys, counts, boundary_depth, containers, cancellation, progress
+):
+    """
+    Replaces measures in ``jobs`` with rewritten measures, in order.
+
+    Rewrites measures here when ``containers`` is none; otherwise takes
+    rewritten measures from ``containers``, one for each distinct measure, and
+    rewrites measures here where ``containers`` gives none.
+    """
+    ids_to_indices = {id(_): i for i, _ in enumerate(voice)}
+    keys_to_components, shift = {}, 0
+    for i, ((meter, components), key) in enumerate(zip(jobs, keys), start=1):
+        if cancellation is not None:
+            cancellation.check()
+        start = ids_to_indices[id(components[0])] + shift
+        del voice[start : start + len(components)]
+        if key in keys_to_components:
+            components_ = abjad.mutate.copy(keys_to_components[key])
+        else:
+            container = None
+            if containers is not None:
+                container = next(containers)
+            if container is None:
+                container = abjad.Container(components)
+                _rewrite_measure((meter, container, boundary_depth))
+            components_ = container[:]
+            del container[:]
+            if key is not None and 1 < counts[key]:
+                keys_to_components[key] = abjad.mutate.copy(components_)
+        voice[start:start] = components_
+        shift += len(components_) - len(components)
+        if progress is not None:
+            progress(i, len(jobs))
+
+
+def _update_tuplets(argument, function):
+    """
+    Calls ``function`` on first tuplet of each shape in ``argument``; copies
+    resulting changes to multiplier, denominator, force-fraction setting and
+    written durations to other tuplets of same shape.
+    """
+    shapes_to_changes = {}
+    for tuplet in abjad.select.tuplets(argument):
+        shape = _get_tuplet_shape(tuplet)
+        if shape is None:
+            function(tuplet)
+            continue
+        changes = shapes_to_changes.get(shape)
+        if changes is None:
+            function(tuplet)
+            multiplier = tuplet.multiplier
+            durations = []
+            for i, (leaf, key) in enumerate(zip(tuplet, shape[4:])):
+                duration = leaf.written_duration
+                if (duration.numerator, duration.denominator) != key[:2]:
+                    durations.append((i, duration))
+            changes = (
+                multiplier if multiplier != shape[0] else None,
+                tuplet.denominator,
+                tuplet.force_fraction,
+                durations,
+            )
+            shapes_to_changes[shape] = changes
+            continue
+        multiplier, denominator, force_fraction, durations = changes
+        if multiplier is not None:
+            tuplet.multiplier = multiplier
+        tuplet.denominator = denominator
+        tuplet.force_fraction = force_fraction
+        for i, duration in durations:
+            tuplet[i].written_duration = duration
+
+
 def _validate_tuplets(argument):
     for tuplet in abjad.iterate.components(argument, abjad.Tuplet):
-        assert abjad.Duration(tuplet.multiplier).normalized(), repr(tuplet)
+        numerator, denominator = tuplet.multiplier
+        assert denominator < 2 * numerator < 4 * denominator, repr(tuplet)
         assert len(tuplet), repr(tuplet)
 
 
+@_instrumentation._instrumented
 def after_grace_container(
     argument: abjad.Component | typing.Sequence[abjad.Component],
     counts: typing.Sequence[int],
@@ -445,24 +1271,29 @@ def after_grace_container(
                 abjad.attach(literal, notes[0], tag=tag)
 
 
+@_instrumentation._instrumented
 def attach_time_signatures(
     voice: abjad.Voice,
     time_signatures: list[abjad.TimeSignature],
 ) -> None:
     leaves = abjad.select.leaves(voice, grace=False)
-    durations = [_.duration for _ in time_signatures]
-    parts = abjad.select.partition_by_durations(leaves, durations)
-    assert len(parts) == len(time_signatures)
+    first_leaves = _get_first_leaves_by_durations(leaves, time_signatures)
+    assert len(first_leaves) == len(time_signatures)
     previous_time_signature = None
-    for time_signature, part in zip(time_signatures, parts):
+    for time_signature, leaf in zip(time_signatures, first_leaves):
         assert isinstance(time_signature, abjad.TimeSignature)
         if time_signature != previous_time_signature:
-            leaf = abjad.select.leaf(part, 0)
-            abjad.detach(abjad.TimeSignature, leaf)
+            wrappers = abjad.get.wrappers(leaf, abjad.TimeSignature)
+            if wrappers and _is_attached_time_signature(wrappers, time_signature):
+                previous_time_signature = time_signature
+                continue
+            if wrappers:
+                abjad.detach(abjad.TimeSignature, leaf)
             abjad.attach(time_signature, leaf)
         previous_time_signature = time_signature
 
 
+@_instrumentation._instrumented
 def beam(
     argument,
     *,
@@ -796,6 +1627,7 @@ def beam(
         )
 
 
+@_instrumentation._instrumented
 def beam_groups(
     argument,
     *,
@@ -957,6 +1789,7 @@ def beam_groups(
     )
 
 
+@_instrumentation._instrumented
 def before_grace_container(
     argument: abjad.Component | typing.Sequence[abjad.Component],
     counts: typing.Sequence[int],
@@ -1448,6 +2281,7 @@ def before_grace_container(
                 abjad.beam(notes)
 
 
+@_instrumentation._instrumented
 def denominator(argument, denominator: int | abjad.typings.Duration) -> None:
     r"""
     Sets tuplet ratio denominator of tuplets in ``argument``.
@@ -1933,7 +2767,8 @@ def denominator(argument, denominator: int | abjad.typings.Duration) -> None:
     """
     if isinstance(denominator, tuple):
         denominator = abjad.Duration(denominator)
-    for tuplet in abjad.select.tuplets(argument):
+
+    def function(tuplet):
         if isinstance(denominator, abjad.Duration):
             unit_duration = denominator
             assert unit_duration.numerator == 1
@@ -1946,27 +2781,21 @@ def denominator(argument, denominator: int | abjad.typings.Duration) -> None:
         else:
             raise Exception(f"invalid preferred denominator: {denominator!r}.")
 
+    _update_tuplets(argument, function)
+
 
+@_instrumentation._instrumented
 def duration_bracket(argument) -> None:
     """
     Applies duration bracket to tuplets in ``argument``.
     """
     for tuplet in abjad.select.tuplets(argument):
-        duration_ = abjad.get.duration(tuplet)
-        components = abjad.makers.make_leaves([0], [duration_])
-        if all(isinstance(_, abjad.Note) for _ in components):
-            durations = [abjad.get.duration(_) for _ in components]
-            strings = [_.lilypond_duration_string for _ in durations]
-            strings = [rf"\rhythm {{ {_} }}" for _ in strings]
-            string = " + ".join(strings)
-            if "+" in string:
-                string = f"{{ {string} }}"
-        else:
-            string = abjad.illustrators.components_to_score_markup_string(components)
-        string = rf"\markup \scale #'(0.75 . 0.75) {string}"
+        duration = abjad.get.duration(tuplet)
+        string = _get_duration_bracket_string(duration)
         abjad.override(tuplet).TupletNumber.text = string
 
 
+@_instrumentation._instrumented
 def example(
     components: typing.Sequence[abjad.Component],
     time_signatures: typing.Sequence[abjad.TimeSignature],
@@ -1984,7 +2813,10 @@ def example(
         time_signatures
     )
     assert all(isinstance(_, str) for _ in includes), repr(includes)
-    lilypond_file = abjad.illustrators.components(components, time_signatures)
+    if not time_signatures:
+        lilypond_file = abjad.illustrators.components(components)
+    else:
+        lilypond_file = _make_example_lilypond_file(components, time_signatures)
     includes = [rf'\include "{_}"' for _ in includes]
     lilypond_file.items[0:0] = includes
     staff = lilypond_file["Staff"]
@@ -1993,6 +2825,7 @@ def example(
     return lilypond_file
 
 
+@_instrumentation._instrumented
 def extract_rest_filled(argument) -> None:
     """
     Extracts rest-filled tuplets from ``argument``.
@@ -2003,6 +2836,7 @@ def extract_rest_filled(argument) -> None:
             abjad.mutate.extract(tuplet)
 
 
+@_instrumentation._instrumented
 def extract_trivial(argument) -> None:
     r"""
     Extracts trivial tuplets from ``argument``.
@@ -2079,6 +2913,7 @@ def extract_trivial(argument) -> None:
             abjad.mutate.extract(tuplet)
 
 
+@_instrumentation._instrumented
 def feather_beam(
     argument,
     *,
@@ -2148,6 +2983,64 @@ def feather_beam(
             abjad.override(first_leaf).Beam.grow_direction = abjad.LEFT
 
 
+@_instrumentation._instrumented
+def fingerprint(
+    argument: abjad.Component | typing.Sequence[abjad.Component],
+    *,
+    tags: bool = False,
+) -> str:
+    r"""
+    Gets fingerprint of rhythmic structure of ``argument``.
+
+    ..  container:: example
+
+        >>> durations = [abjad.Duration(3, 8), abjad.Duration(4, 8)]
+        >>> tuplets = rmakers.talea(durations, [1, 2, 3], 16, extra_counts=[0, 1])
+        >>> rmakers.beam(tuplets)
+        >>> string = rmakers.fingerprint(tuplets)
+        >>> len(string)
+        32
+
+        Fingerprints are equal when rhythmic structure is equal:
+
+        >>> tuplets_ = rmakers.talea(durations, [1, 2, 3], 16, extra_counts=[0, 1])
+        >>> rmakers.beam(tuplets_)
+        >>> rmakers.fingerprint(tuplets_) == string
+        True
+
+        Pitches do not count; ties, beams and durations do:
+
+        >>> abjad.mutate.transpose(tuplets_, 2)
+        >>> rmakers.fingerprint(tuplets_) == string
+        True
+
+        >>> rmakers.unbeam(tuplets_)
+        >>> rmakers.fingerprint(tuplets_) == string
+        False
+
+    Reads container types, tuplet multipliers, tuplet denominators,
+    force-fraction and hide settings, leaf types, written durations,
+    leaf multipliers, grace music, ties and beams in a single traversal.
+    Includes component tags, and the tags of tie and beam indicators, when
+    ``tags`` is true.
+
+    Fingerprints are hex digests and are stable across processes, so they may
+    be stored and compared later.
+    """
+    if isinstance(argument, abjad.Component):
+        components = [argument]
+    else:
+        components = list(argument)
+    assert all(isinstance(_, abjad.Component) for _ in components), repr(components)
+    assert isinstance(tags, bool), repr(tags)
+    tokens = []
+    for component in components:
+        tokens.extend(_iterate_fingerprint_tokens(component, tags))
+    string = " ".join(tokens)
+    return hashlib.blake2b(string.encode(), digest_size=16).hexdigest()
+
+
+@_instrumentation._instrumented
 def force_augmentation(argument) -> None:
     r"""
     Spells tuplets in ``argument`` as augmentations.
@@ -2293,11 +3186,15 @@ def force_augmentation(argument) -> None:
             }
 
     """
-    for tuplet in abjad.select.tuplets(argument):
+
+    def function(tuplet):
         if not tuplet.augmentation():
             tuplet.toggle_prolation()
 
+    _update_tuplets(argument, function)
 
+
+@_instrumentation._instrumented
 def force_diminution(argument) -> None:
     r"""
     Spells tuplets in ``argument`` as diminutions.
@@ -2458,11 +3355,15 @@ def force_diminution(argument) -> None:
             }
 
     """
-    for tuplet in abjad.select.tuplets(argument):
+
+    def function(tuplet):
         if not tuplet.diminution():
             tuplet.toggle_prolation()
 
+    _update_tuplets(argument, function)
+
 
+@_instrumentation._instrumented
 def force_fraction(argument) -> None:
     """
     Sets ``force_fraction=True`` on tuplets in ``argument``.
@@ -2471,6 +3372,7 @@ def force_fraction(argument) -> None:
         tuplet.force_fraction = True
 
 
+@_instrumentation._instrumented
 def force_note(argument, *, tag: abjad.Tag | None = None) -> None:
     r"""
     Replaces leaves in ``argument`` with notes.
@@ -2586,6 +3488,7 @@ def force_note(argument, *, tag: abjad.Tag | None = None) -> None:
         abjad.mutate.replace(leaf, [note])
 
 
+@_instrumentation._instrumented
 def force_repeat_tie(
     argument,
     *,
@@ -2776,6 +3679,7 @@ def force_repeat_tie(
         abjad.attach(repeat_tie, leaf, tag=tag)
 
 
+@_instrumentation._instrumented
 def force_rest(argument, *, tag: abjad.Tag | None = None) -> None:
     r"""
     Replaces leaves in ``argument`` with rests.
@@ -3106,6 +4010,7 @@ def force_rest(argument, *, tag: abjad.Tag | None = None) -> None:
             abjad.detach(abjad.RepeatTie, next_leaf)
 
 
+@_instrumentation._instrumented
 def hide_skip_filled(argument) -> None:
     """
     Hides skip-filled tuplets in ``argument``.
@@ -3116,6 +4021,7 @@ def hide_skip_filled(argument) -> None:
             tuplet.hide = True
 
 
+@_instrumentation._instrumented
 def hide_trivial(argument) -> None:
     r"""
     Hides trivial tuplets in ``argument``.
@@ -3198,6 +4104,7 @@ def hide_trivial(argument) -> None:
             tuplet.hide = True
 
 
+@_instrumentation._instrumented
 def invisible_music(argument, *, tag: abjad.Tag | None = None) -> None:
     """
     Makes ``argument`` invisible.
@@ -3213,6 +4120,7 @@ def invisible_music(argument, *, tag: abjad.Tag | None = None) -> None:
         abjad.attach(literal_2, leaf, tag=tag_2)
 
 
+@_instrumentation._instrumented
 def interpolate(
     start_duration: abjad.typings.Duration,
     stop_duration: abjad.typings.Duration,
@@ -3228,6 +4136,7 @@ def interpolate(
     )
 
 
+@_instrumentation._instrumented
 def nongrace_leaves_in_each_tuplet(
     argument, *, level: int = -1
 ) -> list[list[abjad.Leaf]]:
@@ -3242,6 +4151,7 @@ def nongrace_leaves_in_each_tuplet(
     return lists
 
 
+@_instrumentation._instrumented
 def on_beat_grace_container(
     voice: abjad.Voice,
     voice_name: str,
@@ -3614,6 +4524,7 @@ def on_beat_grace_container(
         )
 
 
+@_instrumentation._instrumented
 def repeat_tie(argument, *, tag: abjad.Tag | None = None) -> None:
     r"""
     Attaches repeat-ties to pitched leaves in ``argument``.
@@ -3821,32 +4732,40 @@ def repeat_tie(argument, *, tag: abjad.Tag | None = None) -> None:
         abjad.attach(tie, leaf, tag=tag)
 
 
+@_instrumentation._instrumented
 def reduce_multiplier(argument) -> None:
     """
     Reduces multipliers of tuplets in ``argument``.
     """
-    for tuplet in abjad.select.tuplets(argument):
+
+    def function(tuplet):
         fraction = abjad.Fraction(*tuplet.multiplier)
         pair = fraction.numerator, fraction.denominator
         tuplet.multiplier = pair
 
+    _update_tuplets(argument, function)
 
+
+@_instrumentation._instrumented
 def rewrite_dots(argument, *, tag: abjad.Tag | None = None) -> None:
     """
     Rewrites dots of tuplets in ``argument``.
     """
     tag = tag or abjad.Tag()
     tag = tag.append(_function_name(inspect.currentframe()))
-    for tuplet in abjad.select.tuplets(argument):
-        tuplet.rewrite_dots()
+    _update_tuplets(argument, abjad.Tuplet.rewrite_dots)
 
 
+@_instrumentation._instrumented
 def rewrite_meter(
     voice: abjad.Voice,
     *,
     boundary_depth: int | None = None,
+    cancellation: _classes.Cancellation | None = None,
+    progress: typing.Callable[[int, int], None] | None = None,
     reference_meters: typing.Sequence[abjad.Meter] = (),
     tag: abjad.Tag | None = None,
+    workers: int | None = None,
 ) -> None:
     r"""
     Rewrites meter of components in ``voice``.
@@ -3929,60 +4848,114 @@ def rewrite_meter(
                 }
             }
 
+    Rewrites measures in ``workers`` processes when ``workers`` is greater
+    than 1: copies each measure that needs rewriting to a worker process and
+    splices the rewritten measure back into ``voice`` in order. Output matches
+    the serial path; leaves in rewritten measures are new objects.
+
+    Rewrites a copy of the contents of ``voice`` when ``cancellation`` is set:
+    checks ``cancellation`` before each measure and raises
+    ``rmakers.Cancelled``, leaving ``voice`` unchanged, once it is cancelled;
+    otherwise splices rewritten copies of changed measures back into
+    ``voice``. Leaves in unchanged measures stay the same objects.
+    Calls ``progress`` with number of measures rewritten so far and number of
+    measures to rewrite after each measure.
     """
     tag = tag or abjad.Tag()
     tag = tag.append(_function_name(inspect.currentframe()))
     assert isinstance(voice, abjad.Container), repr(voice)
+    if workers is not None:
+        assert isinstance(workers, int) and 0 < workers, repr(workers)
     staff = abjad.get.parentage(voice).parent
     assert isinstance(staff, abjad.Staff), repr(staff)
     time_signature_voice = staff["TimeSignatureVoice"]
     assert isinstance(time_signature_voice, abjad.Voice)
     meters, preferred_meters = [], []
-    for skip in time_signature_voice:
-        time_signature = abjad.get.indicator(skip, abjad.TimeSignature)
-        rtc = abjad.meter.make_best_guess_rtc(time_signature.pair)
-        meter = abjad.Meter(rtc)
-        meters.append(meter)
-    durations = [abjad.Duration(_) for _ in meters]
+    pairs_to_meters: dict[tuple[int, int], abjad.Meter] = {}
+    with _instrumentation._span("make_meters"):
+        for skip in time_signature_voice:
+            time_signature = abjad.get.indicator(skip, abjad.TimeSignature)
+            meter = pairs_to_meters.get(time_signature.pair)
+            if meter is None:
+                rtc = abjad.meter.make_best_guess_rtc(time_signature.pair)
+                meter = abjad.Meter(rtc)
+                pairs_to_meters[time_signature.pair] = meter
+            meters.append(meter)
+    durations = [abjad.Duration(_.pair) for _ in meters]
     reference_meters = reference_meters or ()
-    split_measures(voice, durations=durations)
-    lists = abjad.select.group_by_measure(voice[:])
-    assert all(isinstance(_, list) for _ in lists), repr(lists)
-    for meter, list_ in zip(meters, lists):
-        for reference_meter in reference_meters:
-            if reference_meter.pair == meter.pair:
-                meter = reference_meter
-                break
-        preferred_meters.append(meter)
-        nontupletted_leaves = []
-        for leaf in abjad.iterate.leaves(list_):
-            if not abjad.get.parentage(leaf).count(abjad.Tuplet):
-                nontupletted_leaves.append(leaf)
-        unbeam(nontupletted_leaves)
-        meter.rewrite(
-            list_,
-            boundary_depth=boundary_depth,
-            rewrite_tuplets=False,
-        )
-    lists = abjad.select.group_by_measure(voice[:])
-    for meter, list_ in zip(preferred_meters, lists):
-        leaves = abjad.select.leaves(list_, grace=False)
-        beat_durations = []
-        beat_offsets = meter.depthwise_offset_inventory[1]
-        for start, stop in abjad.sequence.nwise(beat_offsets):
-            beat_duration = stop - start
-            beat_durations.append(beat_duration)
-        beamable_groups = _make_beamable_groups(leaves, beat_durations)
-        for beamable_group in beamable_groups:
-            if not beamable_group:
+    container, segments = voice, []
+    if cancellation is not None:
+        cancellation.check()
+        segments = _get_measure_segments(voice[:], durations)
+        container = abjad.Voice([abjad.mutate.copy(_) for _ in voice[:]])
+    split_measures(container, durations=durations)
+    with _instrumentation._span("rewrite_measures"):
+        lists = _get_measure_lists(container[:], durations)
+        assert all(isinstance(_, list) for _ in lists), repr(lists)
+        jobs = []
+        for meter, list_ in zip(meters, lists):
+            if cancellation is not None:
+                cancellation.check()
+            for reference_meter in reference_meters:
+                if reference_meter.pair == meter.pair:
+                    meter = reference_meter
+                    break
+            preferred_meters.append(meter)
+            if all(isinstance(_, abjad.Tuplet) for _ in list_):
                 continue
-            abjad.beam(
-                beamable_group,
-                beam_rests=False,
-                tag=tag,
-            )
-
-
+            nontupletted_leaves = []
+            for leaf in abjad.iterate.leaves(list_):
+                if not abjad.get.parentage(leaf).count(abjad.Tuplet):
+                    nontupletted_leaves.append(leaf)
+            unbeam(nontupletted_leaves)
+            jobs.append((meter, list_))
+        _rewrite_measures(
+            container, jobs, boundary_depth, workers, cancellation, progress
+        )
+    with _instrumentation._span("beam_measures"):
+        lists = _get_measure_lists(container[:], durations)
+        meters_to_beat_durations: dict[int, list[abjad.Duration]] = {}
+        keys_to_slices: dict[typing.Any, list[slice]] = {}
+        for meter, list_ in zip(preferred_meters, lists):
+            if cancellation is not None:
+                cancellation.check()
+            leaves = abjad.select.leaves(list_, grace=False)
+            beat_durations = meters_to_beat_durations.get(id(meter))
+            if beat_durations is None:
+                beat_durations = []
+                beat_offsets = meter.depthwise_offset_inventory[1]
+                for start, stop in abjad.sequence.nwise(beat_offsets):
+                    beat_duration = stop - start
+                    beat_durations.append(beat_duration)
+                meters_to_beat_durations[id(meter)] = beat_durations
+            key = _get_rhythm_key(list_)
+            if key is not None:
+                key = (id(meter), key)
+            slices = keys_to_slices.get(key)
+            if slices is None:
+                beamable_groups = _make_beamable_groups(leaves, beat_durations)
+                leaf_to_index = {id(_): i for i, _ in enumerate(leaves)}
+                slices = []
+                for beamable_group in beamable_groups:
+                    if not beamable_group:
+                        continue
+                    group = beamable_group[0]
+                    start = leaf_to_index[id(group[0])] if group else 0
+                    slices.append(slice(start, start + len(group)))
+                if key is not None:
+                    keys_to_slices[key] = slices
+            for slice_ in slices:
+                beamable_group = [leaves[slice_]]
+                abjad.beam(
+                    beamable_group,
+                    beam_rests=False,
+                    tag=tag,
+                )
+    if container is not voice:
+        _replace_changed_segments(voice, segments, container)
+
+
+@_instrumentation._instrumented
 def rewrite_rest_filled(
     argument, *, spelling=None, tag: abjad.Tag | None = None
 ) -> None:
@@ -4309,30 +5282,18 @@ def rewrite_rest_filled(
     """
     tag = tag or abjad.Tag()
     tag = tag.append(_function_name(inspect.currentframe()))
-    if spelling is not None:
-        increase_monotonic = spelling.increase_monotonic
-        forbidden_note_duration = spelling.forbidden_note_duration
-        forbidden_rest_duration = spelling.forbidden_rest_duration
-    else:
-        increase_monotonic = None
-        forbidden_note_duration = None
-        forbidden_rest_duration = None
+    if spelling is None:
+        spelling = _classes.Spelling()
     for tuplet in abjad.select.tuplets(argument):
         if not tuplet.rest_filled():
             continue
         duration = abjad.get.duration(tuplet)
-        rests = abjad.makers.make_leaves(
-            [None],
-            [duration],
-            increase_monotonic=increase_monotonic,
-            forbidden_note_duration=forbidden_note_duration,
-            forbidden_rest_duration=forbidden_rest_duration,
-            tag=tag,
-        )
+        rests = _makers._make_leaves(duration, None, spelling=spelling, tag=tag)
         abjad.mutate.replace(tuplet[:], rests)
         tuplet.multiplier = (1, 1)
 
 
+@_instrumentation._instrumented
 def rewrite_sustained(argument, *, tag: abjad.Tag | None = None) -> None:
     r"""
     Rewrites sustained tuplets in ``argument``.
@@ -4687,6 +5648,7 @@ def rewrite_sustained(argument, *, tag: abjad.Tag | None = None) -> None:
         tuplet.multiplier = (1, 1)
 
 
+@_instrumentation._instrumented
 def split_measures(voice, *, durations=None, tag: abjad.Tag | None = None) -> None:
     r"""
     Splits measures in ``voice``.
@@ -4706,16 +5668,22 @@ def split_measures(voice, *, durations=None, tag: abjad.Tag | None = None) -> No
         assert isinstance(voice_, abjad.Voice)
         durations = [abjad.get.duration(_) for _ in voice_]
     total_duration = sum(durations)
-    music_duration = abjad.get.duration(voice)
+    components = voice[:]
+    component_durations = [abjad.get.duration(_) for _ in components]
+    music_duration = sum(component_durations)
     if total_duration != music_duration:
         message = f"Total duration of splits is {total_duration!s}"
         message += f" but duration of music is {music_duration!s}:"
         message += f"\ndurations: {durations}."
         message += f"\nvoice: {voice[:]}."
         raise Exception(message)
-    abjad.mutate.split(voice[:], durations=durations)
+    for component, durations_ in _get_measure_crossings(
+        components, component_durations, durations
+    ):
+        abjad.mutate.split([component], durations=durations_)
 
 
+@_instrumentation._instrumented
 def swap_length_1(argument) -> None:
     """
     Swaps length-1 tuplets in ``argument`` with containers.
@@ -4727,6 +5695,7 @@ def swap_length_1(argument) -> None:
             abjad.mutate.swap(tuplet, container)
 
 
+@_instrumentation._instrumented
 def swap_skip_filled(argument) -> None:
     """
     Swaps skip-filled tuplets in ``argument`` with containers.
@@ -4738,6 +5707,7 @@ def swap_skip_filled(argument) -> None:
             abjad.mutate.swap(tuplet, container)
 
 
+@_instrumentation._instrumented
 def swap_trivial(argument) -> None:
     r"""
     Swaps trivial tuplets in ``argument`` with containers.
@@ -4819,6 +5789,7 @@ def swap_trivial(argument) -> None:
             abjad.mutate.swap(tuplet, container)
 
 
+@_instrumentation._instrumented
 def tie(argument, *, tag: abjad.Tag | None = None) -> None:
     r"""
     Attaches ties to pitched leaves in ``argument``.
@@ -5222,6 +6193,7 @@ def tie(argument, *, tag: abjad.Tag | None = None) -> None:
         abjad.attach(tie, leaf, tag=tag)
 
 
+@_instrumentation._instrumented
 def time_signatures(pairs: list[tuple[int, int]]) -> list[abjad.TimeSignature]:
     """
     Makes time signatures from ``pairs``.
@@ -5232,6 +6204,66 @@ def time_signatures(pairs: list[tuple[int, int]]) -> list[abjad.TimeSignature]:
     return [abjad.TimeSignature(_) for _ in pairs]
 
 
+@_instrumentation._instrumented
+def to_lilypond(argument: abjad.Component | typing.Sequence[abjad.Component]) -> str:
+    r"""
+    Gets LilyPond format of ``argument`` without formatting every leaf.
+
+    ..  container:: example
+
+        >>> time_signatures = rmakers.time_signatures([(3, 8), (4, 8)])
+        >>> durations = [abjad.Duration(_) for _ in time_signatures]
+        >>> tuplets = rmakers.talea(durations, [1, 2, 3], 16, extra_counts=[0, 1])
+        >>> voice = rmakers.wrap_in_time_signature_staff(tuplets, time_signatures)
+        >>> rmakers.beam(voice)
+        >>> string = rmakers.to_lilypond(voice)
+        >>> print(string)
+        \context Voice = "RhythmMaker.Music"
+        {
+            \tweak text #tuplet-number::calc-fraction-text
+            \tuplet 1/1
+            {
+                c'16
+                [
+                c'8
+                c'8.
+                ]
+            }
+            \tuplet 9/8
+            {
+                c'16
+                [
+                c'8
+                c'8.
+                c'16
+                c'8
+                ]
+            }
+        }
+
+        >>> string == abjad.lilypond(voice)
+        True
+
+    Formats each distinct leaf once and reuses the result for leaves with the
+    same type, pitch, duration, multiplier and indicators; formats tuplet and
+    context brackets once per distinct shell. Formats the brackets of
+    containers with overrides, tweaks or indicators once per container, from
+    a copy that holds one skip; formats leaves with grace music, and leaves in
+    containers with indicators, with ``abjad.lilypond()``.
+
+    Joins the formats of components in a list with newlines.
+    """
+    if isinstance(argument, abjad.Component):
+        components = [argument]
+    else:
+        components = list(argument)
+    assert all(isinstance(_, abjad.Component) for _ in components), repr(components)
+    cache: dict = {}
+    lines = _iterate_lilypond_file_lines(components, cache)
+    return "\n".join(lines)
+
+
+@_instrumentation._instrumented
 def tremolo_container(argument, count: int, *, tag: abjad.Tag | None = None) -> None:
     r"""
     Replaces pitched leaves in ``argument`` with tremolo containers.
@@ -5396,6 +6428,7 @@ def tremolo_container(argument, count: int, *, tag: abjad.Tag | None = None) ->
         abjad.mutate.replace(leaf, container)
 
 
+@_instrumentation._instrumented
 def trivialize(argument) -> None:
     r"""
     Trivializes tuplets in ``argument``.
@@ -5694,10 +6727,10 @@ def trivialize(argument) -> None:
             }
 
     """
-    for tuplet in abjad.select.tuplets(argument):
-        tuplet.trivialize()
+    _update_tuplets(argument, abjad.Tuplet.trivialize)
 
 
+@_instrumentation._instrumented
 def unbeam(argument, *, smart: bool = False, tag: abjad.Tag | None = None) -> None:
     r"""
     Unbeams leaves in ``argument``.
@@ -6490,6 +7523,7 @@ def unbeam(argument, *, smart: bool = False, tag: abjad.Tag | None = None) -> No
             abjad.attach(abjad.StartBeam(), leaf, tag=tag)
 
 
+@_instrumentation._instrumented
 def untie(argument) -> None:
     r"""
     Unties leaves in ``argument``.
@@ -6706,6 +7740,7 @@ def untie(argument) -> None:
         abjad.detach(abjad.RepeatTie, leaf)
 
 
+@_instrumentation._instrumented
 def wrap_in_time_signature_staff(
     components, time_signatures: list[abjad.TimeSignature]
 ) -> abjad.Voice:
@@ -6727,6 +7762,100 @@ def wrap_in_time_signature_staff(
     return music_voice
 
 
+@_instrumentation._instrumented
+def write_lilypond(
+    argument: abjad.Component | typing.Sequence[abjad.Component] | abjad.LilyPondFile,
+    file: typing.TextIO,
+    *,
+    buffer_size: int = 65536,
+) -> None:
+    r"""
+    Writes LilyPond format of ``argument`` to ``file`` line by line.
+
+    ..  container:: example
+
+        >>> import io
+        >>> time_signatures = rmakers.time_signatures([(3, 8), (4, 8)])
+        >>> durations = [abjad.Duration(_) for _ in time_signatures]
+        >>> tuplets = rmakers.talea(durations, [1, 2, 3], 16, extra_counts=[0, 1])
+        >>> lilypond_file = rmakers.example(tuplets, time_signatures)
+        >>> lilypond_file.lilypond_version_token = r'\version "2.25.0"'
+        >>> file = io.StringIO()
+        >>> rmakers.write_lilypond(lilypond_file, file)
+        >>> print(file.getvalue())
+        \version "2.25.0"
+        \language "english"
+        \include "abjad.ily"
+        \layout
+        {
+            \context
+            {
+                \Score
+                proportionalNotationDuration = \musicLength 1*1/24
+            }
+        }
+        <BLANKLINE>
+        \context Score = "Score"
+        {
+            \context RhythmicStaff = "Staff"
+            \with
+            {
+                \override Clef.stencil = ##f
+            }
+            {
+                \context Voice = "Voice"
+                {
+                    \tweak text #tuplet-number::calc-fraction-text
+                    \tuplet 1/1
+                    {
+                        \time 3/8
+                        c'16
+                        c'8
+                        c'8.
+                    }
+                    \tuplet 9/8
+                    {
+                        \time 4/8
+                        c'16
+                        c'8
+                        c'8.
+                        c'16
+                        c'8
+                    }
+                }
+            }
+        }
+
+        >>> file.getvalue() == abjad.lilypond(lilypond_file)
+        True
+
+    Accepts a component, a list of components or a LilyPondFile, and writes
+    the same string as ``abjad.lilypond()``. Formats tuplets and leaves one
+    at a time as in ``rmakers.to_lilypond()``; holds at most ``buffer_size``
+    characters of output before calling ``file.write()``, so the format of
+    the whole score is never held in memory. Formats LilyPondFile tokens and
+    blocks with ``abjad.lilypond()`` and streams the components in them.
+    """
+    assert isinstance(buffer_size, int) and 0 < buffer_size, repr(buffer_size)
+    cache: dict = {}
+    lines = _iterate_lilypond_file_lines(argument, cache)
+    buffer: list[str] = []
+    length = 0
+    for i, line in enumerate(lines):
+        if 0 < i:
+            buffer.append("\n")
+            length += 1
+        buffer.append(line)
+        length += len(line)
+        if buffer_size <= length:
+            file.write("".join(buffer))
+            buffer.clear()
+            length = 0
+    if buffer:
+        file.write("".join(buffer))
+
+
+@_instrumentation._instrumented
 def written_duration(argument, duration: abjad.typings.Duration) -> None:
     """
     Sets written duration of leaves in ``argument``.
@@ -0,0 +1,330 @@
+"""
+The rmakers instrumentation.
+"""
+
+import contextlib
+import dataclasses
+import functools
+import gc
+import json
+import os
+import threading
+import time
+import typing
+
+import abjad
+
+_null_span = contextlib.nullcontext()
+
+_reports: list["Report"] = []
+
+_traces: list["Trace"] = []
+
+
+class _Span:
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exception):
+        stop = time.perf_counter_ns()
+        for trace in _traces:
+            trace._add(self.name, self.start, stop)
+
+
+def _call(name, function, arguments, keywords):
+    with _span(name):
+        if not _reports:
+            return function(*arguments, **keywords)
+        argument = arguments[0] if arguments else None
+        input_sizes = _measure(argument)
+        start = time.perf_counter()
+        result = function(*arguments, **keywords)
+        seconds = time.perf_counter() - start
+        if result is None:
+            output_sizes = _measure(argument)
+        else:
+            output_sizes = _measure(result)
+        for report in _reports:
+            report._record(name, seconds, input_sizes, output_sizes)
+        return result
+
+
+def _instrumented(function):
+    name = f"rmakers.{function.__name__}()"
+
+    @functools.wraps(function)
+    def wrapper(*arguments, **keywords):
+        if not _reports and not _traces:
+            return function(*arguments, **keywords)
+        return _call(name, function, arguments, keywords)
+
+    return wrapper
+
+
+def _measure(argument) -> tuple[int, int, int]:
+    if isinstance(argument, abjad.LilyPondFile):
+        argument = [_ for _ in argument.items if isinstance(_, abjad.Component)]
+    if isinstance(argument, abjad.Component):
+        components: typing.Any = argument
+    elif isinstance(argument, list | tuple) and argument:
+        if all(isinstance(_, abjad.Duration) for _ in argument):
+            return len(argument), 0, 0
+        if not all(isinstance(_, abjad.Component | list) for _ in argument):
+            return 0, 0, 0
+        components = argument
+    else:
+        return 0, 0, 0
+    leaves = abjad.select.leaves(components)
+    tuplets = abjad.select.tuplets(components)
+    return 0, len(leaves), len(tuplets)
+
+
+def _span(name):
+    if not _traces:
+        return _null_span
+    return _Span(name)
+
+
+@dataclasses.dataclass(slots=True)
+class Report:
+    """
+    Instrumentation report.
+
+    ..  container:: example
+
+        >>> report = rmakers.Report()
+        >>> report.counters
+        {}
+
+    Maps the name of each public maker and command to counters:
+
+    * ``calls``: number of calls
+    * ``seconds``: total wall time, including calls made by the function
+    * ``input_durations``, ``input_leaves``, ``input_tuplets``: total size of
+      first argument
+    * ``output_leaves``, ``output_tuplets``: total size of return value, or of
+      first argument when function returns none
+
+    """
+
+    counters: dict[str, dict[str, int | float]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    __documentation_section__ = "Instrumentation"
+
+    def _record(self, name, seconds, input_sizes, output_sizes) -> None:
+        counter = self.counters.get(name)
+        if counter is None:
+            counter = {
+                "calls": 0,
+                "seconds": 0.0,
+                "input_durations": 0,
+                "input_leaves": 0,
+                "input_tuplets": 0,
+                "output_leaves": 0,
+                "output_tuplets": 0,
+            }
+            self.counters[name] = counter
+        counter["calls"] += 1
+        counter["seconds"] += seconds
+        counter["input_durations"] += input_sizes[0]
+        counter["input_leaves"] += input_sizes[1]
+        counter["input_tuplets"] += input_sizes[2]
+        counter["output_leaves"] += output_sizes[1]
+        counter["output_tuplets"] += output_sizes[2]
+
+    def to_json(self, *, indent: int | None = None) -> str:
+        """
+        Changes report to JSON string; functions sort by name.
+
+        ..  container:: example
+
+            >>> report = rmakers.Report()
+            >>> report.to_json()
+            '{}'
+
+        """
+        return json.dumps(self.counters, indent=indent, sort_keys=True)
+
+
+@dataclasses.dataclass(slots=True)
+class Trace:
+    """
+    Trace of timed spans.
+
+    ..  container:: example
+
+        >>> trace = rmakers.Trace()
+        >>> trace.events
+        []
+
+    Holds one Chrome trace event for each span. Events are complete events
+    (``"ph": "X"``) with timestamps and durations in microseconds; load
+    ``to_json()`` output in Perfetto or ``chrome://tracing``.
+    """
+
+    events: list[dict] = dataclasses.field(default_factory=list)
+    start: int = dataclasses.field(default_factory=time.perf_counter_ns)
+
+    __documentation_section__ = "Instrumentation"
+
+    def _add(self, name, start, stop) -> None:
+        event = {
+            "name": name,
+            "cat": "rmakers",
+            "ph": "X",
+            "ts": (start - self.start) / 1000,
+            "dur": (stop - start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        self.events.append(event)
+
+    def to_json(self, *, indent: int | None = None) -> str:
+        """
+        Changes trace to Chrome trace-event JSON string.
+
+        ..  container:: example
+
+            >>> trace = rmakers.Trace()
+            >>> trace.to_json()
+            '{"displayTimeUnit": "ms", "traceEvents": []}'
+
+        """
+        dictionary = {"displayTimeUnit": "ms", "traceEvents": self.events}
+        return json.dumps(dictionary, indent=indent, sort_keys=True)
+
+
+@contextlib.contextmanager
+def bulk(*, freeze: bool = False) -> typing.Iterator[None]:
+    """
+    Pauses cyclic garbage collection in the ``with`` block.
+
+    ..  container:: example
+
+        >>> time_signatures = rmakers.time_signatures([(3, 8), (4, 8)])
+        >>> durations = [abjad.Duration(_) for _ in time_signatures]
+        >>> with rmakers.bulk():
+        ...     tuplets = rmakers.talea(durations, [1, 2, 3], 16)
+        ...     voice = rmakers.wrap_in_time_signature_staff(tuplets, time_signatures)
+        ...     rmakers.rewrite_meter(voice)
+        ...
+
+        >>> import gc
+        >>> gc.isenabled()
+        True
+
+    Score components refer to each other through parent pointers, so building
+    large scores makes the garbage collector scan many live objects many times.
+    Restores collection as configured before the block at the end of the
+    block; cycles left unreachable in the block are collected after that.
+
+    Moves every object alive at the end of the block to the permanent
+    generation when ``freeze=True``, so later collections skip the score, too.
+    Frozen objects are never collected until ``gc.unfreeze()``; freeze only
+    scores that live until the end of the program.
+
+    Pauses collection for all threads.
+    """
+    assert isinstance(freeze, bool), repr(freeze)
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if freeze is True:
+            gc.freeze()
+        if enabled:
+            gc.enable()
+
+
+@contextlib.contextmanager
+def instrument() -> typing.Iterator[Report]:
+    """
+    Records calls to public makers and commands in the ``with`` block.
+
+    ..  container:: example
+
+        >>> time_signatures = rmakers.time_signatures([(3, 8), (4, 8)])
+        >>> durations = [abjad.Duration(_) for _ in time_signatures]
+        >>> with rmakers.instrument() as report:
+        ...     tuplets = rmakers.talea(durations, [1, 2, 3], 16)
+        ...     voice = rmakers.wrap_in_time_signature_staff(tuplets, time_signatures)
+        ...     rmakers.beam(voice)
+        ...     rmakers.extract_trivial(voice)
+        ...
+
+        >>> for name, counter in report.counters.items():
+        ...     name, counter["calls"], counter["input_durations"], counter["output_leaves"]
+        ...
+        ('rmakers.talea()', 1, 2, 8)
+        ('rmakers.wrap_in_time_signature_staff()', 1, 0, 8)
+        ('rmakers.unbeam()', 2, 0, 8)
+        ('rmakers.beam()', 1, 0, 8)
+        ('rmakers.extract_trivial()', 1, 0, 8)
+
+        >>> string = report.to_json(indent=4)
+
+    Counts calls made by other functions, too; times are inclusive. Functions
+    do no bookkeeping outside ``rmakers.instrument()`` blocks.
+    """
+    report = Report()
+    _reports.append(report)
+    try:
+        yield report
+    finally:
+        _reports.remove(report)
+
+
+@contextlib.contextmanager
+def trace() -> typing.Iterator[Trace]:
+    """
+    Traces public makers and commands, and their stages, in the ``with``
+    block.
+
+    ..  container:: example
+
+        >>> time_signatures = rmakers.time_signatures([(3, 8), (4, 8)])
+        >>> durations = [abjad.Duration(_) for _ in time_signatures]
+        >>> with rmakers.trace() as trace:
+        ...     tuplets = rmakers.talea(durations, [1, 2, 3], 16)
+        ...     voice = rmakers.wrap_in_time_signature_staff(tuplets, time_signatures)
+        ...     rmakers.rewrite_meter(voice)
+        ...
+
+        >>> for event in trace.events:
+        ...     event["name"]
+        ...
+        'scale_input'
+        'make_numerator_lists'
+        'make_leaves'
+        'apply_ties'
+        'normalize_multipliers'
+        'rmakers.talea()'
+        'rmakers.wrap_in_time_signature_staff()'
+        'make_meters'
+        'rmakers.split_measures()'
+        'rewrite_measures'
+        'beam_measures'
+        'rmakers.rewrite_meter()'
+
+        >>> string = trace.to_json()
+
+    Spans end in the order listed. Stages check one list and do nothing else
+    outside ``rmakers.trace()`` blocks.
+    """
+    trace = Trace()
+    _traces.append(trace)
+    try:
+        yield trace
+    finally:
+        _traces.remove(trace)
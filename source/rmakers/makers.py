@@ -2,6 +2,7 @@
 Makers.
 """
 
+import functools
 import inspect
 import math
 import types
@@ -10,6 +11,7 @@ import typing
 import abjad
 
 from . import classes as _classes
+from . import instrumentation as _instrumentation
 
 
 def _apply_ties_to_split_notes(
@@ -19,70 +21,31 @@ def _apply_ties_to_split_notes(
     unscaled_talea,
     talea,
 ):
-    leaves = abjad.select.leaves(tuplets)
-    written_durations = [leaf.written_duration for leaf in leaves]
-    written_durations = list(written_durations)
-    total_duration = abjad.sequence.weight(written_durations)
-    preamble_weights = []
-    if unscaled_preamble:
-        preamble_weights = []
-        for numerator in unscaled_preamble:
-            pair = (numerator, talea.denominator)
-            duration = abjad.Duration(*pair)
-            weight = abs(duration)
-            preamble_weights.append(weight)
-    preamble_duration = sum(preamble_weights)
-    if total_duration <= preamble_duration:
-        preamble_parts = abjad.sequence.partition_by_weights(
-            written_durations,
-            weights=preamble_weights,
-            allow_part_weights=abjad.MORE,
-            cyclic=True,
-            overhang=True,
-        )
-        talea_parts = []
-    else:
-        assert preamble_duration < total_duration
-        preamble_parts = abjad.sequence.partition_by_weights(
-            written_durations,
-            weights=preamble_weights,
-            allow_part_weights=abjad.EXACT,
-            cyclic=False,
-            overhang=False,
-        )
-        talea_weights = []
-        for numerator in unscaled_talea:
-            pair = (numerator, talea.denominator)
-            weight = abs(abjad.Duration(*pair))
-            talea_weights.append(weight)
-        preamble_length = len(abjad.sequence.flatten(preamble_parts))
-        talea_written_durations = written_durations[preamble_length:]
-        talea_parts = abjad.sequence.partition_by_weights(
-            talea_written_durations,
-            weights=talea_weights,
-            allow_part_weights=abjad.MORE,
-            cyclic=True,
-            overhang=True,
-        )
-    parts = preamble_parts + talea_parts
-    part_durations = abjad.sequence.flatten(parts)
-    assert part_durations == list(written_durations)
-    counts = [len(part) for part in parts]
-    parts = abjad.sequence.partition_by_counts(leaves, counts)
-    for i, part in enumerate(parts):
-        if any(isinstance(_, abjad.Rest) for _ in part):
+    leaves, tuplet_start_indices = [], set()
+    for tuplet in tuplets:
+        tuplet_start_indices.add(len(leaves))
+        leaves.extend(abjad.select.leaves(tuplet))
+    total_duration = sum(leaf.written_duration for leaf in leaves)
+    parts = _iterate_talea_parts(
+        (leaf.written_duration for leaf in leaves),
+        total_duration,
+        unscaled_preamble,
+        unscaled_talea,
+        talea,
+    )
+    for start, stop in parts:
+        if stop - start == 1:
             continue
-        if len(part) == 1:
+        part = leaves[start:stop]
+        if any(isinstance(_, abjad.Rest) for _ in part):
             continue
         abjad.tie(part)
     # TODO: this will need to be generalized and better tested:
     if unscaled_end_counts:
         total = len(unscaled_end_counts)
-        end_leaves = leaves[-total:]
-        for leaf in reversed(end_leaves):
-            previous_leaf = abjad.get.leaf(leaf, -1)
-            if previous_leaf is not None:
-                abjad.detach(abjad.Tie, previous_leaf)
+        for i in range(max(len(leaves) - total, 0), len(leaves)):
+            if i not in tuplet_start_indices:
+                abjad.detach(abjad.Tie, leaves[i - 1])
 
 
 def _assert_are_pairs_durations_or_time_signatures(argument):
@@ -106,6 +69,38 @@ def _function_name(frame):
     return abjad.Tag(string)
 
 
+def _get_accelerando_durations(duration, interpolation) -> str | list:
+    durations = _interpolate_divide(
+        total_duration=duration,
+        start_duration=interpolation.start_duration,
+        stop_duration=interpolation.stop_duration,
+    )
+    if durations == "too small":
+        return durations
+    assert isinstance(durations, list)
+    return _round_durations(durations, 2**10)
+
+
+def _get_even_division_note_count(duration, denominator, extra_count):
+    if not abjad.math.is_positive_integer_power_of_two(duration.denominator):
+        raise Exception(f"non-power-of-two durations not implemented: {duration}")
+    basic_duration = abjad.Duration(1, denominator)
+    if duration < 2 * basic_duration:
+        return None, None
+    unprolated_note_count = duration / basic_duration
+    unprolated_note_count = int(unprolated_note_count)
+    unprolated_note_count = unprolated_note_count or 1
+    if 0 < extra_count:
+        modulus = unprolated_note_count
+        extra_count = extra_count % modulus
+    elif extra_count < 0:
+        modulus = int(math.ceil(unprolated_note_count / 2.0))
+        extra_count = abs(extra_count) % modulus
+        extra_count *= -1
+    note_count = unprolated_note_count + extra_count
+    return unprolated_note_count, note_count
+
+
 def _get_interpolations(interpolations, previous_state):
     specifiers_ = interpolations
     if specifiers_ is None:
@@ -121,6 +116,60 @@ def _get_interpolations(interpolations, previous_state):
     return specifiers_
 
 
+def _get_talea_logical_tie_count(made, spelling) -> int:
+    is_rests, list_indices, tied, written_durations = [], [], [], []
+    for list_index, numerator_list in enumerate(made.numerator_lists):
+        for numerator in numerator_list:
+            duration = abjad.Duration(abs(numerator), made.scaled.lcd)
+            _, durations, _ = _get_leaf_decomposition(duration, numerator < 0, spelling)
+            for i, written_duration in enumerate(durations):
+                is_rests.append(numerator < 0)
+                list_indices.append(list_index)
+                tied.append(0 < numerator and i < len(durations) - 1)
+                written_durations.append(written_duration)
+    parts = _iterate_talea_parts(
+        written_durations,
+        sum(written_durations),
+        made.prepared.preamble,
+        made.unscaled_talea,
+        made.talea,
+    )
+    for start, stop in parts:
+        if 1 < stop - start and not any(is_rests[start:stop]):
+            for i in range(start, stop - 1):
+                tied[i] = True
+    if made.prepared.end_counts:
+        total = len(made.prepared.end_counts)
+        for i in range(max(len(tied) - total, 1), len(tied)):
+            if list_indices[i - 1] == list_indices[i]:
+                tied[i - 1] = False
+    return len(tied) - tied.count(True)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_leaf_decomposition(duration, is_rest, spelling):
+    """
+    Gets implicit tuplet multiplier (or none), written durations and tie flag
+    ``abjad.makers.make_leaves()`` uses to spell ``duration``.
+    """
+    pitches = [None] if is_rest else [0]
+    components = abjad.makers.make_leaves(
+        pitches,
+        [duration],
+        increase_monotonic=spelling.increase_monotonic,
+        forbidden_note_duration=spelling.forbidden_note_duration,
+        forbidden_rest_duration=spelling.forbidden_rest_duration,
+    )
+    multiplier = None
+    if len(components) == 1 and isinstance(components[0], abjad.Tuplet):
+        multiplier = components[0].multiplier
+        components = components[0][:]
+    leaves = abjad.select.leaves(components)
+    written_durations = tuple(_.written_duration for _ in leaves)
+    is_tied = any(abjad.get.has_indicator(_, abjad.Tie) for _ in leaves)
+    return multiplier, written_durations, is_tied
+
+
 def _interpolate_cosine(y1, y2, mu) -> float:
     mu2 = (1 - math.cos(mu * math.pi)) / 2
     return y1 * (1 - mu2) + y2 * mu2
@@ -235,6 +284,63 @@ def _interpolate_exponential(y1, y2, mu, exponent=1) -> float:
     return result
 
 
+def _is_incomplete_last_note(made, last_leaf_is_note, talea) -> bool:
+    prepared = made.prepared
+    advanced_talea = _classes.Talea(
+        counts=prepared.talea,
+        denominator=talea.denominator,
+        end_counts=prepared.end_counts,
+        preamble=prepared.preamble,
+    )
+    if "+" in prepared.talea or "-" in prepared.talea:
+        return False
+    if made.talea_weight_consumed not in advanced_talea:
+        if last_leaf_is_note:
+            return True
+    return False
+
+
+def _iterate_talea_parts(
+    written_durations, total_duration, unscaled_preamble, unscaled_talea, talea
+):
+    """
+    Sweeps ``written_durations`` once and yields start and stop index of the
+    leaves that make up each preamble and talea count.
+
+    Preamble counts must partition leaves exactly unless ``total_duration``
+    fits in preamble; talea counts read cyclically and may overhang.
+    """
+    preamble_weights = []
+    for numerator in unscaled_preamble:
+        weight = abs(abjad.Duration(numerator, talea.denominator))
+        preamble_weights.append(weight)
+    if total_duration <= sum(preamble_weights):
+        weights, is_exact = preamble_weights, False
+    else:
+        talea_weights = []
+        for numerator in unscaled_talea:
+            weight = abs(abjad.Duration(numerator, talea.denominator))
+            talea_weights.append(weight)
+        if preamble_weights:
+            weights, is_exact = preamble_weights, True
+        else:
+            weights, is_exact = talea_weights, False
+    start, stop, index, part_weight = 0, 0, 0, 0
+    for stop, written_duration in enumerate(written_durations, start=1):
+        part_weight += written_duration
+        target_weight = weights[index % len(weights)]
+        if part_weight < target_weight:
+            continue
+        if is_exact and target_weight < part_weight:
+            raise Exception("can not partition exactly.")
+        yield start, stop
+        start, index, part_weight = stop, index + 1, 0
+        if is_exact and index == len(weights):
+            weights, index, is_exact = talea_weights, 0, False
+    if start < stop:
+        yield start, stop
+
+
 def _make_accelerando(
     duration, interpolations, index, *, tag: abjad.Tag = abjad.Tag()
 ) -> abjad.Tuplet:
@@ -254,16 +360,11 @@ def _make_accelerando(
     assert all(isinstance(_, _classes.Interpolation) for _ in interpolations)
     assert isinstance(index, int)
     interpolation = interpolations[index]
-    durations = _interpolate_divide(
-        total_duration=duration,
-        start_duration=interpolation.start_duration,
-        stop_duration=interpolation.stop_duration,
-    )
+    durations = _get_accelerando_durations(duration, interpolation)
     if durations == "too small":
         notes = abjad.makers.make_notes([0], [duration], tag=tag)
         tuplet = abjad.Tuplet((1, 1), notes, tag=tag)
         return tuplet
-    durations = _round_durations(durations, 2**10)
     notes = []
     for i, duration_ in enumerate(durations):
         written_duration = interpolation.written_duration
@@ -307,42 +408,59 @@ def _make_incised_duration_lists(
     return duration_lists
 
 
+def _make_interpolations(interpolations):
+    interpolations_ = []
+    for interpolation in interpolations:
+        interpolation_durations = [abjad.Duration(_) for _ in interpolation]
+        interpolation_ = _classes.Interpolation(*interpolation_durations)
+        interpolations_.append(interpolation_)
+    return interpolations_
+
+
 def _make_leaf_and_tuplet_list(
     durations,
-    increase_monotonic=None,
-    forbidden_note_duration=None,
-    forbidden_rest_duration=None,
+    spelling=_classes.Spelling(),
     tag=None,
 ) -> list[abjad.Leaf | abjad.Tuplet]:
     assert all(isinstance(_, abjad.Duration) for _ in durations), repr(durations)
     assert all(_ != 0 for _ in durations), repr(durations)
     leaves_and_tuplets: list[abjad.Leaf | abjad.Tuplet] = []
-    pitches: list[int | None]
     for duration in durations:
         if 0 < duration:
-            pitches = [0]
+            pitch = 0
         else:
-            pitches = [None]
+            pitch = None
         duration = abs(duration)
-        leaves_and_tuplets_ = abjad.makers.make_leaves(
-            pitches,
-            [duration],
-            increase_monotonic=increase_monotonic,
-            forbidden_note_duration=forbidden_note_duration,
-            forbidden_rest_duration=forbidden_rest_duration,
-            tag=tag,
-        )
-        # TODO: is this needed?
-        if (
-            1 < len(leaves_and_tuplets_)
-            and abjad.get.logical_tie(leaves_and_tuplets_[0]).is_trivial
-            and not isinstance(leaves_and_tuplets_[0], abjad.Rest)
-        ):
-            abjad.tie(leaves_and_tuplets_)
+        leaves_and_tuplets_ = _make_leaves(duration, pitch, spelling=spelling, tag=tag)
         leaves_and_tuplets.extend(leaves_and_tuplets_)
     return leaves_and_tuplets
 
 
+def _make_leaves(
+    duration, pitch, *, spelling=_classes.Spelling(), tag=None
+) -> list[abjad.Leaf | abjad.Tuplet]:
+    """
+    Makes the leaves ``abjad.makers.make_leaves()`` makes for ``duration``
+    and ``pitch``; looks up spelling in cache and makes only new leaves.
+    """
+    is_rest = pitch is None
+    multiplier, written_durations, is_tied = _get_leaf_decomposition(
+        duration, is_rest, spelling
+    )
+    leaves: list[abjad.Leaf] = []
+    for written_duration in written_durations:
+        if is_rest:
+            leaves.append(abjad.Rest(written_duration, tag=tag))
+        else:
+            leaves.append(abjad.Note(pitch, written_duration, tag=tag))
+    if is_tied:
+        for leaf in leaves[:-1]:
+            abjad.attach(abjad.Tie(), leaf)
+    if multiplier is not None:
+        return [abjad.Tuplet(multiplier, leaves)]
+    return list(leaves)
+
+
 def _make_middle_durations(middle_duration, incise):
     assert isinstance(middle_duration, abjad.Duration), repr(middle_duration)
     assert middle_duration.denominator == 1, repr(middle_duration)
@@ -541,99 +659,161 @@ def _make_prolated_pairs(pairs, extra_counts):
     return prolated_pairs
 
 
-def _make_state_dictionary(
+def _make_state(
+    previous_state,
     *,
     durations_consumed,
     logical_ties_produced,
-    previous_durations_consumed,
-    previous_incomplete_last_note,
-    previous_logical_ties_produced,
-    state,
-):
-    durations_consumed_ = previous_durations_consumed + durations_consumed
-    state["durations_consumed"] = durations_consumed_
-    logical_ties_produced_ = previous_logical_ties_produced + logical_ties_produced
-    if previous_incomplete_last_note:
-        logical_ties_produced_ -= 1
-    state["logical_ties_produced"] = logical_ties_produced_
-    state = dict(sorted(state.items()))
+    incomplete_last_note=False,
+    talea_weight_consumed=None,
+) -> _classes.State:
+    previous_state = _classes.State.from_dict(previous_state)
+    state = previous_state.advance(
+        durations_consumed,
+        logical_ties_produced,
+        incomplete_last_note=incomplete_last_note,
+        talea_weight_consumed=talea_weight_consumed,
+    )
     return state
 
 
-def _make_talea_tuplets(
+def _make_talea_numerator_lists(
     durations,
     self_extra_counts,
     previous_state,
     self_read_talea_once_only,
-    spelling,
-    self_state,
     talea,
-    tag,
+    scaled_durations=None,
 ):
     assert all(isinstance(_, abjad.Duration) for _ in durations), repr(durations)
-    prepared = _prepare_talea_rhythm_maker_input(
-        self_extra_counts, previous_state, talea
-    )
-    scaled = _scale_rhythm_maker_input(durations, talea.denominator, prepared)
+    with _instrumentation._span("scale_input"):
+        prepared = _prepare_talea_rhythm_maker_input(
+            self_extra_counts, previous_state, talea
+        )
+        scaled = _scale_rhythm_maker_input(
+            durations, talea.denominator, prepared, scaled_durations
+        )
     assert scaled.counts.talea
-    numerator_lists, expanded_talea = _make_numerator_lists(
-        scaled.pairs,
-        scaled.counts.preamble,
-        scaled.counts.talea,
-        scaled.counts.extra_counts,
-        scaled.counts.end_counts,
-        self_read_talea_once_only,
-    )
+    with _instrumentation._span("make_numerator_lists"):
+        numerator_lists, expanded_talea = _make_numerator_lists(
+            scaled.pairs,
+            scaled.counts.preamble,
+            scaled.counts.talea,
+            scaled.counts.extra_counts,
+            scaled.counts.end_counts,
+            self_read_talea_once_only,
+        )
     if expanded_talea is not None:
         unscaled_talea = expanded_talea
     else:
         unscaled_talea = prepared.talea
     talea_weight_consumed = sum(abjad.sequence.weight(_) for _ in numerator_lists)
-    duration_lists = [
-        [abjad.Duration(_, scaled.lcd) for _ in n] for n in numerator_lists
-    ]
-    leaf_lists = []
-    for duration_list in duration_lists:
-        leaf_list = _make_leaf_and_tuplet_list(
-            duration_list,
-            increase_monotonic=spelling.increase_monotonic,
-            forbidden_note_duration=spelling.forbidden_note_duration,
-            forbidden_rest_duration=spelling.forbidden_rest_duration,
-            tag=tag,
+    return types.SimpleNamespace(
+        numerator_lists=numerator_lists,
+        prepared=prepared,
+        scaled=scaled,
+        talea=talea,
+        talea_weight_consumed=talea_weight_consumed,
+        unscaled_talea=unscaled_talea,
+    )
+
+
+def _make_talea_tuplets(
+    durations,
+    self_extra_counts,
+    previous_state,
+    self_read_talea_once_only,
+    spelling,
+    talea,
+    tag,
+    scaled_durations=None,
+    *,
+    cancellation=None,
+    progress=None,
+):
+    if cancellation is not None:
+        cancellation.check()
+    made = _make_talea_numerator_lists(
+        durations,
+        self_extra_counts,
+        previous_state,
+        self_read_talea_once_only,
+        talea,
+        scaled_durations,
+    )
+    prepared, scaled = made.prepared, made.scaled
+    with _instrumentation._span("make_leaves"):
+        duration_lists = [
+            [abjad.Duration(_, scaled.lcd) for _ in n] for n in made.numerator_lists
+        ]
+        leaf_lists = []
+        for i, duration_list in enumerate(duration_lists):
+            if cancellation is not None:
+                cancellation.check()
+            leaf_list = _make_leaf_and_tuplet_list(duration_list, spelling, tag=tag)
+            leaf_lists.append(leaf_list)
+            if progress is not None:
+                progress(i + 1, len(duration_lists))
+        if not scaled.counts.extra_counts:
+            tuplets = [abjad.Tuplet((1, 1), _) for _ in leaf_lists]
+        else:
+            durations_ = [abjad.Duration(_) for _ in scaled.pairs]
+            tuplets = _make_talea_rhythm_maker_tuplets(durations_, leaf_lists, tag=tag)
+    with _instrumentation._span("apply_ties"):
+        _apply_ties_to_split_notes(
+            tuplets,
+            prepared.end_counts,
+            prepared.preamble,
+            made.unscaled_talea,
+            talea,
         )
-        leaf_lists.append(leaf_list)
-    if not scaled.counts.extra_counts:
-        tuplets = [abjad.Tuplet((1, 1), _) for _ in leaf_lists]
-    else:
-        durations_ = [abjad.Duration(_) for _ in scaled.pairs]
-        tuplets = _make_talea_rhythm_maker_tuplets(durations_, leaf_lists, tag=tag)
-    _apply_ties_to_split_notes(
-        tuplets,
-        prepared.end_counts,
-        prepared.preamble,
-        unscaled_talea,
+    with _instrumentation._span("normalize_multipliers"):
+        for tuplet in abjad.iterate.components(tuplets, abjad.Tuplet):
+            tuplet.normalize_multiplier()
+    last_leaf = abjad.get.leaf(tuplets, -1)
+    incomplete_last_note = _is_incomplete_last_note(
+        made, isinstance(last_leaf, abjad.Note), talea
+    )
+    return tuplets, incomplete_last_note, made.talea_weight_consumed
+
+
+def _make_talea_tuplets_and_state(
+    durations,
+    self_extra_counts,
+    previous_state,
+    self_read_talea_once_only,
+    spelling,
+    talea,
+    tag,
+    scaled_durations=None,
+    *,
+    cancellation=None,
+    progress=None,
+):
+    tuplets, incomplete_last_note, talea_weight_consumed = _make_talea_tuplets(
+        durations,
+        self_extra_counts,
+        previous_state,
+        self_read_talea_once_only,
+        spelling,
         talea,
+        tag,
+        scaled_durations,
+        cancellation=cancellation,
+        progress=progress,
     )
-    for tuplet in abjad.iterate.components(tuplets, abjad.Tuplet):
-        tuplet.normalize_multiplier()
-    assert isinstance(self_state, dict)
-    advanced_talea = _classes.Talea(
-        counts=prepared.talea,
-        denominator=talea.denominator,
-        end_counts=prepared.end_counts,
-        preamble=prepared.preamble,
+    voice = abjad.Voice(tuplets)
+    logical_ties_produced = len(abjad.select.logical_ties(voice))
+    state = _make_state(
+        previous_state,
+        durations_consumed=len(durations),
+        logical_ties_produced=logical_ties_produced,
+        incomplete_last_note=incomplete_last_note,
+        talea_weight_consumed=talea_weight_consumed,
     )
-    if "+" in prepared.talea or "-" in prepared.talea:
-        pass
-    elif talea_weight_consumed not in advanced_talea:
-        last_leaf = abjad.get.leaf(tuplets, -1)
-        if isinstance(last_leaf, abjad.Note):
-            self_state["incomplete_last_note"] = True
-    string = "talea_weight_consumed"
-    assert isinstance(previous_state, dict)
-    self_state[string] = previous_state.get(string, 0)
-    self_state[string] += talea_weight_consumed
-    return tuplets
+    tuplets = abjad.mutate.eject_contents(voice)
+    assert all(isinstance(_, abjad.Tuplet) for _ in tuplets), repr(tuplets)
+    return tuplets, state
 
 
 def _make_talea_rhythm_maker_tuplets(durations, leaf_lists, *, tag):
@@ -661,6 +841,19 @@ def _make_tuplet_rhythm_maker_music(
     return tuplets
 
 
+def _prepare_even_division_input(denominators, extra_counts, previous_state):
+    assert isinstance(previous_state, dict | _classes.State), repr(previous_state)
+    durations_consumed = previous_state.get("durations_consumed", 0)
+    denominators_ = list(denominators)
+    denominators_ = abjad.sequence.rotate(denominators_, -durations_consumed)
+    cyclic_denominators = abjad.CyclicTuple(denominators_)
+    extra_counts_ = extra_counts or [0]
+    extra_counts__ = list(extra_counts_)
+    extra_counts__ = abjad.sequence.rotate(extra_counts__, -durations_consumed)
+    cyclic_extra_counts = abjad.CyclicTuple(extra_counts__)
+    return cyclic_denominators, cyclic_extra_counts
+
+
 def _prepare_incised_input(incise, extra_counts):
     cyclic_prefix_talea = abjad.CyclicTuple(incise.prefix_talea)
     cyclic_prefix_counts = abjad.CyclicTuple(incise.prefix_counts or (0,))
@@ -704,26 +897,34 @@ def _round_durations(durations, denominator):
     return durations_
 
 
-def _scale_rhythm_maker_input(durations, talea_denominator, counts):
+def _scale_counts(counts, multiplier):
+    if multiplier == 1 and isinstance(counts, abjad.CyclicTuple):
+        return counts
+    return abjad.CyclicTuple([multiplier * _ for _ in counts])
+
+
+def _scale_durations(durations, talea_denominator):
     assert all(isinstance(_, abjad.Duration) for _ in durations), repr(durations)
     talea_denominator = talea_denominator or 1
-    scaled_pairs = durations[:]
-    dummy_pair = (1, talea_denominator)
-    scaled_pairs.append(dummy_pair)
-    scaled_pairs = abjad.Duration.durations_to_nonreduced_fractions(scaled_pairs)
-    dummy_pair = scaled_pairs.pop()
-    lcd = dummy_pair[1]
-    multiplier = lcd / talea_denominator
-    assert abjad.math.is_integer_equivalent(multiplier)
-    multiplier = int(multiplier)
+    denominators = {_.denominator for _ in durations}
+    lcd = math.lcm(talea_denominator, *denominators)
+    scaled_pairs = [(_.numerator * (lcd // _.denominator), lcd) for _ in durations]
+    return scaled_pairs, lcd
+
+
+def _scale_rhythm_maker_input(
+    durations, talea_denominator, counts, scaled_durations=None
+):
+    if scaled_durations is None:
+        scaled_durations = _scale_durations(durations, talea_denominator)
+    scaled_pairs, lcd = scaled_durations
+    talea_denominator = talea_denominator or 1
+    multiplier, remainder = divmod(lcd, talea_denominator)
+    assert remainder == 0, repr((lcd, talea_denominator))
     scaled_counts = types.SimpleNamespace()
-    for name, vector in counts.__dict__.items():
-        vector = [multiplier * _ for _ in vector]
-        cyclic_vector = abjad.CyclicTuple(vector)
-        setattr(scaled_counts, name, cyclic_vector)
+    for name, vector in vars(counts).items():
+        setattr(scaled_counts, name, _scale_counts(vector, multiplier))
     assert len(scaled_pairs) == len(durations)
-    assert len(scaled_counts.__dict__) == len(counts.__dict__)
-    assert all(isinstance(_, tuple) for _ in scaled_pairs), repr(scaled_pairs)
     return types.SimpleNamespace(pairs=scaled_pairs, lcd=lcd, counts=scaled_counts)
 
 
@@ -747,10 +948,13 @@ def _split_talea_extended_to_weights(preamble, read_talea_once_only, talea, weig
     return talea
 
 
+@_instrumentation._instrumented
 def accelerando(
     durations,
     *interpolations: typing.Sequence[abjad.typings.Duration],
-    previous_state: dict | None = None,
+    cancellation: _classes.Cancellation | None = None,
+    previous_state: dict | _classes.State | None = None,
+    progress: typing.Callable[[int, int], None] | None = None,
     spelling: _classes.Spelling = _classes.Spelling(),
     state: dict | None = None,
     tag: abjad.Tag | None = None,
@@ -758,6 +962,11 @@ def accelerando(
     r"""
     Makes one accelerando (or ritardando) for each duration in ``durations``.
 
+    Checks ``cancellation`` before each duration and raises
+    ``rmakers.Cancelled``, leaving ``state`` unchanged, once it is cancelled.
+    Calls ``progress`` with number of durations made so far and number of
+    durations after each duration.
+
     ..  container:: example
 
         >>> def make_lilypond_file(pairs, interpolations):
@@ -1126,30 +1335,29 @@ def accelerando(
     durations = [abjad.Duration(_) for _ in durations]
     tag = tag or abjad.Tag()
     tag = tag.append(_function_name(inspect.currentframe()))
-    interpolations_ = []
-    for interpolation in interpolations:
-        interpolation_durations = [abjad.Duration(_) for _ in interpolation]
-        interpolation_ = _classes.Interpolation(*interpolation_durations)
-        interpolations_.append(interpolation_)
+    interpolations_ = _make_interpolations(interpolations)
     previous_state = previous_state or {}
     if state is None:
         state = {}
     interpolations_ = _get_interpolations(interpolations_, previous_state)
     tuplets = []
-    for i, duration in enumerate(durations):
-        tuplet = _make_accelerando(duration, interpolations_, i, tag=tag)
-        tuplets.append(tuplet)
-    voice = abjad.Voice(tuplets)
-    logical_ties_produced = len(abjad.select.logical_ties(voice))
-    new_state = _make_state_dictionary(
-        durations_consumed=len(durations),
-        logical_ties_produced=logical_ties_produced,
-        previous_durations_consumed=previous_state.get("durations_consumed", 0),
-        previous_incomplete_last_note=previous_state.get("incomplete_last_note", False),
-        previous_logical_ties_produced=previous_state.get("logical_ties_produced", 0),
-        state=state,
-    )
-    components, tuplets = abjad.mutate.eject_contents(voice), []
+    with _instrumentation._span("make_tuplets"):
+        for i, duration in enumerate(durations):
+            if cancellation is not None:
+                cancellation.check()
+            tuplet = _make_accelerando(duration, interpolations_, i, tag=tag)
+            tuplets.append(tuplet)
+            if progress is not None:
+                progress(i + 1, len(durations))
+    with _instrumentation._span("make_state"):
+        voice = abjad.Voice(tuplets)
+        logical_ties_produced = len(abjad.select.logical_ties(voice))
+        new_state = _make_state(
+            previous_state,
+            durations_consumed=len(durations),
+            logical_ties_produced=logical_ties_produced,
+        )
+        components, tuplets = abjad.mutate.eject_contents(voice), []
     for component in components:
         assert isinstance(component, abjad.Tuplet)
         abjad.attach("FEATHER_BEAM_CONTAINER", tuplet)
@@ -1159,13 +1367,75 @@ def accelerando(
     return tuplets
 
 
+@_instrumentation._instrumented
+def accelerando_state_at(
+    durations,
+    *interpolations: typing.Sequence[abjad.typings.Duration],
+    previous_state: dict | _classes.State | None = None,
+) -> _classes.State:
+    r"""
+    Gets state ``rmakers.accelerando()`` produces for ``durations``.
+
+    Computes state arithmetically; makes no components.
+
+    ..  container:: example
+
+        >>> pairs = [(3, 8), (4, 8), (3, 8)]
+        >>> durations = [abjad.Duration(_) for _ in pairs]
+        >>> interpolation = [(1, 8), (1, 20), (1, 16)]
+        >>> rmakers.accelerando_state_at(durations, interpolation)
+        State(durations_consumed=3, incomplete_last_note=False, logical_ties_produced=16, talea_weight_consumed=None)
+
+        Equal to state produced by ``rmakers.accelerando()``:
+
+        >>> state = {}
+        >>> tuplets = rmakers.accelerando(durations, interpolation, state=state)
+        >>> state
+        {'durations_consumed': 3, 'logical_ties_produced': 16}
+
+    ..  container:: example
+
+        Seeks the state of a later segment without making earlier segments:
+
+        >>> state = {}
+        >>> for pairs in [[(3, 8), (4, 8), (3, 8)], [(4, 8), (3, 8), (4, 8)]]:
+        ...     durations = [abjad.Duration(_) for _ in pairs]
+        ...     state = rmakers.accelerando_state_at(
+        ...         durations, interpolation, previous_state=state
+        ...     )
+        ...
+        >>> state
+        State(durations_consumed=6, incomplete_last_note=False, logical_ties_produced=33, talea_weight_consumed=None)
+
+    """
+    _assert_are_pairs_durations_or_time_signatures(durations)
+    durations = [abjad.Duration(_) for _ in durations]
+    interpolations_ = _make_interpolations(interpolations)
+    previous_state = previous_state or {}
+    interpolations_ = _get_interpolations(interpolations_, previous_state)
+    logical_ties_produced = 0
+    for i, duration in enumerate(durations):
+        durations_ = _get_accelerando_durations(duration, interpolations_[i])
+        if durations_ == "too small":
+            logical_ties_produced += 1
+        else:
+            logical_ties_produced += len(durations_)
+    state = _make_state(
+        previous_state,
+        durations_consumed=len(durations),
+        logical_ties_produced=logical_ties_produced,
+    )
+    return state
+
+
+@_instrumentation._instrumented
 def even_division(
     durations,
     denominators: typing.Sequence[int],
     *,
     denominator: str | int = "from_counts",
     extra_counts: typing.Sequence[int] = (0,),
-    previous_state: dict | None = None,
+    previous_state: dict | _classes.State | None = None,
     spelling: _classes.Spelling = _classes.Spelling(),
     state: dict | None = None,
     tag: abjad.Tag | None = None,
@@ -2532,58 +2802,42 @@ def even_division(
     if state is None:
         state = {}
     tuplets = []
-    assert isinstance(previous_state, dict)
-    durations_consumed = previous_state.get("durations_consumed", 0)
-    denominators_ = list(denominators)
-    denominators_ = abjad.sequence.rotate(denominators_, -durations_consumed)
-    cyclic_denominators = abjad.CyclicTuple(denominators_)
-    extra_counts_ = extra_counts or [0]
-    extra_counts__ = list(extra_counts_)
-    extra_counts__ = abjad.sequence.rotate(extra_counts__, -durations_consumed)
-    cyclic_extra_counts = abjad.CyclicTuple(extra_counts__)
-    for i, duration in enumerate(durations):
-        if not abjad.math.is_positive_integer_power_of_two(duration.denominator):
-            raise Exception(f"non-power-of-two durations not implemented: {duration}")
-        denominator_ = cyclic_denominators[i]
-        extra_count = cyclic_extra_counts[i]
-        basic_duration = abjad.Duration(1, denominator_)
-        unprolated_note_count = None
-        if duration < 2 * basic_duration:
-            notes = abjad.makers.make_notes([0], [duration], tag=tag)
-        else:
-            unprolated_note_count = duration / basic_duration
-            unprolated_note_count = int(unprolated_note_count)
-            unprolated_note_count = unprolated_note_count or 1
-            if 0 < extra_count:
-                modulus = unprolated_note_count
-                extra_count = extra_count % modulus
-            elif extra_count < 0:
-                modulus = int(math.ceil(unprolated_note_count / 2.0))
-                extra_count = abs(extra_count) % modulus
-                extra_count *= -1
-            note_count = unprolated_note_count + extra_count
-            durations_ = note_count * [basic_duration]
-            notes = abjad.makers.make_notes([0], durations_, tag=tag)
-            assert all(_.written_duration.denominator == denominator_ for _ in notes)
-        tuplet_duration = duration
-        tuplet = abjad.Tuplet.from_duration(tuplet_duration, notes, tag=tag)
-        if denominator == "from_counts" and unprolated_note_count is not None:
-            tuplet.denominator = unprolated_note_count
-        elif isinstance(denominator, int):
-            tuplet.denominator = denominator
-        tuplets.append(tuplet)
-    assert all(isinstance(_, abjad.Tuplet) for _ in tuplets), repr(tuplets)
-    voice = abjad.Voice(tuplets)
-    logical_ties_produced = len(abjad.select.logical_ties(voice))
-    new_state = _make_state_dictionary(
-        durations_consumed=len(durations),
-        logical_ties_produced=logical_ties_produced,
-        previous_durations_consumed=previous_state.get("durations_consumed", 0),
-        previous_incomplete_last_note=previous_state.get("incomplete_last_note", False),
-        previous_logical_ties_produced=previous_state.get("logical_ties_produced", 0),
-        state=state,
+    cyclic_denominators, cyclic_extra_counts = _prepare_even_division_input(
+        denominators, extra_counts, previous_state
     )
-    components, tuplets = abjad.mutate.eject_contents(voice), []
+    with _instrumentation._span("make_tuplets"):
+        for i, duration in enumerate(durations):
+            denominator_ = cyclic_denominators[i]
+            extra_count = cyclic_extra_counts[i]
+            unprolated_note_count, note_count = _get_even_division_note_count(
+                duration, denominator_, extra_count
+            )
+            if unprolated_note_count is None:
+                notes = abjad.makers.make_notes([0], [duration], tag=tag)
+            else:
+                basic_duration = abjad.Duration(1, denominator_)
+                durations_ = note_count * [basic_duration]
+                notes = abjad.makers.make_notes([0], durations_, tag=tag)
+                assert all(
+                    _.written_duration.denominator == denominator_ for _ in notes
+                )
+            tuplet_duration = duration
+            tuplet = abjad.Tuplet.from_duration(tuplet_duration, notes, tag=tag)
+            if denominator == "from_counts" and unprolated_note_count is not None:
+                tuplet.denominator = unprolated_note_count
+            elif isinstance(denominator, int):
+                tuplet.denominator = denominator
+            tuplets.append(tuplet)
+    assert all(isinstance(_, abjad.Tuplet) for _ in tuplets), repr(tuplets)
+    with _instrumentation._span("make_state"):
+        voice = abjad.Voice(tuplets)
+        logical_ties_produced = len(abjad.select.logical_ties(voice))
+        new_state = _make_state(
+            previous_state,
+            durations_consumed=len(durations),
+            logical_ties_produced=logical_ties_produced,
+        )
+        components, tuplets = abjad.mutate.eject_contents(voice), []
     for component in components:
         assert isinstance(component, abjad.Tuplet)
         tuplets.append(component)
@@ -2592,6 +2846,62 @@ def even_division(
     return tuplets
 
 
+@_instrumentation._instrumented
+def even_division_state_at(
+    durations,
+    denominators: typing.Sequence[int],
+    *,
+    extra_counts: typing.Sequence[int] = (0,),
+    previous_state: dict | _classes.State | None = None,
+) -> _classes.State:
+    r"""
+    Gets state ``rmakers.even_division()`` produces for ``durations``.
+
+    Computes state arithmetically; makes no components.
+
+    ..  container:: example
+
+        >>> pairs = [(5, 8), (3, 8), (6, 8), (4, 8), (2, 8)]
+        >>> durations = [abjad.Duration(_) for _ in pairs]
+        >>> rmakers.even_division_state_at(durations, [8], extra_counts=[0, 1])
+        State(durations_consumed=5, incomplete_last_note=False, logical_ties_produced=22, talea_weight_consumed=None)
+
+        Equal to state produced by ``rmakers.even_division()``:
+
+        >>> state = {}
+        >>> tuplets = rmakers.even_division(
+        ...     durations, [8], extra_counts=[0, 1], state=state
+        ... )
+        >>> state
+        {'durations_consumed': 5, 'logical_ties_produced': 22}
+
+    """
+    _assert_are_pairs_durations_or_time_signatures(durations)
+    durations = [abjad.Duration(_) for _ in durations]
+    assert all(isinstance(_, int) for _ in denominators), repr(denominators)
+    assert all(isinstance(_, int) for _ in extra_counts), repr(extra_counts)
+    previous_state = previous_state or {}
+    cyclic_denominators, cyclic_extra_counts = _prepare_even_division_input(
+        denominators, extra_counts, previous_state
+    )
+    logical_ties_produced = 0
+    for i, duration in enumerate(durations):
+        unprolated_note_count, note_count = _get_even_division_note_count(
+            duration, cyclic_denominators[i], cyclic_extra_counts[i]
+        )
+        if unprolated_note_count is None:
+            logical_ties_produced += 1
+        else:
+            logical_ties_produced += note_count
+    state = _make_state(
+        previous_state,
+        durations_consumed=len(durations),
+        logical_ties_produced=logical_ties_produced,
+    )
+    return state
+
+
+@_instrumentation._instrumented
 def incised(
     durations,
     *,
@@ -3133,54 +3443,55 @@ def incised(
         suffix_counts=suffix_counts,
         talea_denominator=talea_denominator,
     )
-    prepared = _prepare_incised_input(incise, extra_counts)
-    counts = types.SimpleNamespace(
-        prefix_talea=prepared.prefix_talea,
-        suffix_talea=prepared.suffix_talea,
-        extra_counts=prepared.extra_counts,
-    )
-    talea_denominator = incise.talea_denominator
-    scaled = _scale_rhythm_maker_input(durations, talea_denominator, counts)
-    if incise.outer_tuplets_only:
-        duration_lists = _make_outer_tuplets_only_incised_duration_lists(
-            scaled.pairs,
-            scaled.counts.prefix_talea,
-            prepared.prefix_counts,
-            scaled.counts.suffix_talea,
-            prepared.suffix_counts,
-            scaled.counts.extra_counts,
-            incise,
+    with _instrumentation._span("scale_input"):
+        prepared = _prepare_incised_input(incise, extra_counts)
+        counts = types.SimpleNamespace(
+            prefix_talea=prepared.prefix_talea,
+            suffix_talea=prepared.suffix_talea,
+            extra_counts=prepared.extra_counts,
         )
-    else:
-        duration_lists = _make_incised_duration_lists(
-            scaled.pairs,
-            scaled.counts.prefix_talea,
-            prepared.prefix_counts,
-            scaled.counts.suffix_talea,
-            prepared.suffix_counts,
-            scaled.counts.extra_counts,
-            incise,
-        )
-    leaf_and_tuplet_lists = []
-    for duration_list in duration_lists:
-        duration_list = [_ for _ in duration_list if _ != abjad.Duration(0)]
-        duration_list = [abjad.Duration(_, scaled.lcd) for _ in duration_list]
-        leaf_and_tuplet_list_ = _make_leaf_and_tuplet_list(
-            duration_list,
-            forbidden_note_duration=spelling.forbidden_note_duration,
-            forbidden_rest_duration=spelling.forbidden_rest_duration,
-            increase_monotonic=spelling.increase_monotonic,
-            tag=tag,
+        talea_denominator = incise.talea_denominator
+        scaled = _scale_rhythm_maker_input(durations, talea_denominator, counts)
+    with _instrumentation._span("make_duration_lists"):
+        if incise.outer_tuplets_only:
+            duration_lists = _make_outer_tuplets_only_incised_duration_lists(
+                scaled.pairs,
+                scaled.counts.prefix_talea,
+                prepared.prefix_counts,
+                scaled.counts.suffix_talea,
+                prepared.suffix_counts,
+                scaled.counts.extra_counts,
+                incise,
+            )
+        else:
+            duration_lists = _make_incised_duration_lists(
+                scaled.pairs,
+                scaled.counts.prefix_talea,
+                prepared.prefix_counts,
+                scaled.counts.suffix_talea,
+                prepared.suffix_counts,
+                scaled.counts.extra_counts,
+                incise,
+            )
+    with _instrumentation._span("make_leaves"):
+        leaf_and_tuplet_lists = []
+        for duration_list in duration_lists:
+            duration_list = [_ for _ in duration_list if _ != abjad.Duration(0)]
+            duration_list = [abjad.Duration(_, scaled.lcd) for _ in duration_list]
+            leaf_and_tuplet_list_ = _make_leaf_and_tuplet_list(
+                duration_list, spelling, tag=tag
+            )
+            leaf_and_tuplet_lists.append(leaf_and_tuplet_list_)
+    with _instrumentation._span("make_tuplets"):
+        durations = [abjad.Duration(_) for _ in scaled.pairs]
+        tuplets = _make_talea_rhythm_maker_tuplets(
+            durations, leaf_and_tuplet_lists, tag=tag
         )
-        leaf_and_tuplet_lists.append(leaf_and_tuplet_list_)
-    durations = [abjad.Duration(_) for _ in scaled.pairs]
-    tuplets = _make_talea_rhythm_maker_tuplets(
-        durations, leaf_and_tuplet_lists, tag=tag
-    )
     assert all(isinstance(_, abjad.Tuplet) for _ in tuplets)
     return tuplets
 
 
+@_instrumentation._instrumented
 def multiplied_duration(
     durations,
     prototype: type = abjad.Note,
@@ -3499,18 +3810,20 @@ def multiplied_duration(
     duration = abjad.Duration(duration)
     leaf: abjad.Leaf
     leaves = []
-    for duration_ in durations:
-        pair = duration_.numerator, duration_.denominator
-        pair = abjad.duration.divide_pair(pair, duration)
-        if prototype is abjad.Note:
-            leaf = prototype("c'", duration, multiplier=pair, tag=tag)
-        else:
-            leaf = prototype(duration, multiplier=pair, tag=tag)
-        leaves.append(leaf)
+    with _instrumentation._span("make_leaves"):
+        for duration_ in durations:
+            pair = duration_.numerator, duration_.denominator
+            pair = abjad.duration.divide_pair(pair, duration)
+            if prototype is abjad.Note:
+                leaf = prototype("c'", duration, multiplier=pair, tag=tag)
+            else:
+                leaf = prototype(duration, multiplier=pair, tag=tag)
+            leaves.append(leaf)
     assert all(isinstance(_, abjad.Leaf) for _ in leaves), repr(leaves)
     return leaves
 
 
+@_instrumentation._instrumented
 def note(
     durations,
     *,
@@ -4314,31 +4627,28 @@ def note(
     _assert_are_pairs_durations_or_time_signatures(durations)
     durations = [abjad.Duration(_) for _ in durations]
     lists = []
-    for duration in durations:
-        list_ = abjad.makers.make_leaves(
-            pitches=0,
-            durations=[duration],
-            increase_monotonic=spelling.increase_monotonic,
-            forbidden_note_duration=spelling.forbidden_note_duration,
-            forbidden_rest_duration=spelling.forbidden_rest_duration,
-            tag=tag,
-        )
-        lists.append(list(list_))
+    with _instrumentation._span("make_leaves"):
+        for duration in durations:
+            list_ = _make_leaves(duration, 0, spelling=spelling, tag=tag)
+            lists.append(list_)
     components = abjad.sequence.flatten(lists)
     assert all(isinstance(_, abjad.Leaf | abjad.Tuplet) for _ in components)
     return components
 
 
+@_instrumentation._instrumented
 def talea(
     durations,
     counts: typing.Sequence[int],
     denominator: int,
     *,
     advance: int = 0,
+    cancellation: _classes.Cancellation | None = None,
     end_counts: typing.Sequence[int] = (),
     extra_counts: typing.Sequence[int] = (),
     preamble: typing.Sequence[int] = (),
-    previous_state: dict | None = None,
+    previous_state: dict | _classes.State | None = None,
+    progress: typing.Callable[[int, int], None] | None = None,
     read_talea_once_only: bool = False,
     spelling: _classes.Spelling = _classes.Spelling(),
     state: dict | None = None,
@@ -4347,6 +4657,11 @@ def talea(
     r"""
     Reads ``counts`` cyclically and makes one tuplet for each duration in ``durations``.
 
+    Checks ``cancellation`` before each duration and raises
+    ``rmakers.Cancelled``, leaving ``state`` unchanged, once it is cancelled.
+    Calls ``progress`` with number of durations made so far and number of
+    durations after each duration.
+
     Repeats talea of 1/16, 2/16, 3/16, 4/16:
 
     ..  container:: example
@@ -4866,33 +5181,194 @@ def talea(
     previous_state = previous_state or {}
     if state is None:
         state = {}
-    tuplets = _make_talea_tuplets(
+    tuplets, new_state = _make_talea_tuplets_and_state(
         durations,
         extra_counts,
         previous_state,
         read_talea_once_only,
         spelling,
-        state,
         talea,
         tag,
+        cancellation=cancellation,
+        progress=progress,
     )
-    voice = abjad.Voice(tuplets)
-    logical_ties_produced = len(abjad.select.logical_ties(voice))
-    new_state = _make_state_dictionary(
-        durations_consumed=len(durations),
-        logical_ties_produced=logical_ties_produced,
-        previous_durations_consumed=previous_state.get("durations_consumed", 0),
-        previous_incomplete_last_note=previous_state.get("incomplete_last_note", False),
-        previous_logical_ties_produced=previous_state.get("logical_ties_produced", 0),
-        state=state,
-    )
-    tuplets = abjad.mutate.eject_contents(voice)
-    assert all(isinstance(_, abjad.Tuplet) for _ in tuplets), repr(tuplets)
     state.clear()
     state.update(new_state)
     return tuplets
 
 
+@_instrumentation._instrumented
+def talea_state_at(
+    durations,
+    counts: typing.Sequence[int],
+    denominator: int,
+    *,
+    advance: int = 0,
+    end_counts: typing.Sequence[int] = (),
+    extra_counts: typing.Sequence[int] = (),
+    preamble: typing.Sequence[int] = (),
+    previous_state: dict | _classes.State | None = None,
+    read_talea_once_only: bool = False,
+    spelling: _classes.Spelling = _classes.Spelling(),
+) -> _classes.State:
+    r"""
+    Gets state ``rmakers.talea()`` produces for ``durations``.
+
+    Computes state arithmetically; makes no components.
+
+    ..  container:: example
+
+        >>> pairs = [(3, 8), (4, 8), (3, 8), (4, 8)]
+        >>> durations = [abjad.Duration(_) for _ in pairs]
+        >>> state = rmakers.talea_state_at(durations, [4], 16, extra_counts=[0, 1, 2])
+        >>> for item in state.items():
+        ...     item
+        ('durations_consumed', 4)
+        ('incomplete_last_note', True)
+        ('logical_ties_produced', 8)
+        ('talea_weight_consumed', 31)
+
+        Equal to state produced by ``rmakers.talea()``:
+
+        >>> state = {}
+        >>> tuplets = rmakers.talea(
+        ...     durations, [4], 16, extra_counts=[0, 1, 2], state=state
+        ... )
+        >>> for item in state.items():
+        ...     item
+        ('durations_consumed', 4)
+        ('incomplete_last_note', True)
+        ('logical_ties_produced', 8)
+        ('talea_weight_consumed', 31)
+
+    ..  container:: example
+
+        Seeks the state of the third segment without making the first two
+        segments:
+
+        >>> state = {}
+        >>> for i in range(2):
+        ...     state = rmakers.talea_state_at(
+        ...         durations, [4], 16, extra_counts=[0, 1, 2], previous_state=state
+        ...     )
+        ...
+        >>> for item in state.items():
+        ...     item
+        ('durations_consumed', 8)
+        ('incomplete_last_note', True)
+        ('logical_ties_produced', 16)
+        ('talea_weight_consumed', 63)
+
+        >>> tuplets = rmakers.talea(
+        ...     durations, [4], 16, extra_counts=[0, 1, 2], previous_state=state
+        ... )
+
+    """
+    _assert_are_pairs_durations_or_time_signatures(durations)
+    durations = [abjad.Duration(_) for _ in durations]
+    talea = _classes.Talea(
+        counts=counts,
+        denominator=denominator,
+        end_counts=end_counts,
+        preamble=preamble,
+    )
+    talea = talea.advance(advance)
+    previous_state = previous_state or {}
+    made = _make_talea_numerator_lists(
+        durations,
+        extra_counts,
+        previous_state,
+        read_talea_once_only,
+        talea,
+    )
+    numerators = abjad.sequence.flatten(made.numerator_lists)
+    last_leaf_is_note = bool(numerators) and 0 < numerators[-1]
+    logical_ties_produced = _get_talea_logical_tie_count(made, spelling)
+    state = _make_state(
+        previous_state,
+        durations_consumed=len(durations),
+        logical_ties_produced=logical_ties_produced,
+        incomplete_last_note=_is_incomplete_last_note(made, last_leaf_is_note, talea),
+        talea_weight_consumed=made.talea_weight_consumed,
+    )
+    return state
+
+
+@_instrumentation._instrumented
+def talea_batch(
+    durations,
+    counts: typing.Sequence[int],
+    denominator: int,
+    *,
+    voices: typing.Sequence[dict],
+    advance: int = 0,
+    end_counts: typing.Sequence[int] = (),
+    extra_counts: typing.Sequence[int] = (),
+    preamble: typing.Sequence[int] = (),
+    read_talea_once_only: bool = False,
+    spelling: _classes.Spelling = _classes.Spelling(),
+    tag: abjad.Tag | None = None,
+) -> list[tuple[list[abjad.Tuplet], _classes.State]]:
+    r"""
+    Makes ``rmakers.talea()`` tuplets and state for each voice in ``voices``.
+
+    Each voice is a dictionary that overrides ``advance``, ``extra_counts``,
+    ``previous_state`` or ``read_talea_once_only``; voices share
+    ``durations``, talea and scaling:
+
+    ..  container:: example
+
+        >>> pairs = [(3, 8), (4, 8)]
+        >>> durations = [abjad.Duration(_) for _ in pairs]
+        >>> voices = [{}, {"advance": 1}, {"extra_counts": [1]}]
+        >>> results = rmakers.talea_batch(durations, [1, 2, 3], 16, voices=voices)
+        >>> for tuplets, state in results:
+        ...     leaves = abjad.select.leaves(tuplets)
+        ...     " ".join(abjad.lilypond(_) for _ in leaves)
+        ...     dict(state)
+        ...
+        "c'16 c'8 c'8. c'16 c'8 c'8. c'16 c'16"
+        {'durations_consumed': 2, 'incomplete_last_note': True, 'logical_ties_produced': 8, 'talea_weight_consumed': 14}
+        "c'8 c'8. c'16 c'8 c'8. c'16 c'8"
+        {'durations_consumed': 2, 'logical_ties_produced': 7, 'talea_weight_consumed': 14}
+        "c'16 c'8 c'8. c'16 c'8 c'8. c'16 c'8 c'16"
+        {'durations_consumed': 2, 'incomplete_last_note': True, 'logical_ties_produced': 9, 'talea_weight_consumed': 16}
+
+    Tuplets, tags and states equal those of one ``rmakers.talea()`` call per
+    voice.
+    """
+    tag = tag or abjad.Tag()
+    tag = tag.append(abjad.Tag("rmakers.talea()"))
+    _assert_are_pairs_durations_or_time_signatures(durations)
+    durations = [abjad.Duration(_) for _ in durations]
+    talea = _classes.Talea(
+        counts=counts,
+        denominator=denominator,
+        end_counts=end_counts,
+        preamble=preamble,
+    )
+    scaled_durations = _scale_durations(durations, talea.denominator)
+    keywords = ("advance", "extra_counts", "previous_state", "read_talea_once_only")
+    results = []
+    for voice in voices:
+        for keyword in voice:
+            if keyword not in keywords:
+                raise Exception(f"unknown voice keyword: {keyword!r}.")
+        tuplets, state = _make_talea_tuplets_and_state(
+            durations,
+            voice.get("extra_counts", extra_counts),
+            voice.get("previous_state") or {},
+            voice.get("read_talea_once_only", read_talea_once_only),
+            spelling,
+            talea.advance(voice.get("advance", advance)),
+            tag,
+            scaled_durations,
+        )
+        results.append((tuplets, state))
+    return results
+
+
+@_instrumentation._instrumented
 def tuplet(
     durations,
     tuplet_ratios: typing.Sequence[tuple[int, ...]],
@@ -7115,10 +7591,11 @@ def tuplet(
     tag = tag.append(_function_name(inspect.currentframe()))
     _assert_are_pairs_durations_or_time_signatures(durations)
     durations = [abjad.Duration(_) for _ in durations]
-    tuplets = _make_tuplet_rhythm_maker_music(
-        durations,
-        tuplet_ratios,
-        tag=tag,
-    )
+    with _instrumentation._span("make_tuplets"):
+        tuplets = _make_tuplet_rhythm_maker_music(
+            durations,
+            tuplet_ratios,
+            tag=tag,
+        )
     assert all(isinstance(_, abjad.Tuplet) for _ in tuplets), repr(tuplets)
     return tuplets
@@ -0,0 +1,616 @@
+r"""
+The rmakers recipes.
+
+A recipe names a maker, its arguments and the commands to apply to the
+resulting voice. Recipes are ``rmakers.Recipe`` objects or the equivalent
+JSON-compatible dictionaries:
+
+..  container:: example
+
+    >>> import rmakers.recipes
+    >>> recipe = {
+    ...     "maker": "talea",
+    ...     "time_signatures": [[3, 8], [4, 8]],
+    ...     "arguments": [[1, 2, 3], 16],
+    ...     "keywords": {"extra_counts": [0, 1]},
+    ...     "commands": [
+    ...         {"command": "beam"},
+    ...         {"command": "extract_trivial"},
+    ...     ],
+    ... }
+    >>> result = rmakers.recipes.run(recipe)
+    >>> print(result["lilypond"])
+    \context Voice = "RhythmMaker.Music"
+    {
+        c'16
+        [
+        c'8
+        c'8.
+        ]
+        \tuplet 9/8
+        {
+            c'16
+            [
+            c'8
+            c'8.
+            c'16
+            c'8
+            ]
+        }
+    }
+
+    >>> result["state"]
+    {'durations_consumed': 2, 'logical_ties_produced': 8, 'talea_weight_consumed': 15}
+
+Arrays in arguments and keywords become tuples; ``spelling`` dictionaries
+become ``rmakers.Spelling`` objects; ``tag`` strings become ``abjad.Tag``
+objects.
+"""
+
+import dataclasses
+import functools
+import inspect
+import json
+import typing
+
+import abjad
+
+from . import classes as _classes
+from . import functions as _functions
+from . import makers as _makers
+
+_command_names = (
+    "after_grace_container",
+    "beam",
+    "beam_groups",
+    "before_grace_container",
+    "denominator",
+    "duration_bracket",
+    "extract_rest_filled",
+    "extract_trivial",
+    "feather_beam",
+    "force_augmentation",
+    "force_diminution",
+    "force_fraction",
+    "force_note",
+    "force_repeat_tie",
+    "force_rest",
+    "hide_skip_filled",
+    "hide_trivial",
+    "invisible_music",
+    "on_beat_grace_container",
+    "reduce_multiplier",
+    "repeat_tie",
+    "rewrite_dots",
+    "rewrite_meter",
+    "rewrite_rest_filled",
+    "rewrite_sustained",
+    "split_measures",
+    "swap_length_1",
+    "swap_skip_filled",
+    "swap_trivial",
+    "tie",
+    "tremolo_container",
+    "trivialize",
+    "unbeam",
+    "untie",
+    "written_duration",
+)
+
+_idempotent_command_names = (
+    "beam",
+    "denominator",
+    "duration_bracket",
+    "extract_rest_filled",
+    "extract_trivial",
+    "feather_beam",
+    "force_augmentation",
+    "force_diminution",
+    "force_fraction",
+    "force_note",
+    "force_rest",
+    "hide_trivial",
+    "reduce_multiplier",
+    "rewrite_dots",
+    "trivialize",
+    "unbeam",
+    "untie",
+)
+
+_maker_names = (
+    "accelerando",
+    "even_division",
+    "incised",
+    "multiplied_duration",
+    "note",
+    "talea",
+    "tuplet",
+)
+
+_outputs = ("data", "lilypond")
+
+_recipe_keys = (
+    "arguments",
+    "commands",
+    "id",
+    "keywords",
+    "maker",
+    "output",
+    "time_signatures",
+)
+
+_reselecting_command_names = (
+    "extract_rest_filled",
+    "extract_trivial",
+    "force_note",
+    "force_rest",
+    "untie",
+)
+
+_selector_names = (
+    "chord",
+    "chords",
+    "exclude",
+    "flatten",
+    "get",
+    "leaf",
+    "leaves",
+    "logical_tie",
+    "logical_ties",
+    "note",
+    "notes",
+    "rest",
+    "rests",
+    "run",
+    "runs",
+    "top",
+    "tuplet",
+    "tuplets",
+)
+
+_tuplet_command_names = (
+    "denominator",
+    "force_augmentation",
+    "force_diminution",
+    "force_fraction",
+    "reduce_multiplier",
+    "rewrite_dots",
+    "trivialize",
+)
+
+
+def _check_json(value, name):
+    if isinstance(value, list | tuple):
+        for value_ in value:
+            _check_json(value_, name)
+    elif isinstance(value, dict):
+        for key, value_ in value.items():
+            if not isinstance(key, str):
+                raise Exception(f"{name} must be JSON-compatible: {key!r}.")
+            _check_json(value_, name)
+    elif value is not None and not isinstance(value, bool | float | int | str):
+        raise Exception(f"{name} must be JSON-compatible: {value!r}.")
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(string):
+    """
+    Compiles recipe dictionary in JSON ``string`` to maker, arguments,
+    keywords, time signature pairs and steps.
+
+    Each step is a selector, a function and its arguments; consecutive tuplet
+    commands with equal selectors compile to one step.
+    """
+    recipe = Recipe.from_dict(json.loads(string)).optimize()
+    maker = _get_function(recipe.maker, _maker_names, "maker")
+    arguments = _decode(recipe.arguments)
+    keywords = _decode_keywords(recipe.keywords)
+    pairs = [tuple(_) for _ in recipe.time_signatures]
+    steps = []
+    previous_command = None
+    for command in recipe.commands:
+        function = _get_function(command.name, _command_names, "command")
+        triple = (
+            function,
+            _decode(command.arguments),
+            _decode_keywords(command.keywords),
+        )
+        if (
+            previous_command is not None
+            and previous_command.name in _tuplet_command_names
+            and command.name in _tuplet_command_names
+            and previous_command.selector == command.selector
+        ):
+            steps[-1][2][0].append(triple)
+        elif command.name in _tuplet_command_names:
+            selector = _compile_selector(command.selector)
+            steps.append([selector, _run_tuplet_commands, ([triple],), {}])
+        else:
+            selector = _compile_selector(command.selector)
+            steps.append([selector, *triple])
+        previous_command = command
+    return maker, arguments, keywords, pairs, steps
+
+
+def _compile_selector(selector):
+    steps = []
+    for name, *arguments in selector:
+        each = name.startswith("*")
+        name = name.removeprefix("*")
+        if name not in _selector_names:
+            raise Exception(f"unknown selector: {name!r}.")
+        steps.append((getattr(abjad.select, name), each, _encode(arguments)))
+    return steps
+
+
+def _decode(value):
+    if isinstance(value, list | tuple):
+        return tuple(_decode(_) for _ in value)
+    if isinstance(value, dict):
+        return {key: _decode(value_) for key, value_ in value.items()}
+    return value
+
+
+def _decode_keywords(keywords):
+    assert isinstance(keywords, dict), repr(keywords)
+    keywords = _decode(keywords)
+    if "spelling" in keywords:
+        dictionary = dict(keywords["spelling"])
+        for key in ("forbidden_note_duration", "forbidden_rest_duration"):
+            if dictionary.get(key) is not None:
+                dictionary[key] = abjad.Duration(dictionary[key])
+        keywords["spelling"] = _classes.Spelling(**dictionary)
+    if "tag" in keywords:
+        keywords["tag"] = abjad.Tag(keywords["tag"])
+    return keywords
+
+
+def _encode(value):
+    if isinstance(value, list | tuple):
+        return [_encode(_) for _ in value]
+    if isinstance(value, dict):
+        return {key: _encode(value_) for key, value_ in value.items()}
+    return value
+
+
+def _get_data(component):
+    if isinstance(component, abjad.Leaf):
+        data = {
+            "type": type(component).__name__,
+            "duration": list(component.written_duration.pair),
+        }
+        if component.multiplier is not None:
+            data["multiplier"] = list(component.multiplier)
+        if abjad.get.has_indicator(component, abjad.Tie):
+            data["tie"] = True
+        return data
+    data = {"type": type(component).__name__}
+    if isinstance(component, abjad.Tuplet):
+        data["multiplier"] = list(component.multiplier)
+    data["components"] = [_get_data(_) for _ in component]
+    return data
+
+
+def _get_function(name, names, kind):
+    if name not in names:
+        raise Exception(f"unknown {kind}: {name!r}.")
+    if kind == "maker":
+        return getattr(_makers, name)
+    return getattr(_functions, name)
+
+
+def _get_result(voice, state, output):
+    result = {"state": dict(state)}
+    if output == "lilypond":
+        result["lilypond"] = _functions.to_lilypond(voice)
+    else:
+        result["data"] = [_get_data(_) for _ in voice]
+    return result
+
+
+def _is_no_op(command, next_command):
+    """
+    Is true when ``command`` makes no difference before ``next_command``.
+    """
+    if command.selector != next_command.selector:
+        return False
+    if command.name == "unbeam" and next_command.name == "beam":
+        if not command.keywords.get("smart"):
+            return not next_command.keywords.get("do_not_unbeam")
+    if command.name == "denominator" and next_command.name == "denominator":
+        return True
+    if command.name in _idempotent_command_names:
+        if command.selector and command.name in _reselecting_command_names:
+            return False
+        return command == next_command
+    return False
+
+
+def _run_tuplet_commands(argument, triples):
+    """
+    Runs tuplet commands in one traversal of flat tuplets in ``argument``;
+    runs commands one after another when tuplets nest.
+    """
+    tuplets = abjad.select.tuplets(argument)
+    if any(not isinstance(_, abjad.Leaf) for tuplet in tuplets for _ in tuplet):
+        for function, arguments, keywords in triples:
+            function(argument, *arguments, **keywords)
+        return
+
+    def function_(tuplet):
+        for function, arguments, keywords in triples:
+            function(tuplet, *arguments, **keywords)
+
+    _functions._update_tuplets(tuplets, function_)
+
+
+def _select(argument, selector):
+    for function, each, arguments in selector:
+        if each is True:
+            argument = [function(_, *arguments) for _ in argument]
+        else:
+            argument = function(argument, *arguments)
+    return argument
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Command:
+    """
+    Command spec.
+
+    ..  container:: example
+
+        >>> rmakers.Command("tie", selector=(("tuplets",), ("*leaf", -1)))
+        Command(name='tie', arguments=(), keywords={}, selector=(('tuplets',), ('*leaf', -1)))
+
+    Names public rmakers command; ``arguments`` and ``keywords`` follow the
+    voice the command is applied to.
+
+    Applies command to voice when ``selector`` is empty. Otherwise, applies
+    command to result of ``abjad.select`` functions named in ``selector``,
+    one after another; names prefixed with ``*`` apply to each item of the
+    previous result. Passes selector arguments as lists, so that
+    ``("get", (0,), 2)`` gets every other item.
+    """
+
+    name: str
+    arguments: tuple = ()
+    keywords: dict = dataclasses.field(default_factory=dict)
+    selector: tuple = ()
+
+    def __post_init__(self):
+        assert isinstance(self.name, str), repr(self.name)
+        if self.name not in _command_names:
+            raise Exception(f"unknown command: {self.name!r}.")
+        assert isinstance(self.arguments, tuple), repr(self.arguments)
+        assert isinstance(self.keywords, dict), repr(self.keywords)
+        assert isinstance(self.selector, tuple), repr(self.selector)
+        for step in self.selector:
+            assert isinstance(step, tuple) and step, repr(step)
+            if step[0].removeprefix("*") not in _selector_names:
+                raise Exception(f"unknown selector: {step[0]!r}.")
+        _check_json(self.arguments, "command arguments")
+        _check_json(self.keywords, "command keywords")
+        _check_json(self.selector, "command selector")
+
+    @staticmethod
+    def from_dict(dictionary: dict) -> "Command":
+        """
+        Makes command from JSON-compatible ``dictionary``.
+        """
+        assert isinstance(dictionary, dict), repr(dictionary)
+        for key in dictionary:
+            if key not in ("arguments", "command", "keywords", "selector"):
+                raise Exception(f"unknown command key: {key!r}.")
+        return Command(
+            dictionary["command"],
+            _decode(dictionary.get("arguments", ())),
+            _decode(dictionary.get("keywords", {})),
+            _decode(dictionary.get("selector", ())),
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Changes command to JSON-compatible dictionary.
+        """
+        dictionary: dict[str, typing.Any] = {"command": self.name}
+        if self.arguments:
+            dictionary["arguments"] = _encode(self.arguments)
+        if self.keywords:
+            dictionary["keywords"] = _encode(self.keywords)
+        if self.selector:
+            dictionary["selector"] = _encode(self.selector)
+        return dictionary
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Recipe:
+    r"""
+    Recipe spec.
+
+    ..  container:: example
+
+        >>> recipe = rmakers.Recipe(
+        ...     "talea",
+        ...     ((3, 8), (4, 8)),
+        ...     arguments=((1, 2, 3), 16),
+        ...     keywords={"extra_counts": (0, 1)},
+        ...     commands=(
+        ...         rmakers.Command("unbeam"),
+        ...         rmakers.Command("beam"),
+        ...         rmakers.Command("force_fraction"),
+        ...         rmakers.Command("force_fraction"),
+        ...         rmakers.Command("tie", selector=(("tuplets",), ("*leaf", -1))),
+        ...         rmakers.Command("extract_trivial"),
+        ...     ),
+        ... )
+        >>> voice, state = recipe.make_voice()
+        >>> string = abjad.lilypond(voice)
+        >>> print(string)
+        \context Voice = "RhythmMaker.Music"
+        {
+            c'16
+            [
+            c'8
+            c'8.
+            ]
+            ~
+            \tweak text #tuplet-number::calc-fraction-text
+            \tuplet 9/8
+            {
+                c'16
+                [
+                c'8
+                c'8.
+                c'16
+                c'8
+                ]
+                ~
+            }
+        }
+
+        Drops commands that make no difference:
+
+        >>> for command in recipe.optimize().commands:
+        ...     command.name
+        ...
+        'beam'
+        'force_fraction'
+        'tie'
+        'extract_trivial'
+
+    Compiles recipe on first use and keeps compiled plan for recipes equal to
+    it. Drops ``unbeam`` right before ``beam``, ``denominator`` right before
+    ``denominator`` and repeats of idempotent commands with equal arguments;
+    applies runs of tuplet commands with equal selectors in one traversal of
+    tuplets.
+
+    Takes JSON-compatible time signatures, arguments and keywords, as in
+    ``Recipe.from_dict()``: tags are strings and spellings are dictionaries.
+    """
+
+    maker: str
+    time_signatures: tuple
+    arguments: tuple = ()
+    keywords: dict = dataclasses.field(default_factory=dict)
+    commands: tuple[Command, ...] = ()
+
+    def __post_init__(self):
+        assert isinstance(self.maker, str), repr(self.maker)
+        if self.maker not in _maker_names:
+            raise Exception(f"unknown maker: {self.maker!r}.")
+        assert isinstance(self.time_signatures, tuple), repr(self.time_signatures)
+        assert isinstance(self.arguments, tuple), repr(self.arguments)
+        assert isinstance(self.keywords, dict), repr(self.keywords)
+        assert isinstance(self.commands, tuple), repr(self.commands)
+        assert all(isinstance(_, Command) for _ in self.commands), repr(self.commands)
+        _check_json(self.time_signatures, "recipe time signatures")
+        _check_json(self.arguments, "recipe arguments")
+        _check_json(self.keywords, "recipe keywords")
+
+    @staticmethod
+    def from_dict(dictionary: dict) -> "Recipe":
+        """
+        Makes recipe from JSON-compatible ``dictionary``.
+        """
+        assert isinstance(dictionary, dict), repr(dictionary)
+        for key in dictionary:
+            if key not in _recipe_keys:
+                raise Exception(f"unknown recipe key: {key!r}.")
+        return Recipe(
+            dictionary["maker"],
+            _decode(dictionary["time_signatures"]),
+            _decode(dictionary.get("arguments", ())),
+            _decode(dictionary.get("keywords", {})),
+            tuple(Command.from_dict(_) for _ in dictionary.get("commands", ())),
+        )
+
+    def make_voice(
+        self, *, previous_state: dict | None = None
+    ) -> tuple[abjad.Voice, dict]:
+        """
+        Makes music voice and state; wraps music voice in time signature staff.
+
+        State is empty for makers that keep no state.
+        """
+        string = json.dumps(self.to_dict(), sort_keys=True)
+        maker, arguments, keywords, pairs, steps = _compile(string)
+        time_signatures = _functions.time_signatures(pairs)
+        durations = [abjad.Duration(_.pair) for _ in time_signatures]
+        keywords = dict(keywords)
+        if previous_state is not None:
+            keywords["previous_state"] = previous_state
+        state: dict = {}
+        if "state" in inspect.signature(maker).parameters:
+            keywords["state"] = state
+        tuplets = maker(durations, *arguments, **keywords)
+        voice = _functions.wrap_in_time_signature_staff(tuplets, time_signatures)
+        for selector, function, arguments_, keywords_ in steps:
+            function(_select(voice, selector), *arguments_, **keywords_)
+        return voice, state
+
+    def optimize(self) -> "Recipe":
+        """
+        Makes recipe without commands that make no difference.
+        """
+        commands: list[Command] = []
+        for command in self.commands:
+            while commands and _is_no_op(commands[-1], command):
+                commands.pop()
+            commands.append(command)
+        return dataclasses.replace(self, commands=tuple(commands))
+
+    def to_dict(self) -> dict:
+        """
+        Changes recipe to JSON-compatible dictionary.
+        """
+        dictionary: dict[str, typing.Any] = {
+            "maker": self.maker,
+            "time_signatures": _encode(self.time_signatures),
+        }
+        if self.arguments:
+            dictionary["arguments"] = _encode(self.arguments)
+        if self.keywords:
+            dictionary["keywords"] = _encode(self.keywords)
+        if self.commands:
+            dictionary["commands"] = [_.to_dict() for _ in self.commands]
+        return dictionary
+
+
+def make_voice(recipe: dict) -> tuple[abjad.Voice, dict]:
+    """
+    Makes music voice and state of ``recipe`` dictionary.
+
+    Wraps music voice in time signature staff; state is empty for makers
+    that keep no state.
+    """
+    return Recipe.from_dict(recipe).make_voice()
+
+
+def run(recipe: dict) -> dict:
+    """
+    Runs ``recipe``.
+
+    Returns a JSON-compatible dictionary with ``state`` and either
+    ``lilypond`` text (the default) or rhythm ``data``, as set by the
+    recipe's ``output`` entry.
+
+    ..  container:: example
+
+        >>> import rmakers.recipes
+        >>> recipe = {
+        ...     "maker": "even_division",
+        ...     "time_signatures": [[2, 8]],
+        ...     "arguments": [[8]],
+        ...     "commands": [{"command": "tie"}],
+        ...     "output": "data",
+        ... }
+        >>> rmakers.recipes.run(recipe)["data"]
+        [{'type': 'Tuplet', 'multiplier': [1, 1], 'components': [{'type': 'Note', 'duration': [1, 8], 'tie': True}, {'type': 'Note', 'duration': [1, 8], 'tie': True}]}]
+
+    """
+    output = recipe.get("output", "lilypond")
+    if output not in _outputs:
+        raise Exception(f"unknown output: {output!r}.")
+    voice, state = make_voice(recipe)
+    return _get_result(voice, state, output)
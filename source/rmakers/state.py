@@ -584,6 +584,23 @@ Examples that show how to work with rmakers in a statal way.
         ('logical_ties_produced', 24)
         ('talea_weight_consumed', 96)
 
+..  container:: example
+
+    Makers accept ``rmakers.State`` objects as ``previous_state``. States
+    encode to compact strings for storage:
+
+    >>> pairs = [(3, 8), (4, 8), (3, 8), (4, 8)]
+    >>> durations = [abjad.Duration(_) for _ in pairs]
+    >>> previous_state = rmakers.State.decode("4:1:8:31")
+    >>> state = {}
+    >>> tuplets = rmakers.talea(
+    ...     durations, [4], 16, extra_counts=[0, 1, 2],
+    ...     previous_state=previous_state,
+    ...     state=state,
+    ... )
+    >>> rmakers.State.from_dict(state).encode()
+    '8:1:16:63'
+
 """
 
 
@@ -0,0 +1,116 @@
+import asyncio
+import multiprocessing
+import time
+
+import abjad
+import pytest
+
+import rmakers
+import rmakers.aio
+import rmakers.recipes
+
+
+class _Error(Exception):
+    def __init__(self, message, count):
+        super().__init__(message)
+
+
+def _raise(message, count=None):
+    if count is None:
+        raise ValueError(message)
+    raise _Error(message, count)
+
+
+recipe = {
+    "maker": "talea",
+    "time_signatures": [[3, 8], [4, 8], [5, 16]],
+    "arguments": [[1, 2, 3, -1], 16],
+    "keywords": {"extra_counts": [0, 1]},
+    "commands": [{"command": "beam"}, {"command": "rewrite_meter"}],
+}
+
+
+@pytest.mark.parametrize("threads", [None, False, True])
+def test_aio_01(threads):
+    """
+    Awaited results match those of ``rmakers.recipes.run()`` and of makers;
+    makers update ``state`` as when called directly.
+    """
+
+    async def main(runner):
+        results = await asyncio.gather(
+            rmakers.aio.run(recipe, runner=runner),
+            rmakers.aio.run(recipe, output="lilypond", runner=runner),
+        )
+        state: dict = {}
+        durations = [abjad.Duration(3, 8), abjad.Duration(4, 8)]
+        tuplets = await rmakers.aio.talea(
+            durations, [1, 2, 3], 16, state=state, runner=runner
+        )
+        with pytest.raises(Exception, match="unknown maker: 'foo'"):
+            await rmakers.aio.run(
+                {"maker": "foo", "time_signatures": []}, runner=runner
+            )
+        return results, tuplets, state
+
+    if threads is None:
+        results, tuplets, state = asyncio.run(main(None))
+    else:
+        with rmakers.aio.Runner(threads=threads, workers=2) as runner:
+            results, tuplets, state = asyncio.run(main(runner))
+    assert results[0] == rmakers.recipes.run(dict(recipe, output="data"))
+    assert results[1] == rmakers.recipes.run(recipe)
+    state_: dict = {}
+    durations = [abjad.Duration(3, 8), abjad.Duration(4, 8)]
+    tuplets_ = rmakers.talea(durations, [1, 2, 3], 16, state=state_)
+    assert rmakers.fingerprint(tuplets) == rmakers.fingerprint(tuplets_)
+    assert state == state_
+
+
+def test_aio_02():
+    """
+    Cancelling a call to a process runner stops its worker process; the
+    runner then serves later calls.
+    """
+    long_recipe = dict(recipe, time_signatures=[[3, 8], [4, 8]] * 2000)
+
+    async def main(runner):
+        await runner.run(recipe)
+        processes = multiprocessing.active_children()
+        assert len(processes) == 1
+        task = asyncio.create_task(runner.run(long_recipe))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not processes[0].is_alive()
+        return await runner.run(recipe)
+
+    start = time.perf_counter()
+    with rmakers.aio.Runner(workers=1) as runner:
+        result = asyncio.run(main(runner))
+    assert time.perf_counter() - start < 10
+    assert result == rmakers.recipes.run(dict(recipe, output="data"))
+    assert multiprocessing.active_children() == []
+
+
+@pytest.mark.parametrize("threads", [False, True])
+def test_aio_03(threads):
+    """
+    Runners raise worker exceptions with their types; process runners raise
+    exceptions that cannot be pickled as ``Exception`` with the same message.
+    """
+
+    async def main(runner):
+        durations = [abjad.Duration(3, 8)]
+        with pytest.raises(AssertionError):
+            await runner.make("talea", durations, "foo", 16)
+        with pytest.raises(ValueError, match="bar"):
+            await runner._call(_raise, "bar")
+        with pytest.raises(Exception, match="bar") as info:
+            await runner._call(_raise, "bar", 1)
+        return info.type
+
+    with rmakers.aio.Runner(threads=threads, workers=1) as runner:
+        type_ = asyncio.run(main(runner))
+    assert type_ is (_Error if threads else Exception)
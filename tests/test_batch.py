@@ -0,0 +1,95 @@
+import json
+
+import abjad
+import pytest
+
+import rmakers
+import rmakers.batch
+import rmakers.recipes
+
+
+def _write_recipes(directory, recipes):
+    for name, recipe in recipes.items():
+        (directory / f"{name}.json").write_text(json.dumps(recipe))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_01(tmp_path, workers):
+    """
+    ``rmakers.batch.run()`` continues previous states, writes LilyPond files
+    and states, and reruns only recipes whose inputs change.
+    """
+    recipe = {
+        "maker": "talea",
+        "time_signatures": [[3, 8], [5, 16]],
+        "arguments": [[1, 2, 3, -1], 16],
+        "keywords": {"extra_counts": [0, 1]},
+        "commands": [{"command": "beam"}, {"command": "rewrite_meter"}],
+    }
+    recipes = {
+        "a": recipe,
+        "b": recipe | {"previous_state": "a"},
+        "c": recipe | {"previous_state": "b"},
+        "d": recipe | {"previous_state": {"talea_weight_consumed": 2}},
+    }
+    _write_recipes(tmp_path, recipes)
+    version = r'\version "2.25.0"'
+    output = tmp_path / "output"
+    states = rmakers.batch.run(
+        str(tmp_path), str(output), lilypond_version_token=version, workers=workers
+    )
+    previous_states = {"a": None, "b": "a", "c": "b", "d": {"talea_weight_consumed": 2}}
+    for name, previous_state in previous_states.items():
+        if isinstance(previous_state, str):
+            previous_state = states[previous_state]
+        recipe_ = dict(recipe, keywords=dict(recipe["keywords"]))
+        if previous_state is not None:
+            recipe_["keywords"]["previous_state"] = previous_state
+        voice, state = rmakers.recipes.make_voice(recipe_)
+        assert states[name] == state
+        assert json.loads((output / f"{name}.state.json").read_text()) == state
+        score = abjad.get.parentage(voice).root
+        lilypond_file = abjad.LilyPondFile([score], lilypond_version_token=version)
+        assert (output / f"{name}.ly").read_text() == abjad.lilypond(lilypond_file)
+    mtimes = {_.name: _.stat().st_mtime_ns for _ in output.glob("*.ly")}
+    recipes["c"] = recipes["c"] | {"commands": [{"command": "beam"}]}
+    _write_recipes(tmp_path, recipes)
+    states_ = rmakers.batch.run(
+        str(tmp_path), str(output), lilypond_version_token=version, workers=workers
+    )
+    assert states_ == states
+    mtimes_ = {_.name: _.stat().st_mtime_ns for _ in output.glob("*.ly")}
+    assert [_ for _ in mtimes if mtimes[_] != mtimes_[_]] == ["c.ly"]
+
+
+def test_batch_02(tmp_path):
+    """
+    ``rmakers.batch.run()`` raises on unknown and cyclic previous states.
+    """
+    recipe = {"maker": "note", "time_signatures": [[1, 4]]}
+    _write_recipes(tmp_path, {"a": recipe | {"previous_state": "z"}})
+    with pytest.raises(Exception, match="unknown previous state 'z'"):
+        rmakers.batch.run(str(tmp_path))
+    recipes = {
+        "a": recipe | {"previous_state": "b"},
+        "b": recipe | {"previous_state": "a"},
+        "c": recipe,
+    }
+    _write_recipes(tmp_path, recipes)
+    with pytest.raises(Exception, match="cycle: a, b"):
+        rmakers.batch.run(str(tmp_path), lilypond_version_token="", workers=1)
+
+
+def test_batch_03(tmp_path):
+    """
+    ``rmakers-batch`` entry point renders recipes and names failing recipe.
+    """
+    recipe = {"maker": "note", "time_signatures": [[1, 4]]}
+    _write_recipes(tmp_path, {"a": recipe})
+    arguments = [str(tmp_path), "--workers", "1", "--lilypond-version", "2.25.0"]
+    rmakers.batch.main(arguments)
+    assert (tmp_path / "a.ly").read_text().startswith(r'\version "2.25.0"')
+    assert json.loads((tmp_path / "a.state.json").read_text()) == {}
+    _write_recipes(tmp_path, {"b": recipe | {"commands": [{"command": "foo"}]}})
+    with pytest.raises(Exception, match="b: unknown command: 'foo'"):
+        rmakers.batch.main(arguments)
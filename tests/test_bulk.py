@@ -0,0 +1,40 @@
+import gc
+
+import pytest
+
+import rmakers
+
+
+def test_bulk_01():
+    """
+    ``rmakers.bulk()`` pauses collection and restores it, even on exception.
+    """
+    assert gc.isenabled()
+    with pytest.raises(ZeroDivisionError):
+        with rmakers.bulk():
+            assert not gc.isenabled()
+            with rmakers.bulk():
+                assert not gc.isenabled()
+            assert not gc.isenabled()
+            1 / 0
+    assert gc.isenabled()
+    gc.disable()
+    try:
+        with rmakers.bulk():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def test_bulk_02():
+    """
+    ``rmakers.bulk(freeze=True)`` moves objects to the permanent generation.
+    """
+    count = gc.get_freeze_count()
+    try:
+        with rmakers.bulk(freeze=True):
+            objects = [[] for _ in range(100)]
+        assert count + len(objects) <= gc.get_freeze_count()
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,123 @@
+import abjad
+import pytest
+
+import rmakers
+
+pairs = [(3, 8), (4, 8), (5, 16), (2, 4)] * 3
+
+
+def _make_voice():
+    time_signatures = rmakers.time_signatures(pairs)
+    durations = [abjad.Duration(_) for _ in time_signatures]
+    tuplets = rmakers.talea(durations, [5, 4, -1], 16, extra_counts=[0, 0, 1])
+    voice = rmakers.wrap_in_time_signature_staff(tuplets, time_signatures)
+    rmakers.beam(voice)
+    rmakers.extract_trivial(voice)
+    return voice
+
+
+@pytest.mark.parametrize(
+    "maker, arguments",
+    [
+        (rmakers.accelerando, ([(1, 8), (1, 20), (1, 16)],)),
+        (rmakers.talea, ([1, 2, 3], 16)),
+    ],
+)
+def test_cancellation_01(maker, arguments):
+    """
+    Makers report progress after each duration; cancelling raises
+    ``rmakers.Cancelled`` and leaves ``state`` unchanged.
+    """
+    durations = [abjad.Duration(_) for _ in pairs]
+    calls = []
+    cancellation = rmakers.Cancellation()
+    tuplets = maker(
+        durations,
+        *arguments,
+        cancellation=cancellation,
+        progress=lambda *_: calls.append(_),
+    )
+    assert calls == [(_, len(durations)) for _ in range(1, len(durations) + 1)]
+    assert rmakers.fingerprint(tuplets) == rmakers.fingerprint(
+        maker(durations, *arguments)
+    )
+
+    def progress(count, total):
+        if count == 5:
+            cancellation.cancel()
+
+    cancellation = rmakers.Cancellation()
+    state = {"durations_consumed": 99}
+    with pytest.raises(rmakers.Cancelled, match="cancelled"):
+        maker(
+            durations,
+            *arguments,
+            cancellation=cancellation,
+            progress=progress,
+            state=state,
+        )
+    assert state == {"durations_consumed": 99}
+    with pytest.raises(rmakers.Cancelled, match="deadline passed"):
+        maker(durations, *arguments, cancellation=rmakers.Cancellation(timeout=0))
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_cancellation_02(workers):
+    """
+    Rewrite-meter with uncancelled token matches rewrite-meter without token;
+    cancelling raises ``rmakers.Cancelled`` and leaves voice unchanged.
+    """
+    voice = _make_voice()
+    rmakers.rewrite_meter(voice, workers=workers)
+    voice_ = _make_voice()
+    calls = []
+    rmakers.rewrite_meter(
+        voice_,
+        cancellation=rmakers.Cancellation(),
+        progress=lambda *_: calls.append(_),
+        workers=workers,
+    )
+    assert rmakers.to_lilypond(voice_) == rmakers.to_lilypond(voice)
+    assert calls and calls[-1][0] == calls[-1][1]
+    assert [_[0] for _ in calls] == list(range(1, len(calls) + 1))
+    voice = _make_voice()
+    string, leaves = rmakers.to_lilypond(voice), abjad.select.leaves(voice)
+    cancellation = rmakers.Cancellation()
+
+    def progress(count, total):
+        if count == 2:
+            cancellation.cancel()
+
+    with pytest.raises(rmakers.Cancelled):
+        rmakers.rewrite_meter(
+            voice, cancellation=cancellation, progress=progress, workers=workers
+        )
+    assert rmakers.to_lilypond(voice) == string
+    assert abjad.select.leaves(voice) == leaves
+
+
+def test_cancellation_03():
+    """
+    Rewrite-meter with token handles grace containers, matches rewrite-meter
+    without token and keeps leaves of unchanged measures.
+    """
+
+    def make_voice():
+        time_signatures = rmakers.time_signatures([(4, 4)] * 4)
+        durations = [abjad.Duration(_) for _ in time_signatures]
+        tuplets = rmakers.note(durations[:2])
+        tuplets += rmakers.talea(durations[2:], [3, 5, -1], 16)
+        voice = rmakers.wrap_in_time_signature_staff(tuplets, time_signatures)
+        rmakers.extract_trivial(voice)
+        leaves = abjad.select.leaves(voice)
+        rmakers.before_grace_container(leaves[1:2], [1])
+        rmakers.before_grace_container(leaves[3:4], [1])
+        return voice
+
+    voice = make_voice()
+    rmakers.rewrite_meter(voice)
+    voice_ = make_voice()
+    leaves = abjad.select.leaves(voice_)
+    rmakers.rewrite_meter(voice_, cancellation=rmakers.Cancellation())
+    assert rmakers.to_lilypond(voice_) == rmakers.to_lilypond(voice)
+    assert abjad.select.leaves(voice_)[:2] == leaves[:2]
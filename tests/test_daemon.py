@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+
+import rmakers.daemon
+import rmakers.recipes
+
+recipes = [
+    {
+        "maker": "talea",
+        "time_signatures": [[3, 8], [4, 8], [5, 16]],
+        "arguments": [[1, 2, 3, -1], 16],
+        "keywords": {
+            "extra_counts": [0, 1],
+            "previous_state": {"talea_weight_consumed": 3},
+        },
+        "commands": [{"command": "beam"}, {"command": "rewrite_meter"}],
+    },
+    {
+        "maker": "accelerando",
+        "time_signatures": [[4, 8], [3, 8]],
+        "arguments": [[[1, 8], [1, 20], [1, 16]]],
+        "commands": [{"command": "feather_beam"}, {"command": "duration_bracket"}],
+        "output": "data",
+    },
+    {
+        "maker": "tuplet",
+        "time_signatures": [[2, 4]],
+        "arguments": [[[1, 2, 1]]],
+        "keywords": {"spelling": {"forbidden_note_duration": [1, 8]}},
+        "commands": [{"command": "denominator", "arguments": [[1, 16]]}],
+        "id": 7,
+    },
+]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_daemon_01(tmp_path, workers):
+    """
+    Daemon responses match ``rmakers.recipes.run()``, whatever the number of
+    workers and clients.
+    """
+    path = str(tmp_path / "rmakers.sock")
+    server = rmakers.daemon.Server(path, workers=workers)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        responses = [None, None]
+
+        def run(i):
+            with rmakers.daemon.Client(path) as client:
+                responses[i] = [client.run(_) for _ in recipes]
+
+        threads = [threading.Thread(target=run, args=(_,)) for _ in range(2)]
+        for thread_ in threads:
+            thread_.start()
+        for thread_ in threads:
+            thread_.join()
+        for responses_ in responses:
+            assert responses_ is not None
+            for recipe, response in zip(recipes, responses_):
+                result = rmakers.recipes.run(recipe)
+                if "id" in recipe:
+                    result["id"] = recipe["id"]
+                assert response == result
+        with rmakers.daemon.Client(path) as client:
+            with pytest.raises(Exception, match="unknown maker: 'foo'"):
+                client.run({"maker": "foo", "time_signatures": []})
+            assert client.run(recipes[0]) == rmakers.recipes.run(recipes[0])
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
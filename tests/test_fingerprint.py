@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+
+import abjad
+import pytest
+
+import rmakers
+
+
+def _make_tuplets():
+    durations = [abjad.Duration(_) for _ in [(3, 8), (4, 8), (3, 8), (4, 8)]]
+    tuplets = rmakers.talea(durations, [1, 2, 3], 16, extra_counts=[0, 1])
+    rmakers.beam(tuplets)
+    return tuplets
+
+
+def test_fingerprint_01():
+    """
+    ``rmakers.fingerprint()`` is stable across processes.
+    """
+    string = "import abjad, rmakers; import test_fingerprint as _;"
+    string += " print(rmakers.fingerprint(_._make_tuplets()))"
+    result = subprocess.run(
+        [sys.executable, "-c", string],
+        capture_output=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env={**os.environ, "PYTHONHASHSEED": "1"},
+        text=True,
+    )
+    assert result.stdout.strip() == rmakers.fingerprint(_make_tuplets())
+
+
+def test_fingerprint_02():
+    """
+    ``rmakers.fingerprint()`` ignores pitches, and ignores tags unless asked.
+    """
+    tuplets = _make_tuplets()
+    string = rmakers.fingerprint(tuplets)
+    assert rmakers.fingerprint(tuplets[:1]) == rmakers.fingerprint(tuplets[0])
+    assert rmakers.fingerprint(tuplets[:1]) != rmakers.fingerprint(tuplets[1])
+    abjad.mutate.transpose(tuplets, 2)
+    assert rmakers.fingerprint(tuplets) == string
+    string_ = rmakers.fingerprint(tuplets, tags=True)
+    tuplets[0].tag = abjad.Tag("A")
+    assert rmakers.fingerprint(tuplets) == string
+    assert rmakers.fingerprint(tuplets, tags=True) != string_
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        lambda _: rmakers.tie(abjad.select.note(_, 0)),
+        lambda _: rmakers.repeat_tie(abjad.select.note(_, 1)),
+        lambda _: rmakers.unbeam(_[0]),
+        lambda _: rmakers.force_rest(abjad.select.note(_, 0)),
+        lambda _: rmakers.denominator(_, (1, 32)),
+        lambda _: rmakers.force_fraction(_),
+        lambda _: rmakers.written_duration(_, (1, 16)),
+        lambda _: rmakers.before_grace_container(abjad.select.note(_, 0), [1]),
+    ],
+)
+def test_fingerprint_03(function):
+    """
+    ``rmakers.fingerprint()`` changes with rhythmic structure.
+    """
+    tuplets = _make_tuplets()
+    string = rmakers.fingerprint(tuplets)
+    function(tuplets)
+    assert rmakers.fingerprint(tuplets) != string
+
+
+def test_fingerprint_04():
+    """
+    ``rmakers.fingerprint(..., tags=True)`` handles untagged grace containers.
+    """
+    tuplets = _make_tuplets()
+    string = rmakers.fingerprint(tuplets, tags=True)
+    rmakers.before_grace_container(abjad.select.note(tuplets, 0), [1])
+    assert rmakers.fingerprint(tuplets, tags=True) != string
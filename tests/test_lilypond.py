@@ -0,0 +1,102 @@
+import doctest
+import io
+
+import abjad
+import pytest
+
+import rmakers
+
+
+def _get_docstrings(module):
+    for name in dir(module):
+        function = getattr(module, name)
+        if (
+            callable(function)
+            and function.__doc__
+            and "lilypond_file" in function.__doc__
+        ):
+            yield name, function.__doc__
+
+
+def _get_lilypond_files(docstring):
+    parser = doctest.DocTestParser()
+    globs = {"abjad": abjad, "rmakers": rmakers}
+    for example in parser.get_examples(docstring):
+        if example.options.get(doctest.SKIP):
+            continue
+        lilypond_file = globs.get("lilypond_file")
+        exec(compile(example.source, "<doctest>", "single"), globs)
+        if globs.get("lilypond_file") is not lilypond_file:
+            yield globs["lilypond_file"]
+
+
+@pytest.mark.parametrize(
+    "name, docstring",
+    list(_get_docstrings(rmakers.makers)) + list(_get_docstrings(rmakers.functions)),
+)
+def test_lilypond_01(name, docstring, capsys):
+    """
+    ``rmakers.to_lilypond()`` matches ``abjad.lilypond()`` for every example in
+    maker and command docstrings.
+    """
+    for lilypond_file in _get_lilypond_files(docstring):
+        score = lilypond_file["Score"]
+        assert rmakers.to_lilypond(score) == abjad.lilypond(score), name
+
+
+@pytest.mark.parametrize("buffer_size", [1, 100, 65536])
+@pytest.mark.parametrize(
+    "name, docstring",
+    list(_get_docstrings(rmakers.makers)) + list(_get_docstrings(rmakers.functions)),
+)
+def test_lilypond_02(name, docstring, buffer_size, capsys):
+    """
+    ``rmakers.write_lilypond()`` writes ``abjad.lilypond()`` for every example
+    in maker and command docstrings, whatever the buffer size.
+    """
+    for lilypond_file in _get_lilypond_files(docstring):
+        lilypond_file.lilypond_version_token = r'\version "2.25.0"'
+        file = io.StringIO()
+        rmakers.write_lilypond(lilypond_file, file, buffer_size=buffer_size)
+        assert file.getvalue() == abjad.lilypond(lilypond_file), name
+
+
+def test_lilypond_03(monkeypatch):
+    """
+    ``rmakers.write_lilypond()`` streams containers with indicators, overrides
+    and tweaks, and components in blocks, and writes ``abjad.lilypond()``.
+    """
+    time_signatures = rmakers.time_signatures([(3, 8), (4, 8), (5, 16)])
+    durations = [abjad.Duration(_) for _ in time_signatures]
+    tuplets = rmakers.talea(durations, [1, 2, 3, -1], 16, extra_counts=[0, 1])
+    voice = rmakers.wrap_in_time_signature_staff(tuplets, time_signatures)
+    rmakers.beam(voice)
+    rmakers.before_grace_container(abjad.select.leaves(voice)[3:4], [1])
+    literal = abjad.LilyPondLiteral(r"\voiceOne", site="opening")
+    abjad.attach(literal, voice)
+    abjad.attach(abjad.LilyPondLiteral("% tuplet", site="before"), voice[0])
+    abjad.attach(abjad.Markup(r"\markup foo"), abjad.select.leaf(voice, 2))
+    abjad.override(voice[2]).TupletBracket.color = "#red"
+    abjad.tweak(voice[1], r"\tweak color #blue")
+    score = abjad.get.parentage(voice).root
+    for argument in (score, voice, voice[0]):
+        assert rmakers.to_lilypond(argument) == abjad.lilypond(argument)
+    block = abjad.Block("header", items=[r"title = \markup Title"])
+    block = abjad.Block("score", items=[block, score, abjad.Block("layout")])
+    lilypond_file = abjad.LilyPondFile(
+        [r'\include "abjad.ily"', block],
+        lilypond_version_token=r'\version "2.25.0"',
+        tag=abjad.Tag("TAG"),
+    )
+    string = abjad.lilypond(lilypond_file)
+    lilypond = abjad.lilypond
+
+    def _lilypond(argument, **keywords):
+        assert not isinstance(argument, abjad.Container) or len(argument) == 1
+        return lilypond(argument, **keywords)
+
+    monkeypatch.setattr(abjad, "lilypond", _lilypond)
+    for buffer_size in (1, 100, 65536):
+        file = io.StringIO()
+        rmakers.write_lilypond(lilypond_file, file, buffer_size=buffer_size)
+        assert file.getvalue() == string
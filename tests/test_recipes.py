@@ -0,0 +1,152 @@
+import random
+
+import abjad
+import pytest
+
+import rmakers
+import rmakers.recipes
+
+commands = [
+    ("beam", (), {}),
+    ("beam", (), {"beam_rests": True}),
+    ("denominator", ((1, 16),), {}),
+    ("denominator", (8,), {}),
+    ("duration_bracket", (), {}),
+    ("extract_trivial", (), {}),
+    ("force_augmentation", (), {}),
+    ("force_diminution", (), {}),
+    ("force_fraction", (), {}),
+    ("force_note", (), {}),
+    ("force_rest", (), {}),
+    ("reduce_multiplier", (), {}),
+    ("rewrite_dots", (), {}),
+    ("rewrite_meter", (), {}),
+    ("tie", (), {}),
+    ("trivialize", (), {}),
+    ("unbeam", (), {}),
+    ("untie", (), {}),
+]
+
+selectors = [
+    (),
+    (("tuplets",),),
+    (("tuplets",), ("get", (0,), 2)),
+    (("tuplets",), ("*leaf", -1)),
+    (("notes",), ("get", (0,))),
+    (("rests",), ("get", (0, -1))),
+    (("logical_ties",), ("get", (1,))),
+]
+
+
+def _make_voice_naively(recipe):
+    time_signatures = rmakers.time_signatures(list(recipe.time_signatures))
+    durations = [abjad.Duration(_.pair) for _ in time_signatures]
+    maker = getattr(rmakers, recipe.maker)
+    tuplets = maker(durations, *recipe.arguments, **recipe.keywords)
+    voice = rmakers.wrap_in_time_signature_staff(tuplets, time_signatures)
+    for command in recipe.commands:
+        argument = voice
+        for name, *arguments in command.selector:
+            function = getattr(abjad.select, name.removeprefix("*"))
+            arguments = [list(_) if isinstance(_, tuple) else _ for _ in arguments]
+            if name.startswith("*"):
+                argument = [function(_, *arguments) for _ in argument]
+            else:
+                argument = function(argument, *arguments)
+        function = getattr(rmakers, command.name)
+        function(argument, *command.arguments, **command.keywords)
+    return voice
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_recipes_01(seed):
+    """
+    Optimized and compiled recipes match commands applied one after another.
+    """
+    rng = random.Random(seed)
+    for _ in range(10):
+        pairs = [rng.choice([(3, 8), (4, 8), (5, 16), (2, 4)]) for _ in range(4)]
+        counts = [rng.choice([1, 2, 3, -1, 4, 5]) for _ in range(4)]
+        extra_counts = [rng.choice([0, 1, 2, -1]) for _ in range(3)]
+        commands_ = []
+        for _ in range(rng.randint(1, 8)):
+            name, arguments, keywords = rng.choice(commands)
+            selector = ()
+            if name != "rewrite_meter":
+                selector = rng.choice(selectors[:2] if _ % 2 else selectors)
+            if selector and name in ("extract_trivial", "rewrite_meter"):
+                selector = ()
+            command = rmakers.Command(name, arguments, keywords, selector)
+            commands_.extend([command] * rng.randint(1, 2))
+        recipe = rmakers.Recipe(
+            "talea",
+            tuple(pairs),
+            arguments=(tuple(counts), 16),
+            keywords={"extra_counts": tuple(extra_counts)},
+            commands=tuple(commands_),
+        )
+        voice, _ = recipe.make_voice()
+        try:
+            voice_ = _make_voice_naively(recipe)
+        except Exception:
+            continue
+        assert abjad.lilypond(voice) == abjad.lilypond(voice_), recipe
+
+
+def test_recipes_02():
+    """
+    Recipes round-trip through dictionaries and share compiled plans.
+    """
+    dictionary = {
+        "maker": "even_division",
+        "time_signatures": [[3, 8], [2, 4]],
+        "arguments": [[8]],
+        "keywords": {"extra_counts": [0, 1]},
+        "commands": [
+            {"command": "force_fraction", "selector": [["tuplets"]]},
+            {"command": "tie", "selector": [["tuplets"], ["*leaf", -1]]},
+        ],
+    }
+    recipe = rmakers.Recipe.from_dict(dictionary)
+    assert recipe.to_dict() == dictionary
+    assert rmakers.Recipe.from_dict(recipe.to_dict()) == recipe
+    rmakers.recipes._compile.cache_clear()
+    recipe.make_voice()
+    rmakers.Recipe.from_dict(dictionary).make_voice()
+    assert rmakers.recipes._compile.cache_info().hits == 1
+    with pytest.raises(Exception, match="unknown selector: 'foo'"):
+        rmakers.Command("tie", selector=(("foo",),))
+    with pytest.raises(Exception, match="recipe keywords must be JSON-compatible"):
+        rmakers.Recipe(
+            "talea",
+            ((3, 8),),
+            arguments=((1, 2), 16),
+            keywords={"tag": abjad.Tag("x")},
+        )
+    with pytest.raises(Exception, match="command arguments must be JSON-compatible"):
+        rmakers.Command("denominator", (abjad.Duration(1, 16),))
+    recipe = rmakers.Recipe(
+        "talea", ((3, 8),), arguments=((1, 2), 16), keywords={"tag": "x"}
+    )
+    voice, state = recipe.make_voice()
+    assert abjad.get.leaf(voice, 0).tag.string.startswith("x:")
+
+
+def test_recipes_03():
+    """
+    Recipes keep repeated commands whose selector reads what the command
+    changes.
+    """
+    dictionary = {
+        "maker": "even_division",
+        "time_signatures": [[2, 8], [2, 8]],
+        "arguments": [[8]],
+        "commands": [
+            {"command": "force_rest", "selector": [["notes"], ["get", [0]]]},
+            {"command": "force_rest", "selector": [["notes"], ["get", [0]]]},
+            {"command": "extract_trivial"},
+        ],
+    }
+    voice, _ = rmakers.recipes.make_voice(dictionary)
+    leaves = abjad.select.leaves(voice)
+    assert [type(_).__name__ for _ in leaves] == ["Rest", "Rest", "Note", "Note"]
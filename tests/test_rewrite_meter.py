@@ -0,0 +1,137 @@
+import abjad
+import pytest
+
+import rmakers
+
+
+def _make_voice(pairs, counts, *, extra_counts=(), merge=False, trivial=False):
+    time_signatures = rmakers.time_signatures(pairs)
+    durations = [abjad.Duration(_) for _ in time_signatures]
+    if merge is True:
+        durations = [sum(durations[i : i + 2]) for i in range(0, len(durations), 2)]
+    tuplets = rmakers.talea(durations, counts, 16, extra_counts=extra_counts)
+    voice = rmakers.wrap_in_time_signature_staff(tuplets, time_signatures)
+    if trivial is True:
+        rmakers.extract_trivial(voice)
+    return voice
+
+
+def _rewrite_meter_in_place(voice, *, boundary_depth=None):
+    staff = abjad.get.parentage(voice).parent
+    meters = []
+    for skip in staff["TimeSignatureVoice"]:
+        time_signature = abjad.get.indicator(skip, abjad.TimeSignature)
+        rtc = abjad.meter.make_best_guess_rtc(time_signature.pair)
+        meters.append(abjad.Meter(rtc))
+    durations = [abjad.Duration(_.pair) for _ in meters]
+    abjad.mutate.split(voice[:], durations=durations)
+    for meter, list_ in zip(meters, abjad.select.group_by_measure(voice[:])):
+        leaves = abjad.select.leaves(list_)
+        leaves = [_ for _ in leaves if not abjad.get.parentage(_).count(abjad.Tuplet)]
+        rmakers.unbeam(leaves)
+        meter.rewrite(list_, boundary_depth=boundary_depth, rewrite_tuplets=False)
+    for meter, list_ in zip(meters, abjad.select.group_by_measure(voice[:])):
+        leaves = abjad.select.leaves(list_, grace=False)
+        beat_offsets = meter.depthwise_offset_inventory[1]
+        beat_durations = [b - a for a, b in abjad.sequence.nwise(beat_offsets)]
+        groups = rmakers.functions._make_beamable_groups(leaves, beat_durations)
+        for group in groups:
+            if group:
+                abjad.beam(group, beam_rests=False, tag=abjad.Tag())
+
+
+@pytest.mark.parametrize(
+    "keywords",
+    [
+        {},
+        {"extra_counts": [0, 1]},
+        {"trivial": True},
+        {"merge": True},
+        {"merge": True, "trivial": True},
+    ],
+)
+@pytest.mark.parametrize("boundary_depth", [None, 1])
+def test_rewrite_meter_01(keywords, boundary_depth):
+    """
+    ``rmakers.rewrite_meter()`` matches ``abjad.Meter.rewrite()`` applied to
+    every measure of the voice in place, whether or not tuplets line up with
+    barlines.
+    """
+    pairs = [(3, 8), (4, 8), (5, 16), (2, 4), (3, 4), (7, 16)]
+    counts = [5, 3, -2, 7, 1, 4]
+    voice = _make_voice(pairs, counts, **keywords)
+    rmakers.rewrite_meter(voice, boundary_depth=boundary_depth)
+    voice_ = _make_voice(pairs, counts, **keywords)
+    _rewrite_meter_in_place(voice_, boundary_depth=boundary_depth)
+    assert abjad.lilypond(voice) == abjad.lilypond(voice_)
+
+
+@pytest.mark.parametrize(
+    "keywords",
+    [
+        {"trivial": True},
+        {"merge": True, "trivial": True},
+    ],
+)
+def test_rewrite_meter_02(keywords):
+    """
+    ``rmakers.rewrite_meter(..., workers=2)`` matches serial path.
+    """
+    pairs = [(3, 8), (4, 8), (5, 16), (2, 4), (3, 4), (7, 16)] * 4
+    counts = [5, 3, -2, 7, 1, 4]
+    voice = _make_voice(pairs, counts, **keywords)
+    abjad.attach(abjad.Dynamic("p"), abjad.select.leaf(voice, 0))
+    rmakers.rewrite_meter(voice, boundary_depth=1)
+    voice_ = _make_voice(pairs, counts, **keywords)
+    abjad.attach(abjad.Dynamic("p"), abjad.select.leaf(voice_, 0))
+    rmakers.rewrite_meter(voice_, boundary_depth=1, workers=2)
+    assert abjad.lilypond(voice) == abjad.lilypond(voice_)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_rewrite_meter_03(workers):
+    """
+    ``rmakers.rewrite_meter()`` clones repeated measures without losing the
+    pitches and indicators that tell them apart.
+    """
+    pairs = [(4, 8), (3, 8)] * 6
+    counts = [3, 3, 2, 1, 5, 2, 1]
+    voices = []
+    for _ in range(2):
+        voice = _make_voice(pairs, counts, trivial=True)
+        for i, note in enumerate(abjad.select.notes(voice)):
+            if i % 5 == 0:
+                note.written_pitch = abjad.NamedPitch(i % 12)
+            if i % 7 == 0:
+                abjad.attach(abjad.Articulation("accent"), note)
+        voices.append(voice)
+    rmakers.rewrite_meter(voices[0], boundary_depth=1, workers=workers)
+    _rewrite_meter_in_place(voices[1], boundary_depth=1)
+    assert abjad.lilypond(voices[0]) == abjad.lilypond(voices[1])
+
+
+@pytest.mark.parametrize("trivial", [False, True])
+def test_rewrite_meter_04(trivial):
+    """
+    ``rmakers.rewrite_meter(..., workers=2)`` matches serial path when
+    measures carry grace containers, chords and tags.
+    """
+    pairs = [(4, 4), (3, 8), (5, 16), (4, 4)] * 3
+    counts = [3, 5, -1, 7, 2]
+    voices = []
+    for _ in range(2):
+        voice = _make_voice(pairs, counts, extra_counts=[0, 1], trivial=trivial)
+        leaves = abjad.select.leaves(voice)
+        rmakers.before_grace_container(leaves[1:2], [1])
+        rmakers.after_grace_container(leaves[9:10], [1])
+        for i, note in enumerate(abjad.select.notes(voice)):
+            if i % 6 == 0:
+                chord = abjad.Chord("c' e'", note.written_duration)
+                abjad.mutate.replace(note, chord, wrappers=True)
+        voices.append(voice)
+    rmakers.rewrite_meter(voices[0])
+    rmakers.rewrite_meter(voices[1], workers=2)
+    assert abjad.lilypond(voices[0]) == abjad.lilypond(voices[1])
+    assert rmakers.fingerprint(voices[0], tags=True) == rmakers.fingerprint(
+        voices[1], tags=True
+    )
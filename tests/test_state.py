@@ -0,0 +1,108 @@
+import abjad
+import pytest
+
+import rmakers
+
+
+def _durations(pairs):
+    return [abjad.Duration(_) for _ in pairs]
+
+
+SEGMENTS = [
+    [(3, 8), (4, 8), (3, 8), (4, 8)],
+    [(5, 16), (2, 4), (7, 32)],
+    [(1, 4), (3, 8), (5, 16), (4, 8)],
+]
+
+
+@pytest.mark.parametrize(
+    "counts, denominator, keywords",
+    [
+        ([1, 2, 3, 4], 16, {}),
+        ([4], 16, {"extra_counts": [0, 1, 2]}),
+        ([3, -1, 2], 16, {"preamble": [1, 1], "extra_counts": [1]}),
+        ([5, 7, -2], 32, {"end_counts": [1, 1], "advance": 3}),
+        (
+            [6, 5, -3],
+            16,
+            {
+                "spelling": rmakers.Spelling(
+                    forbidden_note_duration=abjad.Duration(1, 4)
+                )
+            },
+        ),
+        ([7, -5], 16, {"spelling": rmakers.Spelling(increase_monotonic=True)}),
+    ],
+)
+def test_state_01(counts, denominator, keywords):
+    """
+    ``rmakers.talea_state_at()`` matches state of chained ``rmakers.talea()``
+    calls.
+    """
+    previous_state, seek_state = {}, {}
+    for pairs in SEGMENTS:
+        durations = _durations(pairs)
+        state = {}
+        rmakers.talea(
+            durations,
+            counts,
+            denominator,
+            previous_state=previous_state,
+            state=state,
+            **keywords,
+        )
+        seek_state = rmakers.talea_state_at(
+            durations,
+            counts,
+            denominator,
+            previous_state=seek_state,
+            **keywords,
+        )
+        assert seek_state == state
+        previous_state = state
+
+
+def test_state_02():
+    """
+    ``rmakers.even_division_state_at()`` matches state of chained
+    ``rmakers.even_division()`` calls.
+    """
+    previous_state, seek_state = {}, {}
+    for pairs in SEGMENTS:
+        durations = _durations(pairs)
+        state = {}
+        rmakers.even_division(
+            durations,
+            [8, 16],
+            extra_counts=[0, 1, -1],
+            previous_state=previous_state,
+            state=state,
+        )
+        seek_state = rmakers.even_division_state_at(
+            durations, [8, 16], extra_counts=[0, 1, -1], previous_state=seek_state
+        )
+        assert seek_state == state
+        previous_state = state
+
+
+def test_state_03():
+    """
+    ``rmakers.accelerando_state_at()`` matches state of chained
+    ``rmakers.accelerando()`` calls.
+    """
+    interpolations = ([(1, 8), (1, 20), (1, 16)], [(1, 20), (1, 8), (1, 16)])
+    previous_state, seek_state = {}, {}
+    for pairs in SEGMENTS:
+        durations = _durations(pairs)
+        state = {}
+        rmakers.accelerando(
+            durations,
+            *interpolations,
+            previous_state=previous_state,
+            state=state,
+        )
+        seek_state = rmakers.accelerando_state_at(
+            durations, *interpolations, previous_state=seek_state
+        )
+        assert seek_state == state
+        previous_state = state
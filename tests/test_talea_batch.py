@@ -0,0 +1,61 @@
+import abjad
+import pytest
+
+import rmakers
+
+
+@pytest.mark.parametrize(
+    "counts, denominator, keywords, voices",
+    [
+        (
+            [1, 2, 3, 4],
+            16,
+            {},
+            [{}, {"advance": 3}, {"extra_counts": [0, 1]}],
+        ),
+        (
+            [3, -1, 2],
+            16,
+            {"preamble": [1, 1], "extra_counts": [1]},
+            [
+                {},
+                {"extra_counts": [2, 0]},
+                {"previous_state": {"talea_weight_consumed": 5}},
+            ],
+        ),
+        (
+            [5, 7, -2],
+            32,
+            {"end_counts": [1, 1]},
+            [{"advance": 2}, {"read_talea_once_only": False}],
+        ),
+    ],
+)
+def test_talea_batch_01(counts, denominator, keywords, voices):
+    """
+    ``rmakers.talea_batch()`` matches one ``rmakers.talea()`` call per voice.
+    """
+    pairs = [(3, 8), (5, 16), (2, 4), (7, 32)]
+    durations = [abjad.Duration(_) for _ in pairs]
+    results = rmakers.talea_batch(
+        durations, counts, denominator, voices=voices, **keywords
+    )
+    assert len(results) == len(voices)
+    for voice, (tuplets, state) in zip(voices, results):
+        state_ = {}
+        tuplets_ = rmakers.talea(
+            durations, counts, denominator, state=state_, **(keywords | voice)
+        )
+        string = abjad.lilypond(abjad.Container(tuplets), tags=True)
+        assert string == abjad.lilypond(abjad.Container(tuplets_), tags=True)
+        assert state == state_
+
+
+def test_talea_batch_02():
+    """
+    ``rmakers.talea_batch()`` raises an exception on unknown voice keywords.
+    """
+    durations = [abjad.Duration(3, 8)]
+    with pytest.raises(Exception) as e:
+        rmakers.talea_batch(durations, [1], 16, voices=[{"preamble": [1]}])
+    assert "unknown voice keyword" in str(e)
@@ -0,0 +1,55 @@
+import abjad
+import pytest
+
+import rmakers
+
+durations = [abjad.Duration(_) for _ in [(3, 8), (4, 8), (5, 16)]]
+
+
+@pytest.mark.parametrize(
+    "maker, arguments, keywords, stages",
+    [
+        (
+            rmakers.accelerando,
+            ([(1, 8), (1, 20), (1, 16)],),
+            {},
+            ["make_tuplets", "make_state"],
+        ),
+        (
+            rmakers.even_division,
+            ([8],),
+            {"extra_counts": [0, 1]},
+            ["make_tuplets", "make_state"],
+        ),
+        (
+            rmakers.incised,
+            (),
+            {"prefix_talea": [-1], "prefix_counts": [1], "talea_denominator": 16},
+            ["scale_input", "make_duration_lists", "make_leaves", "make_tuplets"],
+        ),
+        (rmakers.multiplied_duration, (), {}, ["make_leaves"]),
+        (rmakers.note, (), {}, ["make_leaves"]),
+        (
+            rmakers.talea,
+            ([1, 2, 3], 16),
+            {},
+            [
+                "scale_input",
+                "make_numerator_lists",
+                "make_leaves",
+                "apply_ties",
+                "normalize_multipliers",
+            ],
+        ),
+        (rmakers.tuplet, ([(1, 2)],), {}, ["make_tuplets"]),
+    ],
+)
+def test_trace_01(maker, arguments, keywords, stages):
+    """
+    Makers trace their stages inside their own call span.
+    """
+    with rmakers.trace() as trace:
+        maker(durations, *arguments, **keywords)
+    names = [_["name"] for _ in trace.events]
+    assert names == stages + [f"rmakers.{maker.__name__}()"]
+    assert all(trace.events[-1]["ts"] <= _["ts"] for _ in trace.events)
@@ -0,0 +1,70 @@
+import abjad
+import pytest
+
+import rmakers
+
+
+def _make_tuplets():
+    durations = [abjad.Duration(_) for _ in [(3, 8), (2, 4), (5, 16)] * 4]
+    tuplets = rmakers.talea(durations, [1, 2, 3, -3, 2], 16, extra_counts=[0, 1, 2])
+    container = abjad.Container(tuplets)
+    abjad.mutate.wrap(container[1], abjad.Tuplet("3:2", []))
+    container[2].denominator = 4
+    return container
+
+
+def _force_augmentation(tuplet):
+    if not tuplet.augmentation():
+        tuplet.toggle_prolation()
+
+
+def _force_diminution(tuplet):
+    if not tuplet.diminution():
+        tuplet.toggle_prolation()
+
+
+def _reduce_multiplier(tuplet):
+    fraction = abjad.Fraction(*tuplet.multiplier)
+    tuplet.multiplier = fraction.numerator, fraction.denominator
+
+
+@pytest.mark.parametrize(
+    "command, function",
+    [
+        (rmakers.force_augmentation, _force_augmentation),
+        (rmakers.force_diminution, _force_diminution),
+        (rmakers.reduce_multiplier, _reduce_multiplier),
+        (rmakers.rewrite_dots, abjad.Tuplet.rewrite_dots),
+        (rmakers.trivialize, abjad.Tuplet.trivialize),
+    ],
+)
+def test_tuplets_01(command, function):
+    """
+    Tuplet commands match per-tuplet abjad calls when tuplets repeat.
+    """
+    container = _make_tuplets()
+    command(container)
+    container_ = _make_tuplets()
+    for tuplet in abjad.select.tuplets(container_):
+        function(tuplet)
+    assert abjad.lilypond(container) == abjad.lilypond(container_)
+
+
+def test_tuplets_02():
+    """
+    Denominator command does not reuse result for nested tuplet of same shape
+    as top-level tuplet: nested tuplet has different prolated duration.
+    """
+
+    def make_container():
+        tuplet = abjad.Tuplet("2:3", "c'8 c'8 c'8")
+        tuplet_ = abjad.Tuplet("2:3", "c'8 c'8 c'8")
+        return abjad.Container([tuplet, abjad.Tuplet("4:5", [tuplet_, "c'4"])])
+
+    container = make_container()
+    rmakers.denominator(container, (1, 16))
+    container_ = make_container()
+    for tuplet in abjad.select.tuplets(container_):
+        duration = abjad.get.duration(tuplet)
+        tuplet.denominator = abjad.duration.with_denominator(duration, 16)[0]
+    assert abjad.lilypond(container) == abjad.lilypond(container_)